@@ -1,7 +1,15 @@
-# read version from installed package
-from importlib.metadata import version
-
-__version__ = version("cryptodatapy")
-
-
-from cryptodatapy import extract, transform, util, datasets
+# read version from installed package
+from importlib.metadata import version
+
+from cryptodatapy.util.lazy import attach
+
+__version__ = version("cryptodatapy")
+
+
+# subpackages are imported on first access, as vendor libraries are slow to import
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "extract": ".extract",
+    "transform": ".transform",
+    "util": ".util",
+    "datasets": ".datasets",
+})
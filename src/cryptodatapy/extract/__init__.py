@@ -1,2 +1,14 @@
-from cryptodatapy.extract.datarequest import DataRequest
-from cryptodatapy.extract.getdata import GetData
+from cryptodatapy.util.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "DataRequest": ".datarequest",
+    "GetData": ".getdata",
+    "SeriesResult": ".getdata",
+    # submodules and subpackages
+    "data_vendors": ".data_vendors",
+    "exchanges": ".exchanges",
+    "libraries": ".libraries",
+    "web": ".web",
+    "datarequest": ".datarequest",
+    "getdata": ".getdata",
+})
@@ -1,5 +1,16 @@
-from cryptodatapy.extract.data_vendors.coinmetrics_api import CoinMetrics
-from cryptodatapy.extract.data_vendors.cryptocompare_api import CryptoCompare
-from cryptodatapy.extract.data_vendors.datavendor import DataVendor
-from cryptodatapy.extract.data_vendors.glassnode_api import Glassnode
-from cryptodatapy.extract.data_vendors.tiingo_api import Tiingo
+from cryptodatapy.util.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "CoinMetrics": ".coinmetrics_api",
+    "CryptoCompare": ".cryptocompare_api",
+    "DataVendor": ".datavendor",
+    "Glassnode": ".glassnode_api",
+    "Tiingo": ".tiingo_api",
+    # submodules and subpackages
+    "coinmetrics_api": ".coinmetrics_api",
+    "cryptocompare_api": ".cryptocompare_api",
+    "datavendor": ".datavendor",
+    "glassnode_api": ".glassnode_api",
+    "polygon_api": ".polygon_api",
+    "tiingo_api": ".tiingo_api",
+})
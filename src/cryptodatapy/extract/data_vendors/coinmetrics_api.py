@@ -9,6 +9,7 @@ from cryptodatapy.extract.data_vendors.datavendor import DataVendor
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData, WrangleInfo
+from cryptodatapy.util.cache import cached
 from cryptodatapy.util.datacredentials import DataCredentials
 
 # CoinMetrics community API client (deprecated - use instance client instead):
@@ -91,6 +92,12 @@ class CoinMetrics(DataVendor):
         self.data_resp = None
         self.data = pd.DataFrame()
 
+    def new_clients(self) -> None:
+        """
+        Replaces the client with a new one, e.g. for a copy of this object used by another thread.
+        """
+        self.client = CoinMetricsClient(api_key=self.api_key) if self.api_key else CoinMetricsClient()
+
     def req_meta(self, data_type: str) -> Dict[str, Any]:
         """
         Request metadata.
@@ -397,6 +404,29 @@ class CoinMetrics(DataVendor):
         sdk_params = {k: v for k, v in params.items()
                       if k not in ['pretty', 'ignore_forbidden_errors', 'ignore_unsupported_errors']}
 
+        # serve from response cache, if enabled
+        return cached(
+            'coinmetrics', method_name, sdk_params,
+            lambda: self._req_sdk(method_name, sdk_params),
+            end_date=data_req.end_date, freq=data_req.freq, cacheable=lambda df: not df.empty
+        )
+
+    def _req_sdk(self, method_name: str, sdk_params: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Calls Python client SDK method and collects all pages.
+
+        Parameters
+        ----------
+        method_name: str
+            Name of SDK method, e.g. 'get_asset_metrics'.
+        sdk_params: dict
+            Dictionary containing parameter values for SDK method call.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with datetime, ticker/identifier, and field/col values.
+        """
         # Call the SDK method with params (SDK handles authentication internally)
         try:
             sdk_method = getattr(self.client, method_name)
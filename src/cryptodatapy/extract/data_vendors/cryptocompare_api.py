@@ -1,6 +1,5 @@
 import logging
-from time import sleep
-from typing import Dict, Optional, Union, Any, List
+from typing import Dict, Optional, Union, Any, List, Iterator
 
 import pandas as pd
 
@@ -9,6 +8,7 @@ from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData, WrangleInfo
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.ratelimit import get_rate_limiter
 
 # data credentials
 data_cred = DataCredentials()
@@ -90,6 +90,7 @@ class CryptoCompare(DataVendor):
             raise TypeError("Set your CryptoCompare api key in environment variables as 'CRYPTOCOMPARE_API_KEY' or "
                             "add it as an argument when instantiating the class. To get an api key, visit: "
                             "https://min-api.cryptocompare.com/")
+        self.rate_limiter = get_rate_limiter(f"cryptocompare:{self.api_key}", rate_limit=rate_limit)
         self.onchain_fields = None
         self.social_fields = None
         self.data_req = None
@@ -287,7 +288,7 @@ class CryptoCompare(DataVendor):
         """
         self.data_resp = DataRequest().get_req(url=self.base_url.replace('data', 'stats') +
                                                self.api_endpoints['rate_limit_info'],
-                                               params={'api_key': self.api_key})
+                                               params={'api_key': self.api_key}, use_cache=False)
         return self.data_resp
 
     def get_rate_limit_info(self) -> pd.DataFrame:
@@ -466,14 +467,17 @@ class CryptoCompare(DataVendor):
         url, params = self.set_urls_params(data_req, data_type, ticker)
 
         # data req
-        self.data_req = data_req.get_req(url=url, params=params)
+        self.data_req = data_req.get_req(url=url, params=params, rate_limiter=self.rate_limiter,
+                                         vendor='cryptocompare')
 
         return self.data_req
 
-    def get_all_data_hist(self, data_req: DataRequest, data_type: str, ticker: str) -> pd.DataFrame:
+    def iter_data_hist(self, data_req: DataRequest, data_type: str, ticker: str) -> Iterator[pd.DataFrame]:
         """
-        Submits get requests to API until entire data history has been collected. Only necessary when
-        number of observations is larger than the maximum number of observations per call.
+        Submits get requests to API, paging backwards in time, and yields each page as it arrives.
+
+        Only one page is held in memory at a time, so pages can be written to storage as they are received or
+        collected once at the end.
 
         Parameters
         ----------
@@ -484,11 +488,10 @@ class CryptoCompare(DataVendor):
         ticker: str
             Ticker symbol.
 
-        Returns
-        -------
+        Yields
+        ------
         df: pd.DataFrame
-            Dataframe with entire data history retrieved.
-
+            Dataframe with a page of data history, from most recent to oldest page.
         """
         # convert data req params
         self.data_req = ConvertParams(data_req).to_cryptocompare()
@@ -496,36 +499,57 @@ class CryptoCompare(DataVendor):
         # set params
         url, params = self.set_urls_params(data_req, data_type, ticker)
 
-        # create empty df
-        df = pd.DataFrame()
-        # while loop condition
-        missing_vals = True
-
-        # run a while loop until all data collected
-        while missing_vals:
+        # request pages until all data collected
+        while True:
 
             # data req
-            self.data_resp = DataRequest().get_req(url=url, params=params)
-
-            # add data resp to df
-            if self.data_resp:
-                if data_type == 'indexes' or data_type == 'social':
-                    df1 = pd.DataFrame(self.data_resp['Data'])
-                else:
-                    df1 = pd.DataFrame(self.data_resp['Data']['Data'])
-                df = pd.concat([df, df1])  # add data to empty df
-
-                # check if all data has been extracted
-                if len(df1) < (self.max_obs_per_call - 1) or df1.time[0] <= self.data_req.source_start_date or \
-                        all(df1.drop(columns=['time']).iloc[0] == 0) or \
-                        all(df1.drop(columns=['time']).iloc[0].astype(str) == 'nan'):
-                    missing_vals = False
-                # reset end date and pause before calling API again
-                else:
-                    params['toTs'] = df1.time[0]
-                    sleep(self.data_req.pause)
+            self.data_resp = data_req.get_req(url=url, params=params, rate_limiter=self.rate_limiter,
+                                              vendor='cryptocompare')
 
-        return df
+            # stop if request failed
+            if not self.data_resp:
+                logging.warning(f"Failed to get {data_type} data for {ticker} before {params.get('toTs')}.")
+                break
+
+            # page of data
+            if data_type == 'indexes' or data_type == 'social':
+                df = pd.DataFrame(self.data_resp['Data'])
+            else:
+                df = pd.DataFrame(self.data_resp['Data']['Data'])
+            yield df
+
+            # check if all data has been extracted
+            if len(df) < (self.max_obs_per_call - 1) or df.time[0] <= self.data_req.source_start_date or \
+                    all(df.drop(columns=['time']).iloc[0] == 0) or \
+                    all(df.drop(columns=['time']).iloc[0].astype(str) == 'nan'):
+                break
+            # reset end date before calling API again, the rate limiter paces requests
+            params['toTs'] = df.time[0]
+
+    def get_all_data_hist(self, data_req: DataRequest, data_type: str, ticker: str) -> pd.DataFrame:
+        """
+        Submits get requests to API until entire data history has been collected. Only necessary when
+        number of observations is larger than the maximum number of observations per call.
+
+        Parameters
+        ----------
+        data_req: DataRequest
+            Parameters of data request in CryptoDataPy format.
+        data_type: str, {'indexes', 'ohlcv', 'on-chain', 'social'}
+            Data type to retrieve.
+        ticker: str
+            Ticker symbol.
+
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with entire data history retrieved.
+
+        """
+        # collect pages, concatenated once
+        pages = list(self.iter_data_hist(data_req, data_type, ticker))
+
+        return pd.concat(pages) if pages else pd.DataFrame()
 
     @staticmethod
     def wrangle_data_resp(data_req: DataRequest, data_resp: pd.DataFrame) -> pd.DataFrame:
@@ -1,4 +1,4 @@
-from typing import Optional, Any, Union, Dict
+from typing import Optional, Any, Union, Dict, List
 
 import pandas as pd
 
@@ -6,7 +6,9 @@ from cryptodatapy.extract.data_vendors.datavendor import DataVendor
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData, WrangleInfo
+from cryptodatapy.util.concurrency import thread_map
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.ratelimit import get_rate_limiter
 
 
 # data credentials
@@ -92,6 +94,7 @@ class Glassnode(DataVendor):
             raise TypeError("Set your Glassnode api key in environment variables as 'GLASSNODE_API_KEY' or "
                             "add it as an argument when instantiating the class. To get an api key, visit: "
                             "https://docs.glassnode.com/basic-api/api-key")
+        self.rate_limiter = get_rate_limiter(f"glassnode:{self.api_key}", rate_limit=rate_limit)
         if assets is None:
             self.assets = self.get_assets_info(as_list=True)
         if fields is None:
@@ -193,7 +196,13 @@ class Glassnode(DataVendor):
         """
         return None
 
-    def req_data(self, data_req: DataRequest, ticker: str, field: str) -> Dict[str, Any]:
+    def req_data(
+            self,
+            data_req: DataRequest,
+            ticker: str,
+            field: str,
+            gn_data_req: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Submits data request to API.
 
@@ -205,14 +214,17 @@ class Glassnode(DataVendor):
             Requested ticker symbol.
         field: str
             Requested field.
+        gn_data_req: dict, optional, default None
+            Data request parameters already converted to Glassnode format. If not provided, data_req is converted.
 
         Returns
         -------
         data_resp: dict
             Data response in json format.
         """
-        # convert data request parameters to CryptoCompare format
-        gn_data_req = ConvertParams(data_req).to_glassnode()
+        # convert data request parameters to Glassnode format
+        if gn_data_req is None:
+            gn_data_req = ConvertParams(data_req).to_glassnode()
 
         # set url, params
         url = self.base_url + field
@@ -225,7 +237,7 @@ class Glassnode(DataVendor):
             'c': gn_data_req['quote_ccy']
         }
         # data req
-        data_resp = DataRequest().get_req(url=url, params=params)
+        data_resp = data_req.get_req(url=url, params=params, rate_limiter=self.rate_limiter, vendor='glassnode')
 
         return data_resp
 
@@ -256,7 +268,13 @@ class Glassnode(DataVendor):
 
         return df
 
-    def get_tidy_data(self, data_req: DataRequest, ticker: str, field: str) -> pd.DataFrame:
+    def get_tidy_data(
+            self,
+            data_req: DataRequest,
+            ticker: str,
+            field: str,
+            gn_data_req: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
         """
         Submits data request and wrangles the data response into tidy data format.
 
@@ -268,6 +286,8 @@ class Glassnode(DataVendor):
             Requested ticker symbol.
         field: str
             Requested field.
+        gn_data_req: dict, optional, default None
+            Data request parameters already converted to Glassnode format. If not provided, data_req is converted.
 
         Returns
         -------
@@ -275,50 +295,90 @@ class Glassnode(DataVendor):
             Dataframe with DatetimeIndex and field values (col) wrangled into tidy data format.
         """
         # get entire data history
-        df = self.req_data(data_req, ticker=ticker, field=field)
+        df = self.req_data(data_req, ticker=ticker, field=field, gn_data_req=gn_data_req)
         # wrangle df
         df = self.wrangle_data_resp(data_req, df, field)
 
         return df
 
-    def get_all_fields(self, data_req: DataRequest, ticker: str) -> pd.DataFrame:
+    def get_all_tickers_fields(
+            self,
+            data_req: DataRequest,
+            tickers: Optional[List[str]] = None,
+            gn_data_req: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
         """
-        Loops list of tickers, retrieves data in tidy format for each ticker and stores it in a dataframe.
+        Requests the ticker x field matrix concurrently and merges the tidy responses into a dataframe.
+
+        Each response is wrangled as soon as it arrives, and requests are paced by the Glassnode rate limiter. The
+        number of threads is max_workers of the data request, or if None, enough threads to use the rate limit.
 
         Parameters
         ----------
         data_req: DataRequest
             Data request parameters in CryptoDataPy format.
-        ticker: str
-            Requested ticker symbol.
+        tickers: list, optional, default None
+            Ticker symbols to request. If not provided, all tickers in the data request are requested.
+        gn_data_req: dict, optional, default None
+            Data request parameters already converted to Glassnode format. If not provided, data_req is converted.
 
         Returns
         -------
-        df: pd.DataFrame
-            Dataframe with DatetimeIndex and values for fields (cols), in tidy data format.
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and values for fields (cols), in tidy data
+            format.
         """
-        # convert data request parameters to CryptoCompare format
-        gn_data_req = ConvertParams(data_req).to_glassnode()
+        # convert data request parameters to Glassnode format
+        if gn_data_req is None:
+            gn_data_req = ConvertParams(data_req).to_glassnode()
+        if tickers is None:
+            tickers = gn_data_req['tickers']
+
+        # request matrix, fields sharing an endpoint (e.g. OHLC) are requested once per ticker
+        fields = list(dict.fromkeys(gn_data_req['fields']))
+        reqs = [(ticker, field) for ticker in tickers for field in fields]
+
+        def get_field(req):
+            ticker, field = req
+            df0 = self.get_tidy_data(data_req, ticker, field, gn_data_req=gn_data_req)
+            # add ticker to index
+            if df0 is not None:
+                df0['ticker'] = ticker.upper()
+                df0 = df0.set_index(['ticker'], append=True)
+            return df0
 
-        df = pd.DataFrame()  # empty fields df
-        counter = 0  # ohlc counter to avoid requesting OHLC data multiples times
+        max_workers = data_req.max_workers if data_req.max_workers is not None else self.rate_limiter.max_workers()
+        dfs = thread_map(get_field, reqs, max_workers)
+
+        # merge, stacking each field's tickers then joining fields
+        field_dfs = {}
+        for (ticker, field), df0 in zip(reqs, dfs):
+            if df0 is not None:
+                field_dfs.setdefault(field, []).append(df0)
+        if not field_dfs:
+            return pd.DataFrame()
 
-        for field in gn_data_req['fields']:  # loop through fields
+        return pd.concat([pd.concat(dfs0) for dfs0 in field_dfs.values()], axis=1)
 
-            df0 = None
+    def get_all_fields(self, data_req: DataRequest, ticker: str) -> pd.DataFrame:
+        """
+        Retrieves data in tidy format for each field of a ticker and stores it in a dataframe.
 
-            # get tidy data
-            if field == 'market/price_usd_ohlc' and counter == 0:
-                df0 = self.get_tidy_data(data_req, ticker, field)
-                counter += 1
-            elif field != 'market/price_usd_ohlc':
-                df0 = self.get_tidy_data(data_req, ticker, field)
+        Parameters
+        ----------
+        data_req: DataRequest
+            Data request parameters in CryptoDataPy format.
+        ticker: str
+            Requested ticker symbol.
 
-            # add field to fields df
-            if df0 is not None:
-                df = pd.concat([df, df0], axis=1)
+        Returns
+        -------
+        df: pd.DataFrame
+            Dataframe with DatetimeIndex and values for fields (cols), in tidy data format.
+        """
+        df = self.get_all_tickers_fields(data_req, tickers=[ticker])
 
-        return df
+        return df.droplevel('ticker') if not df.empty else df
 
     def check_params(self, data_req: DataRequest) -> None:
         """
@@ -382,19 +442,8 @@ class Glassnode(DataVendor):
         # check params
         self.check_params(data_req)
 
-        # empty df to add data
-        df = pd.DataFrame()
-
-        # loop through tickers and fields
-        for ticker in gn_data_req['tickers']:  # loop tickers
-
-            # get all fields for ticker
-            df0 = self.get_all_fields(data_req, ticker)
-            # add ticker to index
-            df0['ticker'] = ticker.upper()
-            df0.set_index(['ticker'], append=True, inplace=True)
-            # stack ticker dfs
-            df = pd.concat([df, df0])
+        # get ticker x field matrix
+        df = self.get_all_tickers_fields(data_req, gn_data_req=gn_data_req)
 
         # filter df for desired fields and typecast
         fields = [field for field in data_req.fields if field in df.columns]
@@ -1,5 +1,4 @@
 import logging
-from time import sleep
 from typing import Any, Dict, List, Optional
 import pandas as pd
 
@@ -10,7 +9,9 @@ from cryptodatapy.extract.data_vendors.datavendor import DataVendor
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData
+from cryptodatapy.util.concurrency import thread_map
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.ratelimit import get_rate_limiter
 
 # data credentials
 data_cred = DataCredentials()
@@ -91,6 +92,7 @@ class Polygon(DataVendor):
         self.data_req = None
         self.data = pd.DataFrame()
         self.client = RESTClient(self.api_key)
+        self.rate_limiter = get_rate_limiter(f"polygon:{self.api_key}", rate_limit=rate_limit)
 
     def get_exchanges_info(self):
         """
@@ -191,6 +193,9 @@ class Polygon(DataVendor):
         List: List of aggregated data from Polygon API.
         """
 
+        # wait for rate limiter, shared by concurrent ticker requests
+        self.rate_limiter.acquire()
+
         aggs = []
         for a in self.client.list_aggs(
                 f"C:{ticker}",
@@ -278,47 +283,33 @@ class Polygon(DataVendor):
         # convert data request parameters to CryptoCompare format
         self.data_req = ConvertParams(data_req).to_polygon()
 
-        # empty df to add data
-        df = pd.DataFrame()
-
+        # source tickers to request, with tickers to add to index
         if self.data_req.cat == 'fx':
-            for market, ticker in zip(self.data_req.source_markets, self.data_req.tickers):
-                try:
-                    df0 = self.get_tidy_data(self.data_req, market)
-                except Exception as e:
-                    logging.info(f"Failed to get fx data for {market} after many attempts: {e}.")
-                else:
-                    # add ticker to index
-                    df0['ticker'] = ticker.upper()
-                    df0.set_index(['ticker'], append=True, inplace=True)
-                    # concat df and df1
-                    df = pd.concat([df, df0])
-
-                # sleep to avoid hitting API rate limits
-                sleep(self.data_req.pause)
-
+            items = [(market, ticker.upper()) for market, ticker in zip(self.data_req.source_markets,
+                                                                         self.data_req.tickers)]
         elif self.data_req.cat == 'eqty':
-            for ticker in self.data_req.tickers:
-                try:
-                    df0 = self.get_tidy_data(self.data_req, ticker)
-                except Exception as e:
-                    logging.info(f"Failed to get eqty data for {ticker} after many attempts: {e}.")
-                else:
-                    # add ticker to index
-                    df0['ticker'] = ticker.upper()
-                    df0.set_index(['ticker'], append=True, inplace=True)
-                    # concat df and df1
-                    df = pd.concat([df, df0])
-
-                # sleep to avoid hitting API rate limits
-                sleep(self.data_req.pause)
-
+            items = [(ticker, ticker.upper()) for ticker in self.data_req.tickers]
         else:
             raise NotImplementedError(
                 f"Data category '{self.data_req.cat}' is not implemented for Polygon API. "
                 "Supported categories are: 'fx', 'eqty'."
             )
 
+        def get_ticker(item):
+            source_ticker, ticker = item
+            try:
+                df0 = self.get_tidy_data(self.data_req, source_ticker)
+            except Exception as e:
+                logging.info(f"Failed to get {self.data_req.cat} data for {source_ticker} after many attempts: {e}.")
+                return None
+            # add ticker to index
+            df0['ticker'] = ticker
+            return df0.set_index(['ticker'], append=True)
+
+        # get tickers, concurrently if max_workers is set, the rate limiter paces requests
+        dfs = [df0 for df0 in thread_map(get_ticker, items, self.data_req.max_workers) if df0 is not None]
+        df = pd.concat(dfs) if dfs else pd.DataFrame()
+
         return df.sort_index()
 
     def check_params(self, data_req: DataRequest) -> None:
@@ -7,7 +7,9 @@ from cryptodatapy.extract.data_vendors.datavendor import DataVendor
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData
+from cryptodatapy.util.concurrency import thread_map
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.ratelimit import get_rate_limiter
 
 # data credentials
 data_cred = DataCredentials()
@@ -86,6 +88,7 @@ class Tiingo(DataVendor):
                             "add it as an argument when instantiating the class. To get an api key, visit: "
                             "https://www.tiingo.com/")
 
+        self.rate_limiter = get_rate_limiter(f"tiingo:{self.api_key}", rate_limit=rate_limit)
         self.data_req = None
         self.data = pd.DataFrame()
 
@@ -449,7 +452,8 @@ class Tiingo(DataVendor):
         url, params, headers = urls_params['url'], urls_params['params'], urls_params['headers']
 
         # data req
-        data_resp = DataRequest().get_req(url=url, params=params, headers=headers)
+        data_resp = data_req.get_req(url=url, params=params, headers=headers, rate_limiter=self.rate_limiter,
+                                     vendor='tiingo')
 
         return data_resp
 
@@ -523,49 +527,30 @@ class Tiingo(DataVendor):
         # convert data request parameters to CryptoCompare format
         self.data_req = ConvertParams(data_req).to_tiingo()
 
-        # empty df to add data
-        df = pd.DataFrame()
-
+        # source tickers to request, with tickers to add to index
         if data_type == 'crypto':
-            for market, ticker in zip(self.data_req.source_markets, self.data_req.tickers):
-                try:
-                    df0 = self.get_tidy_data(self.data_req, data_type, market)
-                except Exception as e:
-                    logging.info(f"Failed to get {data_type} data for {ticker} after many attempts: {e}.")
-                else:
-                    # add ticker to index
-                    df0['ticker'] = ticker.upper()
-                    df0.set_index(['ticker'], append=True, inplace=True)
-                    # concat df and df1
-                    df = pd.concat([df, df0])
-
+            items = [(market, ticker.upper()) for market, ticker in zip(self.data_req.source_markets,
+                                                                         self.data_req.tickers)]
         elif data_type == 'fx':
-            for market, ticker in zip(self.data_req.source_markets, self.data_req.tickers):
-                try:
-                    df0 = self.get_tidy_data(self.data_req, data_type, market)
-                except Exception as e:
-                    logging.info(f"Failed to get {data_type} data for {market} after many attempts: {e}.")
-                else:
-                    # add ticker to index
-                    df0['ticker'] = market.upper()
-                    df0.set_index(['ticker'], append=True, inplace=True)
-                    # concat df and df1
-                    df = pd.concat([df, df0])
-
+            items = [(market, market.upper()) for market in self.data_req.source_markets]
         else:
-            for ticker in self.data_req.source_tickers:
-                try:
-                    df0 = self.get_tidy_data(self.data_req, data_type, ticker)
-                except Exception as e:
-                    logging.info(f"Failed to get {data_type} data for {ticker} after many attempts: {e}.")
-                else:
-                    # add ticker to index
-                    df0['ticker'] = ticker.upper()
-                    df0.set_index(['ticker'], append=True, inplace=True)
-                    # concat df and df1
-                    df = pd.concat([df, df0])
-
-        return df
+            items = [(ticker, ticker.upper()) for ticker in self.data_req.source_tickers]
+
+        def get_ticker(item):
+            source_ticker, ticker = item
+            try:
+                df0 = self.get_tidy_data(self.data_req, data_type, source_ticker)
+            except Exception as e:
+                logging.info(f"Failed to get {data_type} data for {source_ticker} after many attempts: {e}.")
+                return None
+            # add ticker to index
+            df0['ticker'] = ticker
+            return df0.set_index(['ticker'], append=True)
+
+        # get tickers, concurrently if max_workers is set, the rate limiter paces requests
+        dfs = [df0 for df0 in thread_map(get_ticker, items, self.data_req.max_workers) if df0 is not None]
+
+        return pd.concat(dfs) if dfs else pd.DataFrame()
 
     def get_eqty(self, data_req: DataRequest) -> pd.DataFrame:
         """
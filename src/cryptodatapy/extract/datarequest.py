@@ -1,12 +1,17 @@
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Union
 from time import sleep
+from urllib.parse import urlparse
 
 import pandas as pd
 import requests
 import logging
 import pytz
 
+from cryptodatapy.util.cache import cached
+from cryptodatapy.util.ratelimit import RateLimiter
+from cryptodatapy.util.session import get_session
+
 
 class DataRequest:
     """
@@ -35,7 +40,9 @@ class DataRequest:
         source_freq: Optional[str] = None,
         source_start_date: Optional[Union[str, int, datetime, pd.Timestamp]] = None,
         source_end_date: Optional[Union[str, int, datetime, pd.Timestamp]] = None,
-        source_fields: Optional[Union[str, List[str]]] = None
+        source_fields: Optional[Union[str, List[str]]] = None,
+        max_workers: Optional[int] = None,
+        shards: Optional[int] = None
     ):
         """
         Constructor
@@ -93,6 +100,14 @@ class DataRequest:
         source_fields: list or str, optional, default None
             List or string of fields for assets or time series in format used by data source. If None,
             fields will be converted from CryptoDataPy to data source format.
+        max_workers: int, optional, default None
+            Maximum number of tickers fetched concurrently, in a thread pool, by data sources which request one
+            ticker at a time. If None, tickers are fetched one at a time, except by Glassnode and dYdX which use
+            enough threads to use their rate limit.
+        shards: int, optional, default None
+            Number of time windows the history of each market is split into and fetched concurrently, by data
+            sources which page through history, e.g. for deep backfills of a single market. If None, the history
+            is fetched one page after the other.
         """
         # params
         self.source = source  # name of data source
@@ -117,6 +132,8 @@ class DataRequest:
         self.source_start_date = source_start_date  # start date used by data source
         self.source_end_date = source_end_date  # end date used by data source
         self.source_fields = source_fields  # fields used by data source
+        self.max_workers = max_workers  # max number of tickers fetched concurrently
+        self.shards = shards  # number of time windows fetched concurrently per market
 
     @property
     def source(self):
@@ -528,6 +545,48 @@ class DataRequest:
         else:
             raise TypeError("Number of seconds to pause must be an int or float.")
 
+    @property
+    def max_workers(self):
+        """
+        Returns maximum number of tickers fetched concurrently.
+        """
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers):
+        """
+        Sets maximum number of tickers fetched concurrently.
+        """
+        if max_workers is None:
+            self._max_workers = max_workers
+        elif isinstance(max_workers, int) and not isinstance(max_workers, bool):
+            if max_workers < 1:
+                raise ValueError("Max workers must be a positive integer.")
+            self._max_workers = max_workers
+        else:
+            raise TypeError("Max workers must be an integer.")
+
+    @property
+    def shards(self):
+        """
+        Returns number of time windows fetched concurrently per market.
+        """
+        return self._shards
+
+    @shards.setter
+    def shards(self, shards):
+        """
+        Sets number of time windows fetched concurrently per market.
+        """
+        if shards is None:
+            self._shards = shards
+        elif isinstance(shards, int) and not isinstance(shards, bool):
+            if shards < 1:
+                raise ValueError("Shards must be a positive integer.")
+            self._shards = shards
+        else:
+            raise TypeError("Shards must be an integer.")
+
     @property
     def source_tickers(self):
         """
@@ -730,9 +789,15 @@ class DataRequest:
         setattr(self, key, value)
 
     def get_req(self, url: str, params: Dict[str, Union[str, int]],
-                headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                headers: Optional[Dict[str, str]] = None,
+                rate_limiter: Optional[RateLimiter] = None,
+                vendor: Optional[str] = None,
+                use_cache: bool = True) -> Dict[str, Any]:
         """
-        Submits get request to API.
+        Submits get request to API through the pooled, keep-alive HTTP session.
+
+        Responses are served from the response cache when it is enabled. Responses of requests whose end date
+        bar has closed never expire, others expire after the vendor's time-to-live.
 
         Parameters
         ----------
@@ -742,6 +807,58 @@ class DataRequest:
             Dictionary containing parameter values for get request.
         headers: dict, optional, default None
             Dictionary containing headers for get request.
+        rate_limiter: RateLimiter, optional, default None
+            Rate limiter shared with other requests to the same data source. If provided, each attempt waits
+            for a token before it is sent.
+        vendor: str, optional, default None
+            Name of data vendor, used for the cache key and time-to-live. If not provided, the url host is used.
+        use_cache: bool, default True
+            Serves the response from the response cache when it is enabled. Set to False for live values, e.g. API
+            usage stats.
+
+        Returns
+        -------
+        resp: dict
+            Data response in JSON format.
+        """
+        if not use_cache:
+            return self._get_req(url, params, headers=headers, rate_limiter=rate_limiter)
+        if vendor is None:
+            vendor = urlparse(url).netloc
+
+        return cached(
+            vendor, url, params,
+            lambda: self._get_req(url, params, headers=headers, rate_limiter=rate_limiter),
+            end_date=self.end_date, freq=self.freq, cacheable=self._is_cacheable, headers=headers
+        )
+
+    @staticmethod
+    def _is_cacheable(resp: Any) -> bool:
+        """
+        Checks that a response is not an error payload returned with a successful status code.
+        """
+        if isinstance(resp, dict):
+            return resp.get('Response') != 'Error' and not resp.get('error')
+
+        return True
+
+    def _get_req(self, url: str, params: Dict[str, Union[str, int]],
+                 headers: Optional[Dict[str, str]] = None,
+                 rate_limiter: Optional[RateLimiter] = None) -> Optional[Dict[str, Any]]:
+        """
+        Submits get request to API, retrying failed attempts.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url for get request. Base urls are stored in DataCredentials.
+        params: dict
+            Dictionary containing parameter values for get request.
+        headers: dict, optional, default None
+            Dictionary containing headers for get request.
+        rate_limiter: RateLimiter, optional, default None
+            Rate limiter shared with other requests to the same data source. If provided, each attempt waits
+            for a token before it is sent.
 
         Returns
         -------
@@ -754,9 +871,13 @@ class DataRequest:
         # run a while loop in case the attempt fails
         while attempts < self.trials:
 
+            # wait for rate limit
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+
             # get request
             try:
-                resp = requests.get(url, params=params, headers=headers)
+                resp = get_session().get(url, params=params, headers=headers)
                 # check for status code
                 resp.raise_for_status()
 
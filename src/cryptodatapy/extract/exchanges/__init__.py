@@ -1,2 +1,9 @@
-from cryptodatapy.extract.exchanges.exchange import Exchange
-from cryptodatapy.extract.exchanges.dydx import Dydx
+from cryptodatapy.util.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "Exchange": ".exchange",
+    "Dydx": ".dydx",
+    # submodules and subpackages
+    "dydx": ".dydx",
+    "exchange": ".exchange",
+})
@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Dict, List, Optional, Union
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import time
 
@@ -11,6 +12,20 @@ from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.exchanges.exchange import Exchange
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData
+from cryptodatapy.util.concurrency import thread_map
+from cryptodatapy.util.ratelimit import get_rate_limiter
+from cryptodatapy.util.session import get_session
+
+# bar length of dYdX candle resolutions
+resolutions = {
+    "1MIN": pd.Timedelta(minutes=1),
+    "5MINS": pd.Timedelta(minutes=5),
+    "15MINS": pd.Timedelta(minutes=15),
+    "30MINS": pd.Timedelta(minutes=30),
+    "1HOUR": pd.Timedelta(hours=1),
+    "4HOURS": pd.Timedelta(hours=4),
+    "1DAY": pd.Timedelta(days=1),
+}
 
 
 class Dydx(Exchange):
@@ -91,6 +106,10 @@ class Dydx(Exchange):
             max_obs_per_call=max_obs_per_call,
             rate_limit=rate_limit
         )
+        # sustained rate from the strictest limit, bursts of up to the requests allowed per second
+        rate_limit_info = rate_limit if rate_limit is not None else self.get_rate_limit_info()
+        capacity = rate_limit_info.get('requests_per_second') if isinstance(rate_limit_info, dict) else None
+        self.rate_limiter = get_rate_limiter("dydx", rate_limit=rate_limit_info, capacity=capacity)
         self.data_req = None
         self.data = pd.DataFrame()
 
@@ -104,7 +123,7 @@ class Dydx(Exchange):
             DataFrame with asset information.
         """
         url = f"{self.base_url}/perpetualMarkets"
-        response = requests.get(url)
+        response = get_session().get(url)
         response.raise_for_status()
         
         markets_data = response.json()['markets']
@@ -143,7 +162,7 @@ class Dydx(Exchange):
             DataFrame with market information or list of ticker symbols.
         """
         url = f"{self.base_url}/perpetualMarkets"
-        response = requests.get(url)
+        response = get_session().get(url)
         response.raise_for_status()
         
         markets_data = response.json()['markets']
@@ -257,256 +276,263 @@ class Dydx(Exchange):
             'base_url': self.base_url
         }
 
-    def _fetch_ohlcv(self) -> pd.DataFrame:
+    def _get_date_range(self) -> Tuple[pd.Timestamp, pd.Timestamp]:
         """
-        Fetches OHLCV data from dYdX for multiple markets with pagination support.
-        
-        The dYdX candles API has a limit (typically 1000 records) and returns data in 
-        reverse chronological order (newest first). For large date ranges, we need to 
-        implement pagination to retrieve all historical data.
+        Gets the start and end dates of the data request, in UTC.
 
         Returns
         -------
-        pd.DataFrame
-            DataFrame with OHLCV data for all requested markets.
+        start_dt, end_dt: tuple
+            Start and end dates.
         """
-        if not self.data_req:
-            raise ValueError("Data request not set")
+        # source dates are guaranteed to be set by parameter conversion
+        start_dt = pd.to_datetime(self.data_req.source_start_date)
+        if start_dt.tz is None:
+            start_dt = start_dt.tz_localize('UTC')
+        end_dt = pd.to_datetime(self.data_req.source_end_date)
+        if end_dt.tz is None:
+            end_dt = end_dt.tz_localize('UTC')
 
-        # Parse date range
-        try:
-            # source dates are guaranteed to be set by parameter conversion
-            start_dt = pd.to_datetime(self.data_req.source_start_date)
-            if start_dt.tz is None:
-                start_dt = start_dt.tz_localize('UTC')
-            
-            end_dt = pd.to_datetime(self.data_req.source_end_date)
-            if end_dt.tz is None:
-                end_dt = end_dt.tz_localize('UTC')
-            
-            # Add buffer to end date to ensure we get data up to the requested time
-            buffered_end_dt = end_dt + pd.Timedelta(hours=1)
-            
-        except Exception as e:
-            logging.error(f"Could not parse date range: {e}")
-            return pd.DataFrame()
+        return start_dt, end_dt
 
-        all_records = []
-        
-        for ticker in self.data_req.source_tickers:
-            market_symbol = f"{ticker}-USD"
-            
-            # Initialize pagination variables
-            current_end_date = buffered_end_dt
-            ticker_records = []
-            page_count = 0
-            max_pages = 100  # Safety limit for longer date ranges
-            
-            while page_count < max_pages:
-                page_count += 1
-                url = f"{self.base_url}/candles/perpetualMarkets/{market_symbol}"
-                
-                params = {
-                    'resolution': self.data_req.source_freq,
-                    'fromISO': self.data_req.source_start_date,
-                    'toISO': current_end_date.isoformat(),
-                    'limit': 1000  # Maximum allowed by dYdX API
-                }
-                
-                try:
-                    response = requests.get(url, params=params, timeout=30)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    # Validate API response
-                    if 'candles' not in data or not data['candles']:
-                        break
-                    
-                    page_records = data['candles']
-                    
-                    # Convert timestamps efficiently
-                    page_df = pd.DataFrame(page_records)
-                    page_df['startedAt'] = pd.to_datetime(page_df['startedAt'])
-                    
-                    # Ensure timezone consistency
-                    if page_df['startedAt'].dt.tz is None:
-                        page_df['startedAt'] = page_df['startedAt'].dt.tz_localize('UTC')
-                    
-                    # Early termination check - if oldest record is before start date
-                    oldest_timestamp = page_df['startedAt'].min()
-                    if oldest_timestamp < start_dt:
-                        # Filter only records within date range before adding
-                        mask = (page_df['startedAt'] >= start_dt) & (page_df['startedAt'] <= end_dt)
-                        filtered_records = page_df[mask]
-                        
-                        if not filtered_records.empty:
-                            ticker_records.extend(filtered_records.to_dict('records'))
-                        
-                        break
-                    else:
-                        # All records on this page are within or after the date range
-                        mask = page_df['startedAt'] <= end_dt
-                        filtered_records = page_df[mask]
-                        
-                        if not filtered_records.empty:
-                            ticker_records.extend(filtered_records.to_dict('records'))
-                    
-                    # Check if we got fewer records than requested (end of data)
-                    if len(page_records) < 1000:
-                        break
-                    
-                    # Set next pagination point (oldest timestamp from current page minus 1 second)
-                    current_end_date = oldest_timestamp - pd.Timedelta(seconds=1)
-                    
-                    # Rate limiting
-                    time.sleep(1.0)
-                    
-                except requests.exceptions.Timeout:
-                    logging.warning(f"Timeout fetching OHLCV data for {market_symbol} on page {page_count}, retrying...")
-                    time.sleep(2.0)
-                    continue
-                except requests.exceptions.RequestException as e:
-                    logging.error(f"Failed to fetch OHLCV data for {market_symbol} on page {page_count}: {str(e)}")
-                    break
-                except Exception as e:
-                    logging.error(f"Error processing OHLCV data for {market_symbol} on page {page_count}: {str(e)}")
+    @staticmethod
+    def _get_windows(
+            start_dt: pd.Timestamp,
+            end_dt: pd.Timestamp,
+            bar: pd.Timedelta,
+            limit: int
+    ) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Splits a date range into consecutive, non-overlapping windows of at most limit bars.
+
+        Parameters
+        ----------
+        start_dt: pd.Timestamp
+            Start date.
+        end_dt: pd.Timestamp
+            End date, included.
+        bar: pd.Timedelta
+            Bar length.
+        limit: int
+            Maximum number of bars per window, e.g. maximum number of records per request.
+
+        Returns
+        -------
+        windows: list
+            List of (start, end) tuples, both included.
+        """
+        span = bar * limit
+        windows = []
+        window_start = start_dt
+        while window_start <= end_dt:
+            windows.append((window_start, min(window_start + span - pd.Timedelta(microseconds=1), end_dt)))
+            window_start += span
+
+        return windows
+
+    def _fetch_window(
+            self,
+            market: str,
+            endpoint: str,
+            key: str,
+            time_col: str,
+            make_params: Callable[[pd.Timestamp, pd.Timestamp], Dict[str, Any]],
+            window: Tuple[pd.Timestamp, pd.Timestamp],
+            trials: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches the records of a market in a time window, paging backwards from the end of the window if it holds
+        more records than a request returns.
+
+        Parameters
+        ----------
+        market: str
+            Market symbol, e.g. 'BTC-USD'.
+        endpoint: str
+            API endpoint, e.g. 'candles/perpetualMarkets'.
+        key: str
+            Key of the records in the response, e.g. 'candles'.
+        time_col: str
+            Timestamp key of the records, e.g. 'startedAt'.
+        make_params: callable
+            Makes the request params from the window start and the end of the page.
+        window: tuple
+            Window start and end, both included.
+        trials: int, default 3
+            Number of attempts for requests which time out.
+
+        Returns
+        -------
+        records: list
+            Records in the window, newest first.
+        """
+        window_start, window_end = window
+        url = f"{self.base_url}/{endpoint}/{market}"
+        records = []
+        page_end = window_end
+        attempts = 0
+
+        while True:
+            try:
+                self.rate_limiter.acquire()
+                response = get_session().get(url, params=make_params(window_start, page_end), timeout=30)
+                response.raise_for_status()
+                page = response.json().get(key)
+            except requests.exceptions.Timeout:
+                attempts += 1
+                if attempts >= trials:
+                    logging.error(f"Timeout fetching {key} for {market} after {trials} attempts.")
                     break
-            
-            if ticker_records:
-                all_records.extend(ticker_records)
+                logging.warning(f"Timeout fetching {key} for {market}, retrying...")
+                time.sleep(2.0)
+                continue
+            except requests.exceptions.RequestException as e:
+                logging.error(f"Failed to fetch {key} for {market}: {str(e)}")
+                break
 
-        if not all_records:
-            return pd.DataFrame()
+            if not page:
+                break
 
-        # Create final DataFrame
-        final_df = pd.DataFrame(all_records)
-        final_df = final_df.sort_values(['ticker', 'startedAt']).reset_index(drop=True)
-        
-        return final_df
+            # keep records in the window
+            times = pd.to_datetime([record[time_col] for record in page], utc=True)
+            records.extend(record for record, t in zip(page, times) if window_start <= t <= window_end)
 
-    def _fetch_funding_rates(self) -> pd.DataFrame:
+            # end of data, or window start reached
+            oldest_timestamp = times.min()
+            if len(page) < self.max_obs_per_call or oldest_timestamp <= window_start:
+                break
+
+            # next page ends before the oldest record
+            page_end = oldest_timestamp - pd.Timedelta(microseconds=1)
+
+        return records
+
+    def _fetch_history(
+            self,
+            endpoint: str,
+            key: str,
+            time_col: str,
+            bar: pd.Timedelta,
+            make_params: Callable[[pd.Timestamp, pd.Timestamp], Dict[str, Any]],
+            end_buffer: pd.Timedelta = pd.Timedelta(0)
+    ) -> pd.DataFrame:
         """
-        Fetches funding rate data from dYdX for multiple markets with pagination support.
-        
-        Note: dYdX charges funding every hour, unlike other exchanges that typically 
-        use 8-hour funding cycles. This method retrieves the complete historical 
-        funding rate data for any requested date range, making multiple API calls as needed.
+        Fetches the history of all markets of the data request.
+
+        The date range is split into windows of at most max_obs_per_call bars. Windows of all markets are
+        fetched concurrently, requests being spaced by the rate limiter, and stitched in date order. Windows
+        which hold more records than a request returns are paged, without a page cap.
+
+        Parameters
+        ----------
+        endpoint: str
+            API endpoint, e.g. 'candles/perpetualMarkets'.
+        key: str
+            Key of the records in the response, e.g. 'candles'.
+        time_col: str
+            Timestamp key of the records, e.g. 'startedAt'.
+        bar: pd.Timedelta
+            Time between records.
+        make_params: callable
+            Makes the request params from the window start and the end of the page.
+        end_buffer: pd.Timedelta, default 0
+            Time added to the end date of the data request.
 
         Returns
         -------
         pd.DataFrame
-            DataFrame with hourly funding rate data for all requested markets.
+            DataFrame with records of all markets, sorted by ticker and date.
         """
         if not self.data_req:
             raise ValueError("Data request not set")
 
-        # Parse date range
+        # parse date range
         try:
-            # source dates are guaranteed to be set by parameter conversion
-            start_dt = pd.to_datetime(self.data_req.source_start_date)
-            if start_dt.tz is None:
-                start_dt = start_dt.tz_localize('UTC')
-            
-            end_dt = pd.to_datetime(self.data_req.source_end_date)
-            if end_dt.tz is None:
-                end_dt = end_dt.tz_localize('UTC')
-            
-            buffered_end_dt = end_dt + pd.Timedelta(hours=1)
-            
+            start_dt, end_dt = self._get_date_range()
         except Exception as e:
             logging.error(f"Could not parse date range: {e}")
             return pd.DataFrame()
 
-        all_records = []
-        
-        for ticker in self.data_req.source_tickers:
-            market_symbol = f"{ticker}-USD"
-            
-            # Initialize pagination variables
-            current_end_date = buffered_end_dt
-            ticker_records = []
-            page_count = 0
-            max_pages = 100
-            
-            while page_count < max_pages:
-                page_count += 1
-                url = f"{self.base_url}/historicalFunding/{market_symbol}"
-                
-                params = {
-                    'effectiveBeforeOrAt': current_end_date.isoformat(),
-                    'limit': 1000
-                }
-                
-                try:
-                    response = requests.get(url, params=params, timeout=30)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    if 'historicalFunding' not in data or not data['historicalFunding']:
-                        break
-                    
-                    page_records = data['historicalFunding']
-                    
-                    # Convert timestamps
-                    page_df = pd.DataFrame(page_records)
-                    page_df['effectiveAt'] = pd.to_datetime(page_df['effectiveAt'])
-                    
-                    if page_df['effectiveAt'].dt.tz is None:
-                        page_df['effectiveAt'] = page_df['effectiveAt'].dt.tz_localize('UTC')
-                    
-                    # Filter records within date range
-                    oldest_timestamp = page_df['effectiveAt'].min()
-                    if oldest_timestamp < start_dt:
-                        mask = (page_df['effectiveAt'] >= start_dt) & (page_df['effectiveAt'] <= buffered_end_dt)
-                        filtered_records = page_df[mask]
-                        
-                        if not filtered_records.empty:
-                            filtered_records = filtered_records.copy()
-                            filtered_records['rate'] = pd.to_numeric(filtered_records['rate'], errors='coerce')
-                            ticker_records.extend(filtered_records.to_dict('records'))
-                        
-                        break
-                    else:
-                        mask = page_df['effectiveAt'] <= buffered_end_dt
-                        filtered_records = page_df[mask]
-                        
-                        if not filtered_records.empty:
-                            filtered_records = filtered_records.copy()
-                            filtered_records['rate'] = pd.to_numeric(filtered_records['rate'], errors='coerce')
-                            ticker_records.extend(filtered_records.to_dict('records'))
-                    
-                    # Check if we got fewer records than requested (end of data)
-                    if len(page_records) < 1000:
-                        break
-                    
-                    # Set next pagination point
-                    current_end_date = oldest_timestamp - pd.Timedelta(microseconds=1)
-                    
-                    # Rate limiting
-                    time.sleep(1.0)
-                    
-                except requests.exceptions.Timeout:
-                    logging.warning(f"Timeout fetching funding rate data for {market_symbol}, retrying...")
-                    time.sleep(2.0)
-                    continue
-                except requests.exceptions.RequestException as e:
-                    logging.error(f"Failed to fetch funding rate data for {market_symbol}: {str(e)}")
-                    break
-                except Exception as e:
-                    logging.error(f"Error processing funding rate data for {market_symbol}: {str(e)}")
-                    break
-            
-            if ticker_records:
-                all_records.extend(ticker_records)
+        # market x window requests
+        windows = self._get_windows(start_dt, end_dt + end_buffer, bar, self.max_obs_per_call)
+        reqs = [(f"{ticker}-USD", window) for ticker in self.data_req.source_tickers for window in windows]
+
+        def fetch(req: Tuple[str, Tuple[pd.Timestamp, pd.Timestamp]]) -> List[Dict[str, Any]]:
+            market, window = req
+            try:
+                records = self._fetch_window(market, endpoint, key, time_col, make_params, window)
+                for record in records:
+                    record.setdefault('ticker', market)
+                return records
+            except Exception as e:
+                logging.error(f"Error processing {key} for {market} from {window[0]} to {window[1]}: {str(e)}")
+                return []
+
+        # as many workers as requests allowed at once, requests are spaced by the rate limiter
+        max_workers = self.data_req.max_workers
+        if max_workers is None:
+            max_workers = self.rate_limiter.max_workers()
+        records = list(chain.from_iterable(thread_map(fetch, reqs, max_workers)))
 
-        if not all_records:
+        if not records:
             return pd.DataFrame()
 
-        # Create final DataFrame
-        final_df = pd.DataFrame(all_records)
-        final_df = final_df.sort_values(['ticker', 'effectiveAt']).reset_index(drop=True)
-        
-        return final_df
+        # stitch windows
+        df = pd.DataFrame(records)
+        df[time_col] = pd.to_datetime(df[time_col], utc=True)
+        df = df.drop_duplicates(subset=['ticker', time_col]).sort_values(['ticker', time_col]).reset_index(drop=True)
+
+        return df
+
+    def _fetch_ohlcv(self) -> pd.DataFrame:
+        """
+        Fetches OHLCV data from dYdX for multiple markets.
+
+        The dYdX candles API returns at most 1000 records per request, newest first. The date range is split
+        into windows of at most 1000 candles which are fetched concurrently, see _fetch_history.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with OHLCV data for all requested markets.
+        """
+        def make_params(window_start: pd.Timestamp, page_end: pd.Timestamp) -> Dict[str, Any]:
+            return {
+                'resolution': self.data_req.source_freq,
+                'fromISO': window_start.isoformat(),
+                'toISO': page_end.isoformat(),
+                'limit': self.max_obs_per_call  # Maximum allowed by dYdX API
+            }
+
+        bar = resolutions.get(self.data_req.source_freq, pd.Timedelta(days=1))
+
+        return self._fetch_history('candles/perpetualMarkets', 'candles', 'startedAt', bar, make_params)
+
+    def _fetch_funding_rates(self) -> pd.DataFrame:
+        """
+        Fetches funding rate data from dYdX for multiple markets.
+
+        Note: dYdX charges funding every hour, unlike other exchanges that typically
+        use 8-hour funding cycles. The date range is split into windows of at most 1000 hours which are fetched
+        concurrently, see _fetch_history.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with hourly funding rate data for all requested markets.
+        """
+        def make_params(window_start: pd.Timestamp, page_end: pd.Timestamp) -> Dict[str, Any]:
+            return {
+                'effectiveBeforeOrAt': page_end.isoformat(),
+                'limit': self.max_obs_per_call
+            }
+
+        df = self._fetch_history('historicalFunding', 'historicalFunding', 'effectiveAt', pd.Timedelta(hours=1),
+                                 make_params, end_buffer=pd.Timedelta(hours=1))
+        if not df.empty:
+            df['rate'] = pd.to_numeric(df['rate'], errors='coerce')
+
+        return df
 
     def _fetch_open_interest(self) -> pd.DataFrame:
         """
@@ -533,7 +559,7 @@ class Dydx(Exchange):
             url = f"{self.base_url}/perpetualMarkets/{market_symbol}"
             
             try:
-                response = requests.get(url)
+                response = get_session().get(url)
                 response.raise_for_status()
                 data = response.json()
 
@@ -1,17 +1,123 @@
-from typing import Optional
+import asyncio
+import copy
+import importlib
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, List, Optional, Union
+
 import pandas as pd
 
-from cryptodatapy.extract.data_vendors.coinmetrics_api import CoinMetrics
-from cryptodatapy.extract.data_vendors.cryptocompare_api import CryptoCompare
-from cryptodatapy.extract.data_vendors.glassnode_api import Glassnode
-from cryptodatapy.extract.data_vendors.polygon_api import Polygon
-from cryptodatapy.extract.data_vendors.tiingo_api import Tiingo
 from cryptodatapy.extract.datarequest import DataRequest
-from cryptodatapy.extract.exchanges.dydx import Dydx
-from cryptodatapy.extract.libraries.ccxt_api import CCXT
-from cryptodatapy.extract.libraries.dbnomics_api import DBnomics
-from cryptodatapy.extract.libraries.pandasdr_api import PandasDataReader
-from cryptodatapy.extract.web.aqr import AQR
+from cryptodatapy.util.cache import freq_to_timedelta
+from cryptodatapy.util.registry import VendorRegistry, get_registry
+
+if TYPE_CHECKING:
+    from cryptodatapy.util.store import ParquetStore
+
+# data source objects, by module, imported on first use as vendor libraries are slow to import
+data_sources = {
+    "cryptocompare": ("cryptodatapy.extract.data_vendors.cryptocompare_api", "CryptoCompare"),
+    "coinmetrics": ("cryptodatapy.extract.data_vendors.coinmetrics_api", "CoinMetrics"),
+    "ccxt": ("cryptodatapy.extract.libraries.ccxt_api", "CCXT"),
+    "glassnode": ("cryptodatapy.extract.data_vendors.glassnode_api", "Glassnode"),
+    "tiingo": ("cryptodatapy.extract.data_vendors.tiingo_api", "Tiingo"),
+    "dbnomics": ("cryptodatapy.extract.libraries.dbnomics_api", "DBnomics"),
+    "yahoo": ("cryptodatapy.extract.libraries.pandasdr_api", "PandasDataReader"),
+    "fred": ("cryptodatapy.extract.libraries.pandasdr_api", "PandasDataReader"),
+    "alphavantage": ("cryptodatapy.extract.libraries.pandasdr_api", "PandasDataReader"),
+    "polygon": ("cryptodatapy.extract.data_vendors.polygon_api", "Polygon"),
+    "famafrench": ("cryptodatapy.extract.libraries.pandasdr_api", "PandasDataReader"),
+    "aqr": ("cryptodatapy.extract.web.aqr", "AQR"),
+    "dydx": ("cryptodatapy.extract.exchanges.dydx", "Dydx"),
+}
+
+
+def get_data_source(source: str) -> type:
+    """
+    Gets the data source class, importing its module.
+
+    Parameters
+    ----------
+    source: str
+        Name of data source, e.g. 'ccxt', 'glassnode'.
+
+    Returns
+    -------
+    ds: type
+        Data source class.
+    """
+    module, name = data_sources[source]
+
+    return getattr(importlib.import_module(module), name)
+
+
+def lease_data_source(
+        source: str,
+        api_key: Optional[str] = None,
+        exch: Optional[str] = None,
+        fresh_meta: bool = False
+) -> ContextManager[Any]:
+    """
+    Leases a data source object from the process-wide registry, creating it on first use.
+
+    Data source objects are reused by source, exchange and api key until they expire, so that their metadata
+    and clients are loaded once, see VendorRegistry.
+
+    Parameters
+    ----------
+    source: str
+        Name of data source, e.g. 'ccxt', 'glassnode'.
+    api_key: str, optional, default None
+        Api key for data source if required.
+    exch: str, optional, default None
+        Name of exchange, e.g. 'binance'.
+    fresh_meta: bool, default False
+        Lease a copy with the metadata of the data source object when it was created.
+
+    Returns
+    -------
+    lease: context manager
+        Yields the data source object.
+    """
+    def factory():
+        ds = get_data_source(source)
+        return ds(api_key=api_key) if api_key is not None else ds()
+
+    registry = get_registry()
+
+    return registry.lease(registry.make_key(source, exch, api_key), factory, fresh_meta=fresh_meta)
+
+
+@dataclass
+class SeriesResult:
+    """
+    Result of one data request in GetData.get_series_many.
+
+    Attributes
+    ----------
+    data_req: DataRequest
+        Parameters of data request in CryptoDataPy format.
+    data: pd.DataFrame, optional
+        DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values, None if the request failed.
+    error: Exception, optional
+        Exception raised by the request, None if it succeeded.
+    elapsed: float
+        Time taken by the request, in seconds.
+    """
+    data_req: DataRequest
+    data: Optional[pd.DataFrame] = None
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the request succeeded.
+        """
+        return self.error is None
 
 
 class GetData:
@@ -84,23 +190,6 @@ class GetData:
         1INCHUP	        1INCHUP	       None	        1INCHUP	        8
         AAVE	        AAVE	       None	        AAVE	        8
         """
-        # data source objects
-        data_source_dict = {
-            "cryptocompare": CryptoCompare,
-            "coinmetrics": CoinMetrics,
-            "ccxt": CCXT,
-            "glassnode": Glassnode,
-            "tiingo": Tiingo,
-            "dbnomics": DBnomics,
-            "yahoo": PandasDataReader,
-            "fred": PandasDataReader,
-            "alphavantage": PandasDataReader,
-            "polygon": Polygon,
-            "famafrench": PandasDataReader,
-            "aqr": AQR,
-            "dydx": Dydx
-        }
-
         # available attr and methods
         valid_attr = [
             "source_type",
@@ -134,27 +223,30 @@ class GetData:
             "get_onchain_tickers_list",
         ]
 
-        # data source
-        ds = data_source_dict[self.data_req.source]
-        # instantiate ds obj
-        if self.api_key is not None:
-            ds = ds(api_key=self.api_key)
-        else:
-            ds = ds()
-        # get property or method from data source obj
-        if attr in valid_attr:
-            meta = getattr(ds, attr)
-        elif method in valid_meth:
-            meta = getattr(ds, method)(**kwargs)
-        else:
+        if attr not in valid_attr and method not in valid_meth:
             raise AttributeError(
                 f"Select a valid attribute or method. Valid attributes: {valid_attr}."
                 f" Valid methods include: {valid_meth}."
             )
 
+        # data source obj, with its clients loaded by previous requests but its initial metadata, as metadata
+        # methods filter and overwrite it
+        with lease_data_source(self.data_req.source, api_key=self.api_key,
+                               exch=kwargs.get("exch", self.data_req.exch), fresh_meta=True) as ds:
+            # get property or method from data source obj
+            if attr in valid_attr:
+                meta = getattr(ds, attr)
+            else:
+                meta = getattr(ds, method)(**kwargs)
+
         return meta
 
-    def get_series(self, method: str = "get_data") -> pd.DataFrame:
+    def get_series(
+            self,
+            method: str = "get_data",
+            existing: Optional[Union[pd.DataFrame, str, 'ParquetStore']] = None,
+            overlap: int = 1
+    ) -> pd.DataFrame:
         """
         Get requested data.
 
@@ -164,6 +256,13 @@ class GetData:
                       'get_funding_rates', 'get_open_interest', 'get_eqty', 'get_eqty_iex', 'get_etfs', 'get_stocks',
                       'get_fx', 'get_rates', 'get_cmdty', 'get_crypto', 'get_macro_series'}, default 'get_data'
             Gets the specified method from the data source object.
+        existing: pd.DataFrame, str or ParquetStore, optional, default None
+            Data already held, as a tidy MultiIndex dataframe, the path of a local parquet or csv file or a
+            ParquetStore. If provided, only the missing tail of each ticker is requested, starting from its last
+            timestamp minus the overlap, and merged with the existing data. Revised values win over existing ones.
+        overlap: int, default 1
+            Number of bars before the last timestamp of each ticker to request again, e.g. to update the last
+            bar if it was still open, in incremental mode.
 
         Returns
         -------
@@ -195,36 +294,28 @@ class GetData:
                     ETH	        2410	    9164	    0.140147
         2016-01-03	BTC	        394047	    142463	    0.091947
         """
-        # data source objects
-        data_source_dict = {
-            "cryptocompare": CryptoCompare,
-            "coinmetrics": CoinMetrics,
-            "ccxt": CCXT,
-            "glassnode": Glassnode,
-            "tiingo": Tiingo,
-            "dbnomics": DBnomics,
-            "yahoo": PandasDataReader,
-            "fred": PandasDataReader,
-            "alphavantage": PandasDataReader,
-            "polygon": Polygon,
-            "famafrench": PandasDataReader,
-            "aqr": AQR,
-            "dydx": Dydx
-        }
-
-        # data source
-        ds = data_source_dict[self.data_req.source]
-        # instantiate ds obj
-        if self.api_key is not None:
-            ds = ds(api_key=self.api_key)
-        else:
-            ds = ds()
-        # get data
-        df = getattr(ds, method)(self.data_req)
+        # data source obj, reused across requests
+        with lease_data_source(self.data_req.source, api_key=self.api_key, exch=self.data_req.exch) as ds:
+            # get data
+            if existing is None:
+                return getattr(ds, method)(self.data_req)
+
+            # incremental mode, get missing tails
+            existing = self.read_existing(existing)
+            dfs = []
+            for data_req in self.get_incremental_reqs(existing, overlap):
+                dfs.append(getattr(ds, method)(data_req))
+                VendorRegistry.reset(ds)
+        df = self.merge_incremental(existing, dfs)
 
         return df
 
-    async def get_series_async(self, method: str = "get_data_async") -> pd.DataFrame:
+    async def get_series_async(
+            self,
+            method: str = "get_data_async",
+            existing: Optional[Union[pd.DataFrame, str, 'ParquetStore']] = None,
+            overlap: int = 1
+    ) -> pd.DataFrame:
         """
         Get requested data.
 
@@ -232,6 +323,12 @@ class GetData:
         ----------
         method: str, default 'get_data'
             Gets the specified method from the data source object.
+        existing: pd.DataFrame, str or ParquetStore, optional, default None
+            Data already held, as a tidy MultiIndex dataframe, the path of a local parquet or csv file or a
+            ParquetStore. If provided, only the missing tail of each ticker is requested and merged with the
+            existing data.
+        overlap: int, default 1
+            Number of bars before the last timestamp of each ticker to request again, in incremental mode.
 
         Returns
         -------
@@ -263,31 +360,317 @@ class GetData:
                     ETH	        2410	    9164	    0.140147
         2016-01-03	BTC	        394047	    142463	    0.091947
         """
-        # data source objects
-        data_source_dict = {
-            "cryptocompare": CryptoCompare,
-            "coinmetrics": CoinMetrics,
-            "ccxt": CCXT,
-            "glassnode": Glassnode,
-            "tiingo": Tiingo,
-            "dbnomics": DBnomics,
-            "yahoo": PandasDataReader,
-            "fred": PandasDataReader,
-            "alphavantage": PandasDataReader,
-            "polygon": Polygon,
-            "famafrench": PandasDataReader,
-            "aqr": AQR,
-            "dydx": Dydx
-        }
-
-        # data source
-        ds = data_source_dict[self.data_req.source]
-        # instantiate ds obj
-        if self.api_key is not None:
-            ds = ds(api_key=self.api_key)
-        else:
-            ds = ds()
-        # get data
-        df = await getattr(ds, method)(self.data_req)
+        # data source obj, reused across requests
+        with lease_data_source(self.data_req.source, api_key=self.api_key, exch=self.data_req.exch) as ds:
+            # get data
+            if existing is None:
+                return await getattr(ds, method)(self.data_req)
+
+            # incremental mode, get missing tails
+            existing = self.read_existing(existing)
+            dfs = []
+            for data_req in self.get_incremental_reqs(existing, overlap):
+                dfs.append(await getattr(ds, method)(data_req))
+                VendorRegistry.reset(ds)
+        df = self.merge_incremental(existing, dfs)
 
         return df
+
+    @staticmethod
+    async def _get_source_series(
+            source: str,
+            data_reqs: List[DataRequest],
+            method: str,
+            api_key: Optional[str] = None,
+            exch: Optional[str] = None
+    ) -> List[SeriesResult]:
+        """
+        Gets the data requests of a data source one after the other with a single data source object.
+
+        Async methods (method + '_async') run on the event loop, others in a worker thread so that they don't
+        block the requests of other data sources.
+        """
+        results = []
+
+        # data source obj, reused across requests
+        try:
+            with lease_data_source(source, api_key=api_key, exch=exch) as ds:
+                async_method = getattr(ds, f"{method}_async", None)
+                for data_req in data_reqs:
+                    start = time.perf_counter()
+                    try:
+                        if async_method is not None:
+                            df = await async_method(data_req)
+                        else:
+                            df = await asyncio.to_thread(getattr(ds, method), data_req)
+                        results.append(SeriesResult(data_req=data_req, data=df, elapsed=time.perf_counter() - start))
+                    except Exception as e:
+                        logging.warning(f"Failed to get data for {data_req.tickers} from {source}: {e}")
+                        results.append(SeriesResult(data_req=data_req, error=e,
+                                                    elapsed=time.perf_counter() - start))
+                    VendorRegistry.reset(ds)
+        except Exception as e:
+            logging.warning(f"Failed to instantiate data source {source}: {e}")
+            return [SeriesResult(data_req=data_req, error=e) for data_req in data_reqs]
+
+        return results
+
+    @staticmethod
+    async def get_series_many_async(
+            data_reqs: List[DataRequest],
+            method: str = "get_data",
+            api_keys: Optional[Dict[str, str]] = None
+    ) -> List[SeriesResult]:
+        """
+        Get several data requests, e.g. for a full refresh of a dataset, concurrently by data source.
+
+        Requests are grouped by data source and exchange. Each group gets its requests one after the other with one
+        data source object from the registry, sharing its metadata, rate limiter and the pooled HTTP session, while
+        groups run concurrently on one event loop. The time taken is bounded by the slowest data source instead of
+        the sum of all of them.
+
+        Parameters
+        ----------
+        data_reqs: list
+            Parameters of data requests in CryptoDataPy format.
+        method: str, default 'get_data'
+            Gets the specified method from the data source objects. Its async version, e.g. 'get_data_async',
+            is used for data sources which provide one.
+        api_keys: dict, optional, default None
+            Api keys of data sources which require one, by data source, e.g. {'glassnode': 'key'}.
+
+        Returns
+        -------
+        results: list
+            SeriesResult with the data or error and the time taken by each request, in the order of data_reqs.
+        """
+        if api_keys is None:
+            api_keys = {}
+
+        # group requests by source and exchange
+        groups = {}
+        for i, data_req in enumerate(data_reqs):
+            groups.setdefault((data_req.source, data_req.exch), []).append(i)
+
+        # get sources concurrently
+        source_results = await asyncio.gather(*[
+            GetData._get_source_series(source, [data_reqs[i] for i in idx], method, api_keys.get(source), exch)
+            for (source, exch), idx in groups.items()
+        ])
+
+        # results in request order
+        results = [None] * len(data_reqs)
+        for idx, res in zip(groups.values(), source_results):
+            for i, result in zip(idx, res):
+                results[i] = result
+
+        return results
+
+    @staticmethod
+    def get_series_many(
+            data_reqs: List[DataRequest],
+            method: str = "get_data",
+            api_keys: Optional[Dict[str, str]] = None
+    ) -> List[SeriesResult]:
+        """
+        Get several data requests concurrently by data source.
+
+        Runs get_series_many_async on a new event loop. When called from a running event loop, e.g. in Jupyter or
+        an async app, the new loop runs in a worker thread; async code can await get_series_many_async instead.
+
+        Parameters
+        ----------
+        data_reqs: list
+            Parameters of data requests in CryptoDataPy format.
+        method: str, default 'get_data'
+            Gets the specified method from the data source objects.
+        api_keys: dict, optional, default None
+            Api keys of data sources which require one, by data source, e.g. {'glassnode': 'key'}.
+
+        Returns
+        -------
+        results: list
+            SeriesResult with the data or error and the time taken by each request, in the order of data_reqs.
+
+        Examples
+        --------
+        >>> data_reqs = [DataRequest(source='ccxt', tickers=['btc', 'eth'], fields=['close'], freq='d'),
+                         DataRequest(source='fred', tickers=['US_Rates_10Y'], fields=['close'], freq='d')]
+        >>> results = GetData.get_series_many(data_reqs)
+        >>> [(res.data_req.source, res.ok, round(res.elapsed, 1)) for res in results]
+        [('ccxt', True, 2.3), ('fred', True, 0.8)]
+        """
+        coro = GetData.get_series_many_async(data_reqs, method=method, api_keys=api_keys)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # asyncio.run can't be nested in a running loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    def read_existing(self, existing: Union[pd.DataFrame, str, 'ParquetStore']) -> pd.DataFrame:
+        """
+        Reads data already held for an incremental update.
+
+        Parameters
+        ----------
+        existing: pd.DataFrame, str or ParquetStore
+            Tidy MultiIndex dataframe, path of a local parquet or csv file, or store from which the requested
+            source, frequency and fields are read.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values.
+        """
+        # imported on use, pyarrow is slow to import
+        from cryptodatapy.util.store import ParquetStore
+
+        if isinstance(existing, ParquetStore):
+            existing = existing.read(self.data_req.source, self.data_req.freq, fields=self.data_req.fields)
+            if existing.empty:
+                existing = pd.DataFrame(columns=self.data_req.fields,
+                                        index=pd.MultiIndex.from_tuples([], names=['date', 'ticker']))
+        elif isinstance(existing, str):
+            if existing.endswith('.parquet'):
+                existing = pd.read_parquet(existing)
+            else:
+                existing = pd.read_csv(existing, index_col=[0, 1], parse_dates=[0])
+
+        if not isinstance(existing, pd.DataFrame) or not isinstance(existing.index, pd.MultiIndex):
+            raise TypeError("Existing data must be a MultiIndex dataframe with date (level 0) and ticker (level 1).")
+
+        return existing
+
+    @staticmethod
+    def _match_ticker(ticker: str, existing_tickers: List[str]) -> Optional[str]:
+        """
+        Matches a requested ticker to a ticker of the existing data, e.g. 'btc' to 'BTC' or 'BTC/USDT'.
+        """
+        for existing_ticker in existing_tickers:
+            if str(existing_ticker).upper() == ticker.upper():
+                return existing_ticker
+        for existing_ticker in existing_tickers:
+            if re.split(r"[/\-_:]", str(existing_ticker))[0].upper() == ticker.upper():
+                return existing_ticker
+
+        return None
+
+    @staticmethod
+    def _to_naive(dates: Any) -> Any:
+        """
+        Converts dates to tz-naive UTC timestamps, for comparisons between data sources with and without tz.
+        """
+        if dates is None:
+            return None
+        if isinstance(dates, pd.Index):
+            dates = pd.DatetimeIndex(dates)
+        else:
+            dates = pd.Timestamp(dates)
+
+        return dates.tz_convert('UTC').tz_localize(None) if dates.tz is not None else dates
+
+    def get_incremental_reqs(self, existing: pd.DataFrame, overlap: int = 1) -> List[DataRequest]:
+        """
+        Gets the data requests for the missing tail of each ticker.
+
+        The start date of a ticker is the earliest last timestamp of its requested fields minus the overlap, or the
+        requested start date if the ticker or one of its fields is missing. Tickers with the same start date are
+        grouped in one request.
+
+        Parameters
+        ----------
+        existing: pd.DataFrame - MultiIndex
+            Data already held.
+        overlap: int, default 1
+            Number of bars before the last timestamp to request again.
+
+        Returns
+        -------
+        data_reqs: list
+            List of data requests, one for each start date.
+        """
+        if overlap < 0:
+            raise ValueError("Overlap must be a non-negative number of bars.")
+
+        # last timestamp of each ticker and field
+        fields = [field for field in self.data_req.fields if field in existing.columns]
+        dates = pd.Series(self._to_naive(existing.index.get_level_values(0)),
+                          index=existing.index.get_level_values(1))
+        last = pd.DataFrame({field: dates[existing[field].notna().values].groupby(level=0).max()
+                             for field in fields}, columns=fields)
+
+        bar = freq_to_timedelta(self.data_req.freq)
+        start_date = self._to_naive(self.data_req.start_date)
+        end_date = self._to_naive(self.data_req.end_date)
+
+        # start date by ticker
+        starts = {}
+        for i, ticker in enumerate(self.data_req.tickers):
+            existing_ticker = self._match_ticker(ticker, list(last.index))
+            if existing_ticker is None or len(fields) < len(self.data_req.fields) or \
+                    last.loc[existing_ticker].isna().any():
+                start = start_date
+            else:
+                start = last.loc[existing_ticker].min() - overlap * bar
+                if start_date is not None:
+                    start = max(start, start_date)
+                # already up to date
+                if end_date is not None and start > end_date:
+                    continue
+            starts.setdefault(start, []).append(i)
+
+        # data requests grouped by start date
+        data_reqs = []
+        for start, idx in starts.items():
+            data_req = copy.deepcopy(self.data_req)
+            data_req.tickers = [self.data_req.tickers[i] for i in idx]
+            if self.data_req.source_tickers is not None and \
+                    len(self.data_req.source_tickers) == len(self.data_req.tickers):
+                data_req.source_tickers = [self.data_req.source_tickers[i] for i in idx]
+            data_req.start_date = start
+            data_reqs.append(data_req)
+
+        return data_reqs
+
+    @staticmethod
+    def merge_incremental(existing: pd.DataFrame, dfs: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Merges newly retrieved data with existing data, de-duplicating rows. Revised values win over existing ones.
+
+        Parameters
+        ----------
+        existing: pd.DataFrame - MultiIndex
+            Data already held.
+        dfs: list
+            List of dataframes with newly retrieved data.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values.
+        """
+        dfs = [df for df in dfs if df is not None and not df.empty]
+        if not dfs:
+            return existing
+
+        # new data, last revision wins
+        new = pd.concat(dfs)
+        new = new[~new.index.duplicated(keep='last')]
+
+        # align timezone of new dates to existing dates
+        tz = pd.DatetimeIndex(existing.index.levels[0]).tz
+        new_dates = pd.DatetimeIndex(new.index.levels[0])
+        if new_dates.tz is None and tz is not None:
+            new_dates = new_dates.tz_localize('UTC').tz_convert(tz)
+        elif new_dates.tz is not None:
+            new_dates = new_dates.tz_convert(tz) if tz is not None else new_dates.tz_convert('UTC').tz_localize(None)
+        new.index = new.index.set_levels(new_dates, level=0)
+
+        # merge
+        df = new.combine_first(existing)
+        df = df[list(existing.columns) + [col for col in new.columns if col not in existing.columns]]
+
+        return df.sort_index()
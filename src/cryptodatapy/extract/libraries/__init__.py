@@ -1,4 +1,14 @@
-from cryptodatapy.extract.libraries.ccxt_api import CCXT
-from cryptodatapy.extract.libraries.dbnomics_api import DBnomics
-from cryptodatapy.extract.libraries.library import Library
-from cryptodatapy.extract.libraries.pandasdr_api import PandasDataReader
+from cryptodatapy.util.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "CCXT": ".ccxt_api",
+    "DBnomics": ".dbnomics_api",
+    "Library": ".library",
+    "PandasDataReader": ".pandasdr_api",
+    # submodules and subpackages
+    "ccxt_api": ".ccxt_api",
+    "dbnomics_api": ".dbnomics_api",
+    "investpy_api": ".investpy_api",
+    "library": ".library",
+    "pandasdr_api": ".pandasdr_api",
+})
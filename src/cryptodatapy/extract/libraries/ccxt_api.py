@@ -1,8 +1,9 @@
 import asyncio
+import copy
 import logging
 import random
 from time import sleep
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 import ccxt
 import ccxt.async_support as ccxt_async
@@ -13,7 +14,11 @@ from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.libraries.library import Library
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData
+from cryptodatapy.util.cache import ResponseCache, get_cache, is_closed, make_key
+from cryptodatapy.util.concurrency import thread_map
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.ratelimit import RateLimiter, get_rate_limiter
+from cryptodatapy.util.snapshot import get_snapshot_store
 
 # data credentials
 data_cred = DataCredentials()
@@ -184,8 +189,7 @@ class CCXT(Library):
                     f"Use get_exchanges_info() to get a list of supported exchanges."
                 )
             else:
-                if self.exchange is None:
-                    self.exchange = getattr(ccxt, exch)()
+                self._get_exchange(exch)
 
             # get assets on exchange and create df
             self.exchange.load_markets()
@@ -232,8 +236,7 @@ class CCXT(Library):
                     f"Use get_exchanges_info() to get a list of supported exchanges."
                 )
             else:
-                if self.exchange is None:
-                    self.exchange = getattr(ccxt, exch)()
+                self._get_exchange(exch)
 
             # get assets on exchange
             self.markets = pd.DataFrame(self.exchange.load_markets()).T
@@ -302,8 +305,7 @@ class CCXT(Library):
                     f"Use get_exchanges_info() to get a list of supported exchanges."
                 )
             else:
-                if self.exchange is None:
-                    self.exchange = getattr(ccxt, exch)()
+                self._get_exchange(exch)
 
             # freq dict
             self.frequencies = self.exchange.timeframes
@@ -333,8 +335,7 @@ class CCXT(Library):
                     f"Use get_exchanges_info() to get a list of supported exchanges."
                 )
             else:
-                if self.exchange is None:
-                    self.exchange = getattr(ccxt, exch)()
+                self._get_exchange(exch)
 
             self.rate_limit = {
                 "exchange rate limit": "delay in milliseconds between two consequent HTTP requests to the same exchange",
@@ -358,8 +359,7 @@ class CCXT(Library):
                 f"{exch} is not a supported exchange. Use get_exchanges_info() to get a list of supported exchanges."
             )
         else:
-            if self.exchange is None:
-                self.exchange = getattr(ccxt, exch)()
+            self._get_exchange(exch)
 
         # load markets
         self.exchange.load_markets()
@@ -403,6 +403,404 @@ class CCXT(Library):
         delay_with_jitter = delay + random.uniform(0, delay * 0.5)
         await asyncio.sleep(delay_with_jitter)
 
+    @staticmethod
+    def _fetch_markets_snapshot(exch: str) -> Dict[str, Any]:
+        """
+        Fetches the markets and currencies of an exchange.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+
+        Returns
+        -------
+        snapshot: dict
+            Dictionary with markets and currencies.
+        """
+        exchange = getattr(ccxt, exch)()
+        exchange.load_markets()
+
+        return {"markets": exchange.markets, "currencies": exchange.currencies}
+
+    @staticmethod
+    def _load_markets_snapshot(exchange: Any, exch: str, block: bool = True) -> None:
+        """
+        Loads the markets and currencies of an exchange from its local snapshot, so that load_markets doesn't
+        request them. Stale snapshots are refreshed in the background.
+
+        Parameters
+        ----------
+        exchange: ccxt.Exchange
+            CCXT exchange instance, sync or async.
+        exch: str
+            Name of exchange.
+        block: bool, default True
+            Fetch a missing snapshot in the calling thread. If False, it is fetched in the background and the
+            exchange loads its markets itself.
+        """
+        store = get_snapshot_store()
+        if store is None:
+            return None
+
+        name = f"ccxt_markets_{exch}"
+        try:
+            snapshot = store.get_or_fetch(name, lambda: CCXT._fetch_markets_snapshot(exch), block=block)
+            if snapshot is not None:
+                exchange.set_markets(snapshot["markets"], snapshot["currencies"])
+        except Exception as e:
+            logging.warning(f"Failed to load {exch} markets snapshot, markets are loaded from the exchange: {e}")
+            store.delete(name)
+            exchange.markets = None
+
+    def new_clients(self) -> None:
+        """
+        Replaces the exchange instances with new ones, e.g. for a copy of this object used by another thread, as
+        CCXT exchange instances aren't thread-safe. Markets already loaded are kept.
+        """
+        if self.exchange is not None:
+            exchange = type(self.exchange)()
+            if self.exchange.markets:
+                exchange.set_markets(self.exchange.markets, self.exchange.currencies)
+            self.exchange = exchange
+        # async exchanges are bound to an event loop, a new one is created on first use
+        self.exchange_async = None
+
+    def _get_exchange(self, exch: str) -> Any:
+        """
+        Gets the sync exchange instance, with markets loaded from the local snapshot.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+
+        Returns
+        -------
+        exchange: ccxt.Exchange
+            CCXT exchange instance.
+        """
+        if self.exchange is None:
+            self.exchange = getattr(ccxt, exch)()
+            self._load_markets_snapshot(self.exchange, exch)
+
+        return self.exchange
+
+    def _get_exchange_async(self, exch: str) -> Any:
+        """
+        Gets the async exchange instance, with markets loaded from the local snapshot.
+
+        Async exchanges are bound to the event loop they were first used on, a new instance is created when
+        called from another event loop, e.g. when the CCXT object is reused by a later request.
+
+        Parameters
+        ----------
+        exch: str
+            Name of exchange.
+
+        Returns
+        -------
+        exchange: ccxt.async_support.Exchange
+            CCXT async exchange instance.
+        """
+        loop = getattr(self.exchange_async, "asyncio_loop", None)
+        if isinstance(loop, asyncio.AbstractEventLoop) and loop is not asyncio.get_running_loop():
+            self.exchange_async = None
+        if self.exchange_async is None:
+            self.exchange_async = getattr(ccxt_async, exch)()
+            # don't block the event loop, a missing snapshot is fetched in the background
+            self._load_markets_snapshot(self.exchange_async, exch, block=False)
+
+        return self.exchange_async
+
+    def _get_rate_limiter(self, exchange: Any) -> RateLimiter:
+        """
+        Gets the rate limiter shared by all requests to an exchange, sized from the exchange's rate limit.
+
+        Parameters
+        ----------
+        exchange: ccxt.Exchange
+            CCXT exchange instance.
+
+        Returns
+        -------
+        rate_limiter: RateLimiter
+            Rate limiter for the exchange.
+        """
+        return get_rate_limiter(f"ccxt:{exchange.id}", rate_limit=exchange.rateLimit)
+
+    @staticmethod
+    def _get_cached_page(
+        exchange: Any, method: str, args: tuple, kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[ResponseCache], Dict[str, str], Optional[List]]:
+        """
+        Looks up a page of data in the response cache.
+
+        Pages of closed bars are cached without their 'until' param, so they are reused by later requests with
+        a more recent end date.
+
+        Parameters
+        ----------
+        exchange: ccxt.Exchange
+            CCXT exchange instance.
+        method: str
+            Name of the CCXT fetch method, e.g. 'fetch_ohlcv'.
+        args: tuple
+            Positional arguments of the fetch method.
+        kwargs: dict
+            Keyword arguments of the fetch method.
+
+        Returns
+        -------
+        cache: ResponseCache
+            Response cache, or None if caching is disabled.
+        keys: dict
+            Dictionary with vendor, closed and open page cache keys.
+        data: list
+            Cached page, or None if missing.
+        """
+        cache = get_cache()
+        if cache is None:
+            return None, {}, None
+
+        vendor = f"ccxt:{exchange.id}"
+        params = dict(kwargs.get('params') or {})
+        until = params.pop('until', None)
+        keys = {
+            'vendor': vendor,
+            'closed': make_key(vendor, method, {'args': args, **kwargs, 'params': params}),
+            'open': make_key(vendor, method, {'args': args, **kwargs}),
+        }
+
+        # closed page, valid if it ends before the requested end date
+        data = cache.get(keys['closed'])
+        if data is not None and (until is None or CCXT._get_timestamp(data[-1]) <= until):
+            return cache, keys, data
+
+        return cache, keys, cache.get(keys['open'])
+
+    @staticmethod
+    def _set_cached_page(cache: Optional[ResponseCache], keys: Dict[str, str], data: List,
+                         freq: Optional[str] = None) -> None:
+        """
+        Adds a page of data to the response cache. Pages whose last bar has closed never expire.
+        """
+        if cache is None or not data:
+            return
+
+        if is_closed(CCXT._get_timestamp(data[-1]), freq):
+            cache.set(keys['closed'], data, keys['vendor'])
+        else:
+            cache.set(keys['open'], data, keys['vendor'], cache.get_ttl(keys['vendor']))
+
+    @staticmethod
+    def _get_timestamp(row: Union[List, Dict[str, Any]]) -> int:
+        """
+        Gets the timestamp, in milliseconds since Unix epoch, of an OHLCV list or funding rate/open interest dict.
+        """
+        return row['timestamp'] if isinstance(row, dict) else row[0]
+
+    def _fetch_page(self, rate_limiter: RateLimiter, method: str, *args, freq: Optional[str] = None,
+                    **kwargs) -> List:
+        """
+        Fetches a page of data with a CCXT fetch method, through the response cache.
+
+        Parameters
+        ----------
+        rate_limiter: RateLimiter
+            Rate limiter for the exchange, only used when the page is fetched from the exchange.
+        method: str
+            Name of the CCXT fetch method, e.g. 'fetch_ohlcv'.
+        *args:
+            Positional arguments of the fetch method.
+        freq: str, optional, default None
+            Frequency of data, used to check whether the last bar has closed.
+        **kwargs:
+            Keyword arguments of the fetch method.
+
+        Returns
+        -------
+        data: list
+            Page of data.
+        """
+        cache, keys, data = self._get_cached_page(self.exchange, method, args, kwargs)
+        if data is None:
+            rate_limiter.acquire()
+            data = getattr(self.exchange, method)(*args, **kwargs)
+            self._set_cached_page(cache, keys, data, freq)
+
+        return data
+
+    async def _fetch_page_async(self, rate_limiter: RateLimiter, method: str, *args, freq: Optional[str] = None,
+                                **kwargs) -> List:
+        """
+        Fetches a page of data with a CCXT async fetch method, through the response cache.
+
+        Parameters
+        ----------
+        rate_limiter: RateLimiter
+            Rate limiter for the exchange, only used when the page is fetched from the exchange.
+        method: str
+            Name of the CCXT fetch method, e.g. 'fetch_ohlcv'.
+        *args:
+            Positional arguments of the fetch method.
+        freq: str, optional, default None
+            Frequency of data, used to check whether the last bar has closed.
+        **kwargs:
+            Keyword arguments of the fetch method.
+
+        Returns
+        -------
+        data: list
+            Page of data.
+        """
+        cache, keys, data = self._get_cached_page(self.exchange_async, method, args, kwargs)
+        if data is None:
+            await rate_limiter.acquire_async()
+            data = await getattr(self.exchange_async, method)(*args, **kwargs)
+            self._set_cached_page(cache, keys, data, freq)
+
+        return data
+
+    def _get_max_concurrency(self, n_tickers: int, max_concurrency: Optional[int] = None) -> int:
+        """
+        Gets the number of markets to fetch concurrently.
+
+        Parameters
+        ----------
+        n_tickers: int
+            Number of tickers to fetch.
+        max_concurrency: int, optional, default None
+            Maximum number of markets fetched concurrently. If None, it is sized from the exchange's rate limit
+            as the number of requests allowed per second.
+
+        Returns
+        -------
+        max_concurrency: int
+            Number of markets to fetch concurrently.
+        """
+        if max_concurrency is None:
+            rate_limit = getattr(self.exchange_async, "rateLimit", None) or 1000
+            max_concurrency = int(1000 / rate_limit)
+
+        return max(1, min(n_tickers, max_concurrency))
+
+    async def _fetch_all_async(
+        self,
+        fetch_fn: Callable[[str], Awaitable[Union[List, None]]],
+        tickers: List[str],
+        desc: str,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Union[List, None]]:
+        """
+        Runs the pagination loops of several markets concurrently on the shared async exchange instance.
+
+        Parameters
+        ----------
+        fetch_fn: callable
+            Coroutine function which fetches the entire data history for a ticker.
+        tickers: list
+            List of ticker symbols.
+        desc: str
+            Description for progress bar.
+        max_concurrency: int, optional, default None
+            Maximum number of markets fetched concurrently. If None, it is sized from the exchange's rate limit.
+
+        Returns
+        -------
+        data_resp: list
+            List of data responses for each ticker, in the same order as tickers.
+        """
+        # semaphore bounds the number of pagination loops in flight, the exchange throttles the requests
+        sem = asyncio.Semaphore(self._get_max_concurrency(len(tickers), max_concurrency))
+
+        # create progress bar
+        pbar = tqdm(total=len(tickers), desc=desc, unit="ticker")
+
+        async def fetch(ticker: str) -> Union[List, None]:
+            async with sem:
+                try:
+                    return await fetch_fn(ticker)
+                except Exception as e:
+                    logging.warning(f"Failed to get data from {self.exchange_async.id} for {ticker}: {e}.")
+                    return None
+                finally:
+                    pbar.update(1)
+
+        try:
+            # gather returns results in tickers order
+            data_resp = await asyncio.gather(*[fetch(ticker) for ticker in tickers])
+        finally:
+            pbar.close()
+            await self.exchange_async.close()
+
+        return list(data_resp)
+
+    def _get_ohlcv_shards(
+        self, freq: str, start_date: int, end_date: int, shards: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Splits the date range of an OHLCV history into consecutive time shards, aligned to pages of
+        max_obs_per_call bars so that no request is wasted on a partial page.
+
+        Parameters
+        ----------
+        freq: str
+            Frequency of data, e.g. '1m', '5m', '1h', '1d'.
+        start_date: int
+            Start date in integers in milliseconds since Unix epoch.
+        end_date: int
+            End date in integers in milliseconds since Unix epoch.
+        shards: int, optional, default None
+            Maximum number of shards. The range is never split into more shards than pages.
+
+        Returns
+        -------
+        windows: list
+            List of (start, end) dates of shards, in milliseconds since Unix epoch.
+        """
+        if shards is None or shards <= 1 or start_date >= end_date:
+            return [(start_date, end_date)]
+
+        # pages in range
+        page = ccxt.Exchange.parse_timeframe(freq) * 1000 * self.max_obs_per_call
+        n_pages = -(-(end_date - start_date) // page)
+        if n_pages <= 1:
+            return [(start_date, end_date)]
+
+        # whole pages per shard
+        shard = -(-n_pages // min(shards, n_pages)) * page
+        bounds = list(range(start_date, end_date, shard)) + [end_date]
+
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    @staticmethod
+    def _merge_shards(shards_resp: List[Union[List, None]]) -> Union[List, None]:
+        """
+        Merges the OHLCV data of consecutive time shards, dropping bars already returned by the previous shard,
+        e.g. when an exchange returns bars past the end of a shard.
+
+        Parameters
+        ----------
+        shards_resp: list
+            List of lists of timestamps with OHLCV data, by shard in date order.
+
+        Returns
+        -------
+        data_resp: list
+            List of timestamps with OHLCV data, None if OHLCV data is not available.
+        """
+        if all(resp is None for resp in shards_resp):
+            return None
+
+        data_resp = []
+        for resp in shards_resp:
+            for row in resp or []:
+                if not data_resp or row[0] > data_resp[-1][0]:
+                    data_resp.append(row)
+
+        return data_resp
+
     async def _fetch_ohlcv_async(
         self,
         ticker: str,
@@ -412,6 +810,8 @@ class CCXT(Library):
         exch: str,
         trials: int = 3,
         pause: int = 1,
+        close_exch: bool = True,
+        shards: Optional[int] = None,
     ) -> Union[List, None]:
         """
         Fetches OHLCV data for a specific ticker.
@@ -430,8 +830,14 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 60
-            Pause in seconds to respect the rate limit.
+        pause: int, default 1
+            Maximum delay in seconds when backing off after a failed request.
+        close_exch: bool, default True
+            Closes the async exchange connection once the data is fetched. Set to False when the exchange
+            instance is shared by concurrent fetches.
+        shards: int, optional, default None
+            Number of time shards fetched concurrently, see _get_ohlcv_shards. If None, pages are fetched one
+            after the other.
 
         Returns
         -------
@@ -442,17 +848,36 @@ class CCXT(Library):
         data_resp = []
 
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        self._get_exchange_async(exch)
 
         # fetch data
         if self.exchange_async.has["fetchOHLCV"]:
+            # fetch time shards concurrently
+            windows = self._get_ohlcv_shards(freq, start_date, end_date, shards)
+            if len(windows) > 1:
+                try:
+                    shards_resp = await asyncio.gather(*[
+                        self._fetch_ohlcv_async(ticker, freq, start, end, exch, trials=trials, pause=pause,
+                                                close_exch=False)
+                        for start, end in windows
+                    ])
+                finally:
+                    if close_exch:
+                        await self.exchange_async.close()
+                return self._merge_shards(shards_resp)
+
+            # rate limiter shared by all requests to the exchange
+            rate_limiter = self._get_rate_limiter(self.exchange_async)
+
             # while loop to fetch all data
             while start_date < end_date and attempts < trials:
                 try:
-                    data = await self.exchange_async.fetch_ohlcv(
+                    data = await self._fetch_page_async(
+                        rate_limiter,
+                        "fetch_ohlcv",
                         ticker,
                         freq,
+                        freq=freq,
                         since=start_date,
                         limit=self.max_obs_per_call,
                         params={"until": end_date},
@@ -478,12 +903,13 @@ class CCXT(Library):
                         )
                         break
 
-                finally:
+                    # back off before retrying
                     await self.exponential_backoff_with_jitter_async(
                         self.exchange_async.rateLimit / 1000, pause, attempts
                     )
 
-            await self.exchange_async.close()
+            if close_exch:
+                await self.exchange_async.close()
             return data_resp
 
         else:
@@ -501,6 +927,8 @@ class CCXT(Library):
         exch: str,
         trials: int = 3,
         pause: int = 1,
+        shards: Optional[int] = None,
+        paginate: bool = True,
     ) -> Union[List, None]:
         """
         Fetches OHLCV data for a specific ticker.
@@ -519,8 +947,13 @@ class CCXT(Library):
             Name of exchange.
         trials: int, default 3
             Number of attempts to fetch data.
-        pause: int, default 60
-            Pause in seconds to respect the rate limit.
+        pause: int, default 1
+            Maximum delay in seconds when backing off after a failed request.
+        shards: int, optional, default None
+            Number of time shards fetched concurrently, in a thread pool, see _get_ohlcv_shards. If None, pages
+            are fetched one after the other.
+        paginate: bool, default True
+            Lets CCXT paginate requests. Disabled for time shards, which are bounded and paged by this method.
 
         Returns
         -------
@@ -531,20 +964,42 @@ class CCXT(Library):
         data_resp = []
 
         # inst exch
-        if self.exchange is None:
-            self.exchange = getattr(ccxt, exch)()
+        self._get_exchange(exch)
 
         # fetch data
         if self.exchange.has["fetchOHLCV"]:
+            # fetch time shards concurrently
+            windows = self._get_ohlcv_shards(freq, start_date, end_date, shards)
+            if len(windows) > 1:
+                # markets loaded once and shared by the shards' exchange instances
+                if not self.exchange.markets:
+                    self.exchange.load_markets()
+
+                def fetch_shard(window: Tuple[int, int]) -> Union[List, None]:
+                    # CCXT exchange instances aren't thread-safe, each shard is fetched with its own
+                    cx = copy.copy(self)
+                    cx.new_clients()
+                    return cx._fetch_ohlcv(ticker, freq, window[0], window[1], exch, trials=trials, pause=pause,
+                                           paginate=False)
+
+                shards_resp = thread_map(fetch_shard, windows, max_workers=len(windows))
+                return self._merge_shards(shards_resp)
+
+            # rate limiter shared by all requests to the exchange
+            rate_limiter = self._get_rate_limiter(self.exchange)
+
             # while loop to fetch all data
             while start_date < end_date and attempts < trials:
                 try:
-                    data = self.exchange.fetch_ohlcv(
+                    data = self._fetch_page(
+                        rate_limiter,
+                        "fetch_ohlcv",
                         ticker,
                         freq,
+                        freq=freq,
                         since=start_date,
                         limit=self.max_obs_per_call,
-                        params={"until": end_date, "paginate": True},
+                        params={"until": end_date, "paginate": paginate},
                     )
 
                     # add data to list
@@ -567,7 +1022,7 @@ class CCXT(Library):
                         )
                         break
 
-                finally:
+                    # back off before retrying
                     self.exponential_backoff_with_jitter(
                         self.exchange.rateLimit / 1000, pause, attempts
                     )
@@ -587,6 +1042,8 @@ class CCXT(Library):
         exch: str,
         trials: int = 3,
         pause: int = 1,
+        max_concurrency: Optional[int] = None,
+        shards: Optional[int] = None,
     ) -> Union[List, None]:
         """
         Fetches OHLCV data for a list of tickers.
@@ -606,7 +1063,12 @@ class CCXT(Library):
         trials: int, default 3
             Number of attempts to fetch data.
         pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+            Not used, requests are throttled by the exchange's rate limit.
+        max_concurrency: int, optional, default None
+            Maximum number of markets fetched concurrently. If None, it is sized from the exchange's rate limit.
+        shards: int, optional, default None
+            Number of time shards of each market fetched concurrently. If None, pages are fetched one after the
+            other.
 
         Returns
         -------
@@ -614,22 +1076,18 @@ class CCXT(Library):
             List of lists of timestamps and OHLCV data for each ticker.
         """
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
-
-        # create progress bar
-        pbar = tqdm(total=len(tickers), desc="Fetching OHLCV data", unit="ticker")
-
-        # loop through tickers
-        for ticker in tickers:
-            data = await self._fetch_ohlcv_async(
-                ticker, freq, start_date, end_date, trials=trials, exch=exch
-            )
-            await asyncio.sleep(pause)
-            self.data_resp.append(data)
-            pbar.update(1)
-
-        await self.exchange_async.close()
+        self._get_exchange_async(exch)
+
+        # fetch tickers concurrently
+        data_resp = await self._fetch_all_async(
+            lambda ticker: self._fetch_ohlcv_async(
+                ticker, freq, start_date, end_date, trials=trials, exch=exch, close_exch=False, shards=shards
+            ),
+            tickers,
+            desc="Fetching OHLCV data",
+            max_concurrency=max_concurrency,
+        )
+        self.data_resp.extend(data_resp)
 
         return self.data_resp
 
@@ -642,6 +1100,7 @@ class CCXT(Library):
         exch: str,
         trials: int = 3,
         pause: int = 1,
+        shards: Optional[int] = None,
     ) -> Union[List, None]:
         """
         Fetches OHLCV data for a list of tickers.
@@ -661,7 +1120,10 @@ class CCXT(Library):
         trials: int, default 3
             Number of attempts to fetch data.
         pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+            Not used, requests are throttled by the exchange's rate limit.
+        shards: int, optional, default None
+            Number of time shards of each market fetched concurrently. If None, pages are fetched one after the
+            other.
 
         Returns
         -------
@@ -669,8 +1131,7 @@ class CCXT(Library):
             List of lists of timestamps and OHLCV data for each ticker.
         """
         # inst exch
-        if self.exchange is None:
-            self.exchange = getattr(ccxt, exch)()
+        self._get_exchange(exch)
 
         # create progress bar
         pbar = tqdm(total=len(tickers), desc="Fetching OHLCV data", unit="ticker")
@@ -678,9 +1139,8 @@ class CCXT(Library):
         # loop through tickers
         for ticker in tickers:
             data = self._fetch_ohlcv(
-                ticker, freq, start_date, end_date, trials=trials, exch=exch
+                ticker, freq, start_date, end_date, trials=trials, exch=exch, shards=shards
             )
-            sleep(pause)
             self.data_resp.append(data)
             pbar.update(1)
 
@@ -694,6 +1154,7 @@ class CCXT(Library):
         exch: str,
         trials: int = 3,
         pause: int = 1,
+        close_exch: bool = True,
     ) -> Union[List, None]:
         """
         Fetches funding rates data for a specific ticker.
@@ -709,7 +1170,10 @@ class CCXT(Library):
         trials: int, default 3
             Number of attempts to fetch data.
         pause: int, default 1
-            Pause in seconds to respect the rate limit.
+            Maximum delay in seconds when backing off after a failed request.
+        close_exch: bool, default True
+            Closes the async exchange connection once the data is fetched. Set to False when the exchange
+            instance is shared by concurrent fetches.
 
         Returns
         -------
@@ -720,15 +1184,19 @@ class CCXT(Library):
         data_resp = []
 
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        self._get_exchange_async(exch)
 
         # fetch data
         if self.exchange_async.has["fetchFundingRateHistory"]:
+            # rate limiter shared by all requests to the exchange
+            rate_limiter = self._get_rate_limiter(self.exchange_async)
+
             # while loop to get all data
             while start_date < end_date and attempts < trials:
                 try:
-                    data = await self.exchange_async.fetch_funding_rate_history(
+                    data = await self._fetch_page_async(
+                        rate_limiter,
+                        "fetch_funding_rate_history",
                         ticker,
                         since=start_date,
                         limit=self.max_obs_per_call,
@@ -755,12 +1223,13 @@ class CCXT(Library):
                         )
                         break
 
-                finally:
+                    # back off before retrying
                     await self.exponential_backoff_with_jitter_async(
                         self.exchange_async.rateLimit / 1000, pause, attempts
                     )
 
-            await self.exchange_async.close()
+            if close_exch:
+                await self.exchange_async.close()
             return data_resp
 
         else:
@@ -792,7 +1261,7 @@ class CCXT(Library):
         trials: int, default 3
             Number of attempts to fetch data.
         pause: int, default 1
-            Pause in seconds to respect the rate limit.
+            Maximum delay in seconds when backing off after a failed request.
 
         Returns
         -------
@@ -803,15 +1272,19 @@ class CCXT(Library):
         data_resp = []
 
         # inst exch
-        if self.exchange is None:
-            self.exchange = getattr(ccxt, exch)()
+        self._get_exchange(exch)
 
         # fetch data
         if self.exchange.has["fetchFundingRateHistory"]:
+            # rate limiter shared by all requests to the exchange
+            rate_limiter = self._get_rate_limiter(self.exchange)
+
             # while loop to get all data
             while start_date < end_date and attempts < trials:
                 try:
-                    data = self.exchange.fetch_funding_rate_history(
+                    data = self._fetch_page(
+                        rate_limiter,
+                        "fetch_funding_rate_history",
                         ticker,
                         since=start_date,
                         limit=self.max_obs_per_call,
@@ -838,7 +1311,7 @@ class CCXT(Library):
                         )
                         break
 
-                finally:
+                    # back off before retrying
                     self.exponential_backoff_with_jitter(
                         self.exchange.rateLimit / 1000, pause, attempts
                     )
@@ -857,6 +1330,7 @@ class CCXT(Library):
         exch: str,
         trials: int = 3,
         pause: int = 1,
+        max_concurrency: Optional[int] = None,
     ) -> Union[List, None]:
         """
         Fetches funding rates data for a list of tickers.
@@ -874,7 +1348,9 @@ class CCXT(Library):
         trials: int, default 3
             Number of attempts to fetch data.
         pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+            Not used, requests are throttled by the exchange's rate limit.
+        max_concurrency: int, optional, default None
+            Maximum number of markets fetched concurrently. If None, it is sized from the exchange's rate limit.
 
         Returns
         -------
@@ -882,22 +1358,18 @@ class CCXT(Library):
             List of lists of dictionaries with timestamps and funding rates data for each ticker.
         """
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
-
-        # create progress bar
-        pbar = tqdm(total=len(tickers), desc="Fetching funding rates", unit="ticker")
-
-        # loop through tickers
-        for ticker in tickers:
-            data = await self._fetch_funding_rates_async(
-                ticker, start_date, end_date, trials=trials, exch=exch
-            )
-            self.data_resp.append(data)
-            pbar.update(1)
-            await asyncio.sleep(pause)
-
-        await self.exchange_async.close()
+        self._get_exchange_async(exch)
+
+        # fetch tickers concurrently
+        data_resp = await self._fetch_all_async(
+            lambda ticker: self._fetch_funding_rates_async(
+                ticker, start_date, end_date, trials=trials, exch=exch, close_exch=False
+            ),
+            tickers,
+            desc="Fetching funding rates",
+            max_concurrency=max_concurrency,
+        )
+        self.data_resp.extend(data_resp)
 
         return self.data_resp
 
@@ -926,7 +1398,7 @@ class CCXT(Library):
         trials: int, default 3
             Number of attempts to fetch data.
         pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+            Not used, requests are throttled by the exchange's rate limit.
 
         Returns
         -------
@@ -935,8 +1407,7 @@ class CCXT(Library):
         """
 
         # inst exch
-        if self.exchange is None:
-            self.exchange = getattr(ccxt, exch)()
+        self._get_exchange(exch)
 
         # create progress bar
         pbar = tqdm(total=len(tickers), desc="Fetching funding rates", unit="ticker")
@@ -948,7 +1419,6 @@ class CCXT(Library):
             )
             self.data_resp.append(data)
             pbar.update(1)
-            sleep(pause)
 
         return self.data_resp
 
@@ -961,6 +1431,7 @@ class CCXT(Library):
         exch: str,
         trials: int = 3,
         pause: int = 1,
+        close_exch: bool = True,
     ) -> Union[List, None]:
         """
         Fetches open interest data for a specific ticker.
@@ -980,7 +1451,10 @@ class CCXT(Library):
         trials: int, default 3
             Number of attempts to fetch data.
         pause: int, default 1
-            Pause in seconds to respect the rate limit.
+            Maximum delay in seconds when backing off after a failed request.
+        close_exch: bool, default True
+            Closes the async exchange connection once the data is fetched. Set to False when the exchange
+            instance is shared by concurrent fetches.
 
         Returns
         -------
@@ -992,17 +1466,22 @@ class CCXT(Library):
         data_resp = []
 
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
+        self._get_exchange_async(exch)
 
         # fetch data
         if self.exchange_async.has["fetchOpenInterestHistory"]:
+            # rate limiter shared by all requests to the exchange
+            rate_limiter = self._get_rate_limiter(self.exchange_async)
+
             # while loop to get all data
             while start_date < end_date and attempts < trials:
                 try:
-                    data = await self.exchange_async.fetch_open_interest_history(
+                    data = await self._fetch_page_async(
+                        rate_limiter,
+                        "fetch_open_interest_history",
                         ticker,
                         freq,
+                        freq=freq,
                         since=start_date,
                         limit=500,
                         params={"until": end_date},
@@ -1028,12 +1507,13 @@ class CCXT(Library):
                         )
                         break
 
-                finally:
+                    # back off before retrying
                     await self.exponential_backoff_with_jitter_async(
                         self.exchange_async.rateLimit / 1000, pause, attempts
                     )
 
-            await self.exchange_async.close()
+            if close_exch:
+                await self.exchange_async.close()
             return data_resp
 
         else:
@@ -1070,7 +1550,7 @@ class CCXT(Library):
         trials: int, default 3
             Number of attempts to fetch data.
         pause: int, default 1
-            Pause in seconds to respect the rate limit.
+            Maximum delay in seconds when backing off after a failed request.
 
         Returns
         -------
@@ -1082,16 +1562,22 @@ class CCXT(Library):
         data_resp = []
 
         # inst exch
-        self.exchange = getattr(ccxt, exch)()
+        self._get_exchange(exch)
 
         # fetch data
         if self.exchange.has["fetchOpenInterestHistory"]:
+            # rate limiter shared by all requests to the exchange
+            rate_limiter = self._get_rate_limiter(self.exchange)
+
             # while loop to get all data
             while start_date < end_date and attempts < trials:
                 try:
-                    data = self.exchange.fetch_open_interest_history(
+                    data = self._fetch_page(
+                        rate_limiter,
+                        "fetch_open_interest_history",
                         ticker,
                         freq,
+                        freq=freq,
                         since=start_date,
                         limit=500,
                         params={"until": end_date},
@@ -1117,7 +1603,7 @@ class CCXT(Library):
                         )
                         break
 
-                finally:
+                    # back off before retrying
                     self.exponential_backoff_with_jitter(
                         self.exchange.rateLimit / 1000, pause, attempts
                     )
@@ -1137,6 +1623,7 @@ class CCXT(Library):
         exch: str,
         trials: int = 3,
         pause: int = 1,
+        max_concurrency: Optional[int] = None,
     ) -> Union[List, None]:
         """
         Fetches open interest data for a list of tickers.
@@ -1156,7 +1643,9 @@ class CCXT(Library):
         trials: int, default 3
             Number of attempts to fetch data.
         pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+            Not used, requests are throttled by the exchange's rate limit.
+        max_concurrency: int, optional, default None
+            Maximum number of markets fetched concurrently. If None, it is sized from the exchange's rate limit.
 
         Returns
         -------
@@ -1164,22 +1653,18 @@ class CCXT(Library):
             List of lists of dictionaries with timestamps and open interest data for each ticker.
         """
         # inst exch
-        if self.exchange_async is None:
-            self.exchange_async = getattr(ccxt_async, exch)()
-
-        # create progress bar
-        pbar = tqdm(total=len(tickers), desc="Fetching open interest", unit="ticker")
-
-        # loop through tickers
-        for ticker in tickers:
-            data = await self._fetch_open_interest_async(
-                ticker, freq, start_date, end_date, trials=trials, exch=exch
-            )
-            self.data_resp.append(data)
-            pbar.update(1)
-            await asyncio.sleep(pause)
-
-        await self.exchange_async.close()
+        self._get_exchange_async(exch)
+
+        # fetch tickers concurrently
+        data_resp = await self._fetch_all_async(
+            lambda ticker: self._fetch_open_interest_async(
+                ticker, freq, start_date, end_date, trials=trials, exch=exch, close_exch=False
+            ),
+            tickers,
+            desc="Fetching open interest",
+            max_concurrency=max_concurrency,
+        )
+        self.data_resp.extend(data_resp)
 
         return self.data_resp
 
@@ -1211,7 +1696,7 @@ class CCXT(Library):
         trials: int, default 3
             Number of attempts to fetch data.
         pause: int, default 0.5
-            Pause in seconds to respect the rate limit.
+            Not used, requests are throttled by the exchange's rate limit.
 
         Returns
         -------
@@ -1219,8 +1704,7 @@ class CCXT(Library):
             List of lists of dictionaries with timestamps and open interest data for each ticker.
         """
         # inst exch
-        if self.exchange is None:
-            self.exchange = getattr(ccxt, exch)()
+        self._get_exchange(exch)
 
         # create progress bar
         pbar = tqdm(total=len(tickers), desc="Fetching open interest", unit="ticker")
@@ -1232,7 +1716,6 @@ class CCXT(Library):
             )
             self.data_resp.append(data)
             pbar.update(1)
-            sleep(pause)
 
         return self.data_resp
 
@@ -1389,6 +1872,7 @@ class CCXT(Library):
             self.data_req.exch,
             trials=self.data_req.trials,
             pause=self.data_req.pause,
+            shards=self.data_req.shards,
         )
 
         # wrangle df
@@ -1429,6 +1913,7 @@ class CCXT(Library):
             self.data_req.exch,
             trials=self.data_req.trials,
             pause=self.data_req.pause,
+            shards=self.data_req.shards,
         )
 
         # wrangle df
@@ -1,3 +1,4 @@
+import logging
 from typing import Dict, List, Optional
 
 import dbnomics
@@ -7,7 +8,9 @@ from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.libraries.library import Library
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData
+from cryptodatapy.util.concurrency import thread_map
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.ratelimit import get_rate_limiter
 
 # data credentials
 data_cred = DataCredentials()
@@ -87,6 +90,7 @@ class DBnomics(Library):
             self.categories = ["macro"]
         if fields is None:
             self.fields = self.get_fields_info()
+        self.rate_limiter = get_rate_limiter("dbnomics")
 
     @staticmethod
     def get_vendors_info():
@@ -213,7 +217,8 @@ class DBnomics(Library):
         df: pd.DataFrame
             Dataframe with DatetimeIndex and field values (col) wrangled into tidy data format.
         """
-        # get entire data history
+        # get entire data history, the rate limiter paces concurrent requests
+        self.rate_limiter.acquire()
         df = self.get_series(ticker)
         # wrangle df
         df = self.wrangle_data_resp(data_req, df)
@@ -264,23 +269,26 @@ class DBnomics(Library):
         # check params
         self.check_params(data_req)
 
-        # emtpy df
-        df = pd.DataFrame()
-
-        # get data from dbnomics
-        for db_ticker, dr_ticker in zip(db_data_req["tickers"], data_req.tickers):
-
-            # loop through tickers
-            df0 = self.get_tidy_data(data_req, db_ticker)
-
+        # source tickers to request, with tickers to add to index
+        if data_req.source_tickers is None:
+            items = list(zip(db_data_req["tickers"], data_req.tickers))
+        else:
+            items = [(db_ticker, db_ticker) for db_ticker in db_data_req["tickers"]]
+
+        def get_ticker(item):
+            db_ticker, ticker = item
+            try:
+                df0 = self.get_tidy_data(data_req, db_ticker)
+            except Exception as e:
+                logging.warning(f"Failed to get data for {db_ticker}: {e}.")
+                return None
             # add ticker to index
-            if data_req.source_tickers is None:
-                df0["ticker"] = dr_ticker
-            else:
-                df0["ticker"] = db_ticker
-            df0.set_index(["ticker"], append=True, inplace=True)
-            # stack ticker dfs
-            df = pd.concat([df, df0])
+            df0["ticker"] = ticker
+            return df0.set_index(["ticker"], append=True)
+
+        # get data from dbnomics, concurrently if max_workers is set
+        dfs = [df0 for df0 in thread_map(get_ticker, items, data_req.max_workers) if df0 is not None]
+        df = pd.concat(dfs) if dfs else pd.DataFrame()
 
         # check if df empty
         if df.empty:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import pandas as pd
 import yfinance as yf
@@ -10,7 +10,9 @@ from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.libraries.library import Library
 from cryptodatapy.transform.convertparams import ConvertParams
 from cryptodatapy.transform.wrangle import WrangleData
+from cryptodatapy.util.concurrency import thread_map
 from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.ratelimit import get_rate_limiter
 
 # data credentials
 data_cred = DataCredentials()
@@ -251,6 +253,36 @@ class PandasDataReader(Library):
 
         return self.data_req
 
+    def get_tickers(self, fetch: Callable[[str], pd.DataFrame], tickers: List[str]) -> List[Optional[pd.DataFrame]]:
+        """
+        Fetches each ticker, concurrently if max_workers is set in the data request, paced by the data source's rate
+        limiter.
+
+        Parameters
+        ----------
+        fetch: callable
+            Function which fetches the data for a ticker.
+        tickers: list
+            Tickers in data source format.
+
+        Returns
+        -------
+        dfs: list
+            Dataframes in the same order as tickers, None for tickers which failed.
+        """
+        rate_limiter = get_rate_limiter(f"pdr:{self.data_req.source}")
+
+        def get_ticker(ticker):
+            rate_limiter.acquire()
+            try:
+                return fetch(ticker)
+            except Exception as e:
+                logging.warning(e)
+                logging.warning(f"Failed to get data for source ticker: {ticker}.")
+                return None
+
+        return thread_map(get_ticker, tickers, self.data_req.max_workers)
+
     def get_series(self, data_req: DataRequest) -> pd.DataFrame:
         """
         Gets series from python client.
@@ -280,35 +312,43 @@ class PandasDataReader(Library):
 
             # alpha vantage
             elif self.data_req.source == "alphavantage":
-                for ticker, market in zip(self.data_req.source_tickers, self.data_req.source_markets):
-                    df1 = web.DataReader(market,
-                                         self.data_req.source_freq,
-                                         self.data_req.source_start_date,
-                                         self.data_req.source_end_date,
-                                         api_key=self.api_key)
-                    df1.index.name = 'date'
-                    df1['ticker'] = ticker
-                    df1.set_index(['ticker'], append=True, inplace=True)
-                    # concat df and df1
-                    self.data = pd.concat([self.data, df1])
+                dfs = self.get_tickers(
+                    lambda market: web.DataReader(market,
+                                                  self.data_req.source_freq,
+                                                  self.data_req.source_start_date,
+                                                  self.data_req.source_end_date,
+                                                  api_key=self.api_key),
+                    self.data_req.source_markets
+                )
+                for ticker, df1 in zip(self.data_req.source_tickers, dfs):
+                    if df1 is not None:
+                        df1.index.name = 'date'
+                        df1['ticker'] = ticker
+                        df1.set_index(['ticker'], append=True, inplace=True)
+                # concat df and df1
+                self.data = pd.concat([self.data] + [df1 for df1 in dfs if df1 is not None])
 
             # fama-french
             elif data_req.source == "famafrench":
-                for ticker in self.data_req.source_tickers:
-                    df1 = web.DataReader(ticker,
-                                         self.data_req.source,
-                                         self.data_req.source_start_date,
-                                         self.data_req.source_end_date)
-                    self.data = pd.concat([self.data, df1[0]], axis=1)
+                dfs = self.get_tickers(
+                    lambda ticker: web.DataReader(ticker,
+                                                  self.data_req.source,
+                                                  self.data_req.source_start_date,
+                                                  self.data_req.source_end_date)[0],
+                    self.data_req.source_tickers
+                )
+                self.data = pd.concat([self.data] + [df1 for df1 in dfs if df1 is not None], axis=1)
 
             # world bank
             elif data_req.source == "wb":
-                for ticker in self.data_req.source_tickers:
-                    df1 = wb.download(indicator=ticker,
-                                      country=self.data_req.countries,
-                                      start=self.data_req.source_start_date,
-                                      end=self.data_req.source_end_date)
-                    self.data = pd.concat([self.data, df1], axis=1)
+                dfs = self.get_tickers(
+                    lambda ticker: wb.download(indicator=ticker,
+                                               country=self.data_req.countries,
+                                               start=self.data_req.source_start_date,
+                                               end=self.data_req.source_end_date),
+                    self.data_req.source_tickers
+                )
+                self.data = pd.concat([self.data] + [df1 for df1 in dfs if df1 is not None], axis=1)
 
             # other pdr data
             else:
@@ -1,2 +1,9 @@
-from cryptodatapy.extract.web.aqr import AQR
-from cryptodatapy.extract.web.web import Web
+from cryptodatapy.util.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "AQR": ".aqr",
+    "Web": ".web",
+    # submodules and subpackages
+    "aqr": ".aqr",
+    "web": ".web",
+})
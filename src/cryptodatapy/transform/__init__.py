@@ -1,2 +1,15 @@
-from cryptodatapy.transform.convertparams import ConvertParams
-from cryptodatapy.transform.wrangle import WrangleInfo, WrangleData
+from cryptodatapy.util.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "ConvertParams": ".convertparams",
+    "WrangleInfo": ".wrangle",
+    "WrangleData": ".wrangle",
+    # submodules and subpackages
+    "clean": ".clean",
+    "convertparams": ".convertparams",
+    "filter": ".filter",
+    "impute": ".impute",
+    "od": ".od",
+    "rolling": ".rolling",
+    "wrangle": ".wrangle",
+})
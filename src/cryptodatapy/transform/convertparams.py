@@ -1,12 +1,12 @@
 import logging
 from datetime import datetime, timedelta
-from importlib import resources
 from typing import Dict, List, Union
 import re
 
 import pandas as pd
 
 from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.util.catalog import get_catalog
 
 
 class ConvertParams:
@@ -301,15 +301,13 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to Tiingo format.
         """
         # tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        catalog = get_catalog()
 
         if self.data_req.source_tickers is None and self.data_req.cat == 'eqty':
             self.data_req.source_tickers = []
             for ticker in self.data_req.tickers:
                 try:
-                    self.data_req.source_tickers.append(tickers_df.loc[ticker, "tiingo_id"])
+                    self.data_req.source_tickers.append(catalog.get_ticker(ticker, "tiingo_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for Tiingo source. Check tickers in"
@@ -493,9 +491,7 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to DBnomics format.
         """
         # convert tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df, tickers = pd.read_csv(tickers_path, index_col=0, encoding="latin1"), []
+        catalog, tickers = get_catalog(), []
 
         if self.data_req.source_tickers is not None:
             tickers = self.data_req.source_tickers
@@ -503,7 +499,7 @@ class ConvertParams:
         else:
             for ticker in self.data_req.tickers:
                 try:
-                    tickers.append(tickers_df.loc[ticker, "dbnomics_id"])
+                    tickers.append(catalog.get_ticker(ticker, "dbnomics_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for DBnomics source. Check tickers in"
@@ -547,9 +543,7 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to InvestPy format.
         """
         # convert tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df, tickers = pd.read_csv(tickers_path, index_col=0, encoding="latin1"), []
+        catalog, tickers = get_catalog(), []
 
         if self.data_req.source_tickers is not None:
             tickers = self.data_req.source_tickers
@@ -557,7 +551,7 @@ class ConvertParams:
         else:
             for ticker in self.data_req.tickers:
                 try:
-                    tickers.append(tickers_df.loc[ticker, "investpy_id"])
+                    tickers.append(catalog.get_ticker(ticker, "investpy_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for InvestPy data source. Check tickers in "
@@ -575,7 +569,7 @@ class ConvertParams:
         ctys_list = []
         for ticker in self.data_req.tickers:
             try:
-                ctys_list.append(tickers_df.loc[ticker, "country_name"].lower())
+                ctys_list.append(catalog.get_ticker(ticker, "country_name").lower())
             except KeyError:
                 logging.warning(
                     f"{ticker} not found for {self.data_req.source} source. Check tickers in "
@@ -629,15 +623,13 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to Fred format.
         """
         # convert tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        catalog = get_catalog()
 
         if self.data_req.source_tickers is None:
             self.data_req.source_tickers = []
             for ticker in self.data_req.tickers:
                 try:
-                    self.data_req.source_tickers.append(tickers_df.loc[ticker, "fred_id"])
+                    self.data_req.source_tickers.append(catalog.get_ticker(ticker, "fred_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for Fred source. Check tickers in"
@@ -675,15 +667,13 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to World Bank format.
         """
         # tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        catalog = get_catalog()
 
         if self.data_req.source_tickers is None:
             self.data_req.source_tickers = []
             for ticker in self.data_req.tickers:
                 try:
-                    self.data_req.source_tickers.append(tickers_df.loc[ticker, "wb_id"])
+                    self.data_req.source_tickers.append(catalog.get_ticker(ticker, "wb_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for World Bank source. Check tickers in"
@@ -707,7 +697,7 @@ class ConvertParams:
         if self.data_req.cat == "macro":
             for ticker in self.data_req.tickers:
                 try:
-                    ctys_list.append(tickers_df.loc[ticker, "country_id_3"].upper())
+                    ctys_list.append(catalog.get_ticker(ticker, "country_id_3").upper())
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for {self.data_req.source} source. Check tickers in "
@@ -738,9 +728,7 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to Yahoo Finance format.
         """
         # tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        catalog = get_catalog()
 
         if self.data_req.source_tickers is None:
             if self.data_req.cat == 'eqty':
@@ -752,7 +740,7 @@ class ConvertParams:
                     self.data_req.tickers = [ticker.upper() for ticker in self.data_req.tickers]
                 for ticker in self.data_req.tickers:
                     try:
-                        self.data_req.source_tickers.append(tickers_df.loc[ticker, "yahoo_id"])
+                        self.data_req.source_tickers.append(catalog.get_ticker(ticker, "yahoo_id"))
                     except KeyError:
                         logging.warning(
                             f"{ticker} not found for Yahoo Finance data source. Check tickers in"
@@ -856,15 +844,13 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to Fama-French format.
         """
         # tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        catalog = get_catalog()
 
         if self.data_req.source_tickers is None:
             self.data_req.source_tickers = []
             for ticker in self.data_req.tickers:
                 try:
-                    self.data_req.source_tickers.append(tickers_df.loc[ticker, "famafrench_id"])
+                    self.data_req.source_tickers.append(catalog.get_ticker(ticker, "famafrench_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for Fama-French source. Check tickers in"
@@ -894,15 +880,13 @@ class ConvertParams:
         Convert tickers from CryptoDataPy to Polygon format.
         """
         # tickers
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        catalog = get_catalog()
 
         if self.data_req.source_tickers is None and self.data_req.cat == 'eqty':
             self.data_req.source_tickers = []
             for ticker in self.data_req.tickers:
                 try:
-                    self.data_req.source_tickers.append(tickers_df.loc[ticker, "polygon_id"])
+                    self.data_req.source_tickers.append(catalog.get_ticker(ticker, "polygon_id"))
                 except KeyError:
                     logging.warning(
                         f"{ticker} not found for Polygon source. Check tickers in"
@@ -1220,12 +1204,7 @@ class ConvertParams:
 
         """
         # fields
-        with resources.path("cryptodatapy.conf", "fields.csv") as f:
-            fields_dict_path = f
-        fields_df, fields_list = (
-            pd.read_csv(fields_dict_path, index_col=0, encoding="latin1"),
-            [],
-        )
+        catalog, fields_list = get_catalog(), []
 
         # when source fields already provided in data req
         if self.data_req.source_fields is not None:
@@ -1235,7 +1214,7 @@ class ConvertParams:
         else:
             for field in self.data_req.fields:
                 try:
-                    fields_list.append(fields_df.loc[field, data_source + "_id"])
+                    fields_list.append(catalog.get_field(field, data_source + "_id"))
                 except KeyError as e:
                     logging.warning(e)
                     logging.warning(
@@ -1,12 +1,106 @@
+import hashlib
+import pickle
+import time
+from functools import partial
+from multiprocessing import shared_memory
+
 import numpy as np
 import pandas as pd
-from typing import Dict, Optional, Union
-from prophet import Prophet
-from statsmodels.tsa.seasonal import STL, seasonal_decompose
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+from cryptodatapy.transform.rolling import rolling_mean, rolling_median, rolling_quantiles, rolling_std
+from cryptodatapy.util.cache import ResponseCache, get_cache, make_key
+from cryptodatapy.util.concurrency import process_map
 
 np.float_ = np.float64
 
 
+def _decompose(
+        values: np.ndarray,
+        resid: np.ndarray,
+        trend: np.ndarray,
+        cols: Sequence[int],
+        method: str,
+        params: dict
+) -> None:
+    """
+    Decomposes columns of a (time x series) array over their non-missing values, and writes the residual and trend
+    components into the same rows and columns of the resid and trend arrays.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        2D array of series values, with dates (rows) and series (cols).
+    resid: np.ndarray
+        2D array, same shape as values, into which residuals are written.
+    trend: np.ndarray
+        2D array, same shape as values, into which trends are written.
+    cols: sequence of int
+        Indices of the columns to decompose.
+    method: str, {'stl', 'seasonal_decomp'}
+        Statsmodels decomposition method.
+    params: dict
+        Parameters of the decomposition method.
+    """
+    # imported on use to keep package import fast
+    from statsmodels.tsa.seasonal import STL, seasonal_decompose
+
+    for col in cols:
+        obs = ~np.isnan(values[:, col])
+        if method == "stl":
+            res = STL(values[obs, col], **params).fit()
+            resid_vals, trend_vals = res.resid, res.trend
+        else:
+            res = seasonal_decompose(values[obs, col], **params)
+            resid_vals = np.where(np.isnan(res.resid), 0, res.resid)
+            trend_vals = pd.Series(res.trend).ffill().to_numpy()
+        resid[obs, col], trend[obs, col] = resid_vals, trend_vals
+
+
+def _decompose_shared(name: str, shape: Tuple[int, int], method: str, params: dict, cols: Sequence[int]) -> None:
+    """
+    Decomposes columns of the values array held in a shared memory block, in a worker process.
+
+    The block holds 3 float arrays of the given shape: values, residuals and trends. Workers write to disjoint
+    columns of the residuals and trends, so they need no locking and nothing is sent back to the parent process.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    arr = np.ndarray((3,) + tuple(shape), dtype=np.float64, buffer=shm.buf)
+    try:
+        _decompose(arr[0], arr[1], arr[2], cols, method, params)
+    finally:
+        del arr
+        shm.close()
+
+
+def _fit_prophet(item: Tuple[np.ndarray, np.ndarray, dict]) -> Tuple[np.ndarray, float]:
+    """
+    Fits a Prophet model to a series and forecasts it over the same dates, in a worker process.
+
+    Parameters
+    ----------
+    item: tuple
+        Dates, values (NaN where missing) and parameters of the Prophet model.
+
+    Returns
+    -------
+    fcst: np.ndarray
+        2D array of forecasts, with yhat, yhat_lower and yhat_upper (rows) for each date (cols).
+    fit_time: float
+        Seconds taken to fit and forecast.
+    """
+    # imported on use to keep package import fast
+    from prophet import Prophet
+
+    dates, values, params = item
+    start = time.perf_counter()
+    df1 = pd.DataFrame({"ds": dates, "y": values})
+    m = Prophet(**params).fit(df1)
+    pred = m.predict(df1)
+
+    return pred[["yhat", "yhat_lower", "yhat_upper"]].to_numpy().T, time.perf_counter() - start
+
+
 class OutlierDetection:
     """
     Detects outliers.
@@ -19,7 +113,8 @@ class OutlierDetection:
                  model_type: str = 'estimation',
                  thresh_val: int = 5,
                  plot: bool = False,
-                 plot_series: tuple = ('BTC', 'close')
+                 plot_series: tuple = ('BTC', 'close'),
+                 max_workers: Optional[int] = None
                  ):
         """
         Constructor
@@ -45,6 +140,9 @@ class OutlierDetection:
             Plots series with outliers highlighted with red dots.
         plot_series: tuple, default ('BTC', 'close')
             Plots the time series of a specific (ticker, field/column) tuple.
+        max_workers: int, optional, default None
+            Maximum number of processes over which the per-series model fits of the stl, seasonal_decomp and prophet
+            methods are spread. If None, series are fit one at a time in the calling process.
         """
         self.raw_df = raw_df
         self.excl_cols = excl_cols
@@ -54,10 +152,13 @@ class OutlierDetection:
         self.thresh_val = thresh_val
         self.plot = plot
         self.plot_series = plot_series
+        self.max_workers = max_workers
         self.df = raw_df.copy() if excl_cols is None else raw_df.drop(columns=excl_cols).copy()
         self.yhat = None
         self.outliers = None
         self.filtered_df = None
+        self.fit_times = None
+        self.calendars = None
         self.log_transform()
 
     def log_transform(self) -> None:
@@ -70,6 +171,156 @@ class OutlierDetection:
             # log and replace inf
             self.df = np.log(self.df).replace([np.inf, -np.inf], np.nan)
 
+    def unstack(self) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Unstacks the dataframe to a wide dataframe and its 2D values array, with dates (rows) and
+        (field, ticker) series (cols), on which rolling statistics are computed for all series at once.
+
+        Tickers observed on different dates, e.g. equities on weekdays and cryptoassets every day, are grouped by
+        calendar in the calendars attribute, see by_calendar.
+
+        Returns
+        -------
+        wide_df: pd.DataFrame
+            Unstacked dataframe with DatetimeIndex and (field, ticker) MultiIndex cols.
+        values: np.ndarray
+            Float values of the unstacked dataframe.
+        """
+        wide_df = self.df.unstack()
+
+        # dates on which each ticker is observed, from the index codes
+        idx = self.df.index
+        tickers = wide_df.columns.get_level_values(-1).unique()
+        dates = wide_df.index.get_indexer(idx.levels[0])[idx.codes[0]]
+        obs = np.zeros((len(wide_df.index), len(tickers)), dtype=bool)
+        obs[dates, tickers.get_indexer(idx.levels[1])[idx.codes[1]]] = True
+
+        # group tickers by calendar, None if all tickers are observed on all dates
+        self.calendars = None
+        if not obs.all():
+            cals, cal_idx = np.unique(obs.T, axis=0, return_inverse=True)
+            self.calendars = [(np.flatnonzero(cal), tickers[cal_idx.ravel() == i]) for i, cal in enumerate(cals)]
+
+        return wide_df, wide_df.to_numpy(dtype=np.float64)
+
+    def by_calendar(self, func: Callable, values: np.ndarray, cols: pd.Index) -> np.ndarray:
+        """
+        Applies a function to the series of each calendar of the unstacked dataframe, over the dates on which their
+        tickers are observed, e.g. so that rolling windows span window_size observations of every ticker.
+
+        Parameters
+        ----------
+        func: callable
+            Function of a 2D array with dates (rows) and series (cols), returning an array with the same shape
+            in the last 2 dimensions, e.g. rolling_mean.
+        values: np.ndarray
+            2D array with dates (rows) and series (cols) of the unstacked dataframe.
+        cols: pd.Index
+            Series of the values array, tickers or (field, ticker) MultiIndex.
+
+        Returns
+        -------
+        res: np.ndarray
+            Result of the function, NaN on the dates on which a ticker isn't observed.
+        """
+        if self.calendars is None:
+            return func(values)
+
+        tickers, res = cols.get_level_values(-1), None
+        for rows, cal_tickers in self.calendars:
+            idx = np.ix_(rows, np.flatnonzero(tickers.isin(cal_tickers)))
+            cal_res = func(values[idx])
+            if res is None:
+                res = np.full(cal_res.shape[:-2] + values.shape, np.nan)
+            res[(Ellipsis,) + idx] = cal_res
+
+        return res
+
+    def stack(self, values: np.ndarray, wide_df: pd.DataFrame, fill_value=np.nan) -> pd.DataFrame:
+        """
+        Stacks a 2D array with the shape of the unstacked dataframe back to the index of the dataframe.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            2D array with dates (rows) and (field, ticker) series (cols).
+        wide_df: pd.DataFrame
+            Unstacked dataframe.
+        fill_value: scalar, default np.nan
+            Value for (date, ticker) rows which are missing from the unstacked dataframe.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            Dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols).
+        """
+        # unstacked cols are the (field, ticker) product, reshape to (date, ticker) rows and field cols
+        cols = wide_df.columns
+        tickers = cols.get_level_values(1).unique()
+        fields = cols.get_level_values(0)[::len(tickers)] if len(tickers) else cols.get_level_values(0)
+        if cols.equals(pd.MultiIndex.from_product([fields, tickers])):
+            values = values.reshape(len(wide_df.index), len(fields), len(tickers)).transpose(0, 2, 1)
+            idx = pd.MultiIndex.from_product([wide_df.index, tickers], names=self.df.index.names)
+            # compare levels and codes, equals() would build every (date, ticker) tuple
+            if idx.equal_levels(self.df.index) and len(idx) == len(self.df.index) and \
+                    all(np.array_equal(a, b) for a, b in zip(idx.codes, self.df.index.codes)):
+                idx = self.df.index
+            df = pd.DataFrame(values.reshape(len(idx), len(fields)), index=idx, columns=fields)
+        else:
+            df = pd.DataFrame(values, index=wide_df.index, columns=cols).stack(future_stack=True)
+
+        if df.index is self.df.index:
+            return df
+
+        return df.reindex(self.df.index, fill_value=fill_value)
+
+    def roll(
+            self,
+            func: Callable,
+            values: np.ndarray,
+            cols: pd.Index,
+            min_periods: Optional[int] = None,
+            **kwargs
+    ) -> np.ndarray:
+        """
+        Applies a rolling function to each series of a 2D array, with the window of the model type, over the
+        dates on which the series' ticker is observed.
+
+        Estimation model windows end (window_size + 1) / 2 observations after each observation, and need at least
+        one value. Prediction model windows end at each observation.
+
+        Parameters
+        ----------
+        func: callable
+            Rolling function, e.g. rolling_median.
+        values: np.ndarray
+            2D array with dates (rows) and series (cols) of the unstacked dataframe.
+        cols: pd.Index
+            Series of the values array, tickers or (field, ticker) MultiIndex.
+        min_periods: int, optional, default None
+            Minimum number of values in the windows of prediction models. If None, defaults to the window size.
+
+        Other Parameters
+        ----------------
+        kwargs:
+            Passed to the rolling function, e.g. qs for rolling_quantiles.
+
+        Returns
+        -------
+        stat: np.ndarray
+            Array with the same shape as values.
+        """
+        if self.model_type == "estimation":
+            min_periods = 1
+
+        def roll_values(vals: np.ndarray) -> np.ndarray:
+            if self.model_type == "estimation":
+                lead = min(int((self.window_size + 1) / 2), vals.shape[0])
+                vals = np.vstack([vals[lead:], np.full((lead, vals.shape[1]), np.nan)])
+            return func(vals, self.window_size, min_periods=min_periods, **kwargs)
+
+        return self.by_calendar(roll_values, values, cols)
+
     def atr(self) -> pd.DataFrame:
         """
         Detects outliers using OHLC values and H-L range.
@@ -83,57 +334,34 @@ class OutlierDetection:
         if not all(col in self.df.columns for col in ["open", "high", "low", "close"]):
             raise Exception("Dataframe must have OHLC prices to compute ATR.")
 
-        # df copy
-        df0 = self.df.copy()
+        # unstack
+        wide_df, vals = self.unstack()
+        high, low, close = (wide_df[col].to_numpy(dtype=np.float64) for col in ["high", "low", "close"])
+        tickers = wide_df["close"].columns
 
-        # compute true range
-        df0["hl"], df0["hc"], df0["lc"] = (
-            (df0.high - df0.low).abs(),
-            (df0.high - df0.close.groupby(level=1).shift(1)).abs(),
-            (df0.low - df0.close.groupby(level=1).shift(1)).abs(),
-        )
-        df0["tr"] = df0.loc[:, "hl":"lc"].max(axis=1)
+        # compute true range, with the previous observed close
+        prev_close = self.by_calendar(lambda x: np.vstack([np.full((1, x.shape[1]), np.nan), x[:-1]]), close, tickers)
+        tr = np.fmax(np.fmax(np.abs(high - low), np.abs(high - prev_close)), np.abs(low - prev_close))
 
         # compute ATR for estimation and prediction models
         if self.model_type == "estimation":
-            df0["atr"] = (
-                df0.tr.groupby(level=1)
-                .shift(-1 * int((self.window_size + 1) / 2))
-                .sort_index(level=1)
-                .rolling(self.window_size, min_periods=1)
-                .mean()
-                .sort_index()
-            )
-            med = (
-                df0.groupby(level=1)
-                .shift(-1 * int((self.window_size + 1) / 2))
-                .sort_index(level=1)
-                .rolling(self.window_size, min_periods=1)
-                .median()
-                .sort_index()
-            )
+            atr = self.roll(rolling_mean, tr, tickers)
         else:
-            df0["atr"] = (
-                df0.tr.groupby(level=1).ewm(span=self.window_size).mean().droplevel(0)
-            )
-            med = (
-                df0.groupby(level=1)
-                .rolling(self.window_size)
-                .median()
-                .droplevel(0)
-            )
-
-        # compute dev and score for outliers
-        dev = df0 - med
-        score = dev.divide(df0.atr, axis=0)
+            atr = self.by_calendar(lambda x: pd.DataFrame(x).ewm(span=self.window_size).mean().to_numpy(), tr, tickers)
+        med = self.roll(rolling_median, vals, wide_df.columns)
+
+        # compute dev and score for outliers, with the ATR of each series' ticker
+        atr = atr[:, tickers.get_indexer(wide_df.columns.get_level_values(-1))]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            score = np.abs(vals - med) / atr
 
         # outliers
-        self.outliers = self.df[score.abs() > self.thresh_val].sort_index()
-        self.filtered_df = self.df[score.abs() < self.thresh_val].sort_index()
+        self.outliers = self.df[self.stack(score > self.thresh_val, wide_df, False)].sort_index()
+        self.filtered_df = self.df[self.stack(score < self.thresh_val, wide_df, False)].sort_index()
 
         # log to original scale
         if self.log:
-            self.yhat = np.exp(med).sort_index()
+            self.yhat = np.exp(self.stack(med, wide_df)).sort_index()
 
         # plot
         if self.plot:
@@ -156,51 +384,23 @@ class OutlierDetection:
         filtered_df: pd.DataFrame - MultiIndex
             Filtered dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols) with outliers removed.
         """
-        # sort index
-        df0 = self.df.sort_index(level=1)
+        # unstack
+        wide_df, vals = self.unstack()
 
         # compute 75th, 50th and 25th percentiles for estimation and prediction models
-        if self.model_type == "estimation":
-            perc_75th = (
-                df0.groupby(level=1)
-                .shift(-1 * int((self.window_size + 1) / 2))
-                .sort_index(level=1)
-                .rolling(self.window_size, min_periods=1)
-                .quantile(0.75)
-            )
-            perc_25th = (
-                df0.groupby(level=1)
-                .shift(-1 * int((self.window_size + 1) / 2))
-                .sort_index(level=1)
-                .rolling(self.window_size, min_periods=1)
-                .quantile(0.25)
-            )
-            med = (
-                df0.groupby(level=1)
-                .shift(-1 * int((self.window_size + 1) / 2))
-                .sort_index(level=1)
-                .rolling(self.window_size, min_periods=1)
-                .median()
-            )
-        else:
-            perc_75th = (
-                df0.groupby(level=1).rolling(self.window_size).quantile(0.75).droplevel(0)
-            )
-            perc_25th = (
-                df0.groupby(level=1).rolling(self.window_size).quantile(0.25).droplevel(0)
-            )
-            med = df0.groupby(level=1).rolling(self.window_size).median().droplevel(0)
+        perc_25th, med, perc_75th = self.roll(rolling_quantiles, vals, wide_df.columns, qs=[0.25, 0.5, 0.75])
 
         # compute iqr and upper/lower thresholds
         iqr = perc_75th - perc_25th
-        upper = perc_75th.add(self.thresh_val * iqr, axis=1)
-        lower = perc_25th.subtract(self.thresh_val * iqr, axis=1)
+        upper = perc_75th + self.thresh_val * iqr
+        lower = perc_25th - self.thresh_val * iqr
 
         # detect outliers
-        out_df = self.df[(df0 > upper) | (df0 < lower)]
-        filt_df = self.df[(df0 < upper) & (df0 > lower)]
+        out_df = self.df[self.stack((vals > upper) | (vals < lower), wide_df, False)]
+        filt_df = self.df[self.stack((vals < upper) & (vals > lower), wide_df, False)]
 
         # log to original scale
+        med = self.stack(med, wide_df)
         if self.log:
             med = np.exp(med)
 
@@ -230,32 +430,25 @@ class OutlierDetection:
         filtered_df: pd.DataFrame - MultiIndex
             Filtered dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols) with outliers removed.
         """
-        # sort index and create df copy
-        df0 = self.df.sort_index(level=1).copy()
+        # unstack
+        wide_df, vals = self.unstack()
 
         # compute median for estimation and prediction models
-        if self.model_type == "estimation":
-            med = (
-                df0.groupby(level=1)
-                .shift(-1 * int((self.window_size + 1) / 2))
-                .sort_index(level=1)
-                .rolling(self.window_size, min_periods=1)
-                .median()
-            )
-        else:
-            med = df0.groupby(level=1).rolling(self.window_size).median().droplevel(0)
+        med = self.roll(rolling_quantiles, vals, wide_df.columns, qs=[0.5])[0]
 
         # compute dev, mad, upper/lower thresholds
-        dev = df0 - med
-        mad = dev.abs().groupby(level=1).rolling(self.window_size).median().droplevel(0)
-        upper = med.add(self.thresh_val * mad, axis=1)
-        lower = med.subtract(self.thresh_val * mad, axis=1)
+        dev = vals - med
+        mad = self.by_calendar(lambda x: rolling_quantiles(x, self.window_size, [0.5])[0], np.abs(dev),
+                               wide_df.columns)
+        upper = med + self.thresh_val * mad
+        lower = med - self.thresh_val * mad
 
         # outliers
-        out_df = self.df[(df0 > upper) | (df0 < lower)]
-        filt_df = self.df[(df0 < upper) & (df0 > lower)]
+        out_df = self.df[self.stack((vals > upper) | (vals < lower), wide_df, False)]
+        filt_df = self.df[self.stack((vals < upper) & (vals > lower), wide_df, False)]
 
         # log to original scale
+        med = self.stack(med, wide_df)
         if self.log:
             med = np.exp(med)
 
@@ -289,47 +482,23 @@ class OutlierDetection:
         filtered_df: pd.DataFrame - MultiIndex
             Filtered dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols) with outliers removed.
         """
-        # sort index and create copy
-        df0 = self.df.sort_index(level=1).copy()
+        # unstack
+        wide_df, vals = self.unstack()
 
         # compute rolling mean and std for estimation and prediction models
-        if self.model_type == "estimation":
-            roll_mean = (
-                df0.groupby(level=1)
-                .shift(-1 * int((self.window_size + 1) / 2))
-                .sort_index(level=1)
-                .rolling(self.window_size, min_periods=1)
-                .mean()
-            )
-            roll_std = (
-                df0.groupby(level=1)
-                .shift(-1 * int((self.window_size + 1) / 2))
-                .sort_index(level=1)
-                .rolling(self.window_size, min_periods=1)
-                .std()
-            )
-        else:
-            roll_mean = (
-                df0.groupby(level=1)
-                .rolling(self.window_size, min_periods=1)
-                .mean()
-                .droplevel(0)
-            )
-            roll_std = (
-                df0.groupby(level=1)
-                .rolling(self.window_size, min_periods=1)
-                .std()
-                .droplevel(0)
-            )
+        roll_mean = self.roll(rolling_mean, vals, wide_df.columns, min_periods=1)
+        roll_std = self.roll(rolling_std, vals, wide_df.columns, min_periods=1)
 
         # compute z-score and upper/lower thresh
-        z = (df0 - roll_mean) / roll_std
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = np.abs(vals - roll_mean) / roll_std
 
         # outliers
-        out_df = self.df[z.abs() > self.thresh_val]
-        filt_df = self.df[z.abs() < self.thresh_val]
+        out_df = self.df[self.stack(z > self.thresh_val, wide_df, False)]
+        filt_df = self.df[self.stack(z < self.thresh_val, wide_df, False)]
 
         # log to original scale
+        roll_mean = self.stack(roll_mean, wide_df)
         if self.log:
             roll_mean = np.exp(roll_mean)
 
@@ -438,83 +607,10 @@ class OutlierDetection:
         filtered_df: pd.DataFrame - MultiIndex
             Filtered dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols) with outliers removed.
         """
-        # unstack
-        df0 = self.df.unstack().copy()
-        # original idx, unstacked idx
-        mult_idx, idx = self.raw_df.index, self.df.unstack().index
-
-        # store resid dfs in dict
-        resid_dict, yhat_dict = {}, {}
-        for field in df0.columns.get_level_values(0).unique():
-            resid_df, yhat_df = pd.DataFrame(index=idx), pd.DataFrame(index=idx)
-            for ticker in df0[field].columns:
-                # decompose
-                res = seasonal_decompose(
-                    df0[field][ticker].dropna(),
-                    period=period,
-                    model=model,
-                    filt=filt,
-                    two_sided=two_sided,
-                    extrapolate_trend=extrapolate_trend,
-                )
-                resid_vals, trend_vals = res.resid.fillna(0), res.trend.ffill()
-                # add to dfs
-                resid_df = pd.concat(
-                    [resid_df, resid_vals], join="outer", axis=1
-                ).rename(columns={"resid": ticker})
-                yhat_df = pd.concat([yhat_df, trend_vals], join="outer", axis=1).rename(
-                    columns={"trend": ticker}
-                )
-                # convert to datetimeindex and rename
-                resid_df.index, yhat_df.index = pd.to_datetime(
-                    resid_df.index
-                ), pd.to_datetime(yhat_df.index)
-                resid_df.index.name, yhat_df.index.name = "date", "date"
-
-            # normalize resid using mad
-            dev = resid_df - resid_df.median()
-            mad = dev.abs().median()
-            dev_df = dev / mad
+        params = dict(period=period, model=model, filt=filt, two_sided=two_sided,
+                      extrapolate_trend=extrapolate_trend)
 
-            # add fcst and resid dfs to dict
-            resid_dict[field], yhat_dict[field] = dev_df, yhat_df
-
-        # convert dict to multiindex
-        resid_df, yhat_df = pd.concat(resid_dict, axis=1), pd.concat(yhat_dict, axis=1)
-
-        # log to original scale
-        if self.log:
-            yhat_df = np.exp(yhat_df)
-
-        # filter outliers
-        out_df = self.df.unstack()[resid_df.abs() > self.thresh_val]
-        filt_df = self.df.unstack()[resid_df.abs() < self.thresh_val]
-
-        # stack and reindex
-        out_df = out_df.stack(future_stack=True).reindex(mult_idx)
-        filt_df = filt_df.stack(future_stack=True).reindex(mult_idx)
-        yhat_df = yhat_df.stack(future_stack=True).reindex(mult_idx)
-
-        # convert dtypes
-        yhat_df = yhat_df.convert_dtypes()
-        out_df = out_df.convert_dtypes()
-        filt_df = filt_df.convert_dtypes()
-
-        self.yhat = yhat_df.sort_index()
-        self.outliers = out_df.sort_index()
-        self.filtered_df = filt_df.sort_index()
-
-        # plot
-        if self.plot:
-            if not isinstance(self.plot_series, tuple):
-                raise TypeError(
-                    "Plot_series must be a tuple specifying the ticker and column/field to "
-                    "plot (ticker, column)."
-                )
-            else:
-                self.plot_outliers()
-
-        return self.filtered_df
+        return self.decompose("seasonal_decomp", params)
 
     def stl(
         self,
@@ -574,66 +670,72 @@ class OutlierDetection:
         filtered_df: pd.DataFrame - MultiIndex
             Filtered dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols) with outliers removed.
         """
-        # unstack
-        df0 = self.df.unstack().copy()
-        # original idx, unstacked idx
-        mult_idx, idx = self.df.index, self.df.unstack().index
-
-        # store resid dfs in dict
-        resid_dict, yhat_dict = {}, {}
-        for field in df0.columns.get_level_values(0).unique():
-            resid_df, yhat_df = pd.DataFrame(index=idx), pd.DataFrame(index=idx)
-            for ticker in df0[field].columns:
-
-                # decompose
-                res = STL(
-                    df0[field][ticker].dropna(),
-                    period=period,
-                    seasonal=seasonal,
-                    trend=trend,
-                    low_pass=low_pass,
-                    seasonal_deg=seasonal_deg,
-                    trend_deg=trend_deg,
-                    low_pass_deg=low_pass_deg,
-                    robust=robust,
-                    seasonal_jump=seasonal_jump,
-                    trend_jump=trend_jump,
-                    low_pass_jump=low_pass_jump,
-                ).fit()
-                resid_vals, trend_vals, seas_vals = res.resid, res.trend, res.seasonal
-                # add to dfs
-                resid_df = pd.concat(
-                    [resid_df, resid_vals], join="outer", axis=1
-                ).rename(columns={"resid": ticker})
-                yhat_df = pd.concat([yhat_df, trend_vals], join="outer", axis=1).rename(
-                    columns={"trend": ticker}
-                )
-                # convert to datetimeindex and rename
-                resid_df.index, yhat_df.index = pd.to_datetime(
-                    resid_df.index
-                ), pd.to_datetime(yhat_df.index)
-                resid_df.index.name, yhat_df.index.name = "date", "date"
+        params = dict(period=period, seasonal=seasonal, trend=trend, low_pass=low_pass, seasonal_deg=seasonal_deg,
+                      trend_deg=trend_deg, low_pass_deg=low_pass_deg, robust=robust, seasonal_jump=seasonal_jump,
+                      trend_jump=trend_jump, low_pass_jump=low_pass_jump)
+
+        return self.decompose("stl", params)
+
+    def decompose(self, method: str, params: dict) -> pd.DataFrame:
+        """
+        Detects outliers from the residuals of a statsmodels decomposition fit to each (field, ticker) series.
 
-            # normalize resid using mad
-            dev = resid_df - resid_df.median()
-            mad = dev.abs().median()
-            dev_df = dev / mad
+        Series are fit one at a time, or spread over a pool of max_workers processes which read the unstacked
+        values from, and write residuals and trends to, a shared memory block. Both paths assemble the components
+        into the same preallocated arrays, so results are identical.
 
-            # add fcst and resid dfs to dict
-            resid_dict[field], yhat_dict[field] = dev_df, yhat_df
+        Parameters
+        ----------
+        method: str, {'stl', 'seasonal_decomp'}
+            Statsmodels decomposition method.
+        params: dict
+            Parameters of the decomposition method.
 
-        # convert dict to multiindex
-        resid_df, yhat_df = pd.concat(resid_dict, axis=1), pd.concat(yhat_dict, axis=1)
+        Returns
+        -------
+        filtered_df: pd.DataFrame - MultiIndex
+            Filtered dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols) with outliers removed.
+        """
+        # unstack
+        df0 = self.df.unstack()
+        values = df0.to_numpy(dtype=np.float64)
+        cols = np.arange(values.shape[1])
+
+        # decompose
+        if self.max_workers is None or self.max_workers <= 1 or len(cols) <= 1 or values.size == 0:
+            resid, trend = np.full(values.shape, np.nan), np.full(values.shape, np.nan)
+            _decompose(values, resid, trend, cols, method, params)
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=3 * values.nbytes)
+            arr = np.ndarray((3,) + values.shape, dtype=np.float64, buffer=shm.buf)
+            try:
+                arr[0], arr[1:] = values, np.nan
+                chunks = np.array_split(cols, min(len(cols), 4 * self.max_workers))
+                process_map(partial(_decompose_shared, shm.name, values.shape, method, params), chunks,
+                            self.max_workers)
+                resid, trend = arr[1].copy(), arr[2].copy()
+            finally:
+                del arr
+                shm.close()
+                shm.unlink()
+
+        resid_df = pd.DataFrame(resid, index=df0.index, columns=df0.columns)
+        yhat_df = pd.DataFrame(trend, index=df0.index, columns=df0.columns)
+
+        # normalize resid using mad
+        dev = resid_df - resid_df.median()
+        resid_df = dev / dev.abs().median()
 
         # log to original scale
         if self.log:
             yhat_df = np.exp(yhat_df)
 
         # filter outliers
-        out_df = self.df.unstack()[resid_df.abs() > self.thresh_val]
-        filt_df = self.df.unstack()[resid_df.abs() < self.thresh_val]
+        out_df = df0[resid_df.abs() > self.thresh_val]
+        filt_df = df0[resid_df.abs() < self.thresh_val]
 
         # stack and reindex
+        mult_idx = self.df.index
         out_df = out_df.stack(future_stack=True).reindex(mult_idx)
         filt_df = filt_df.stack(future_stack=True).reindex(mult_idx)
         yhat_df = yhat_df.stack(future_stack=True).reindex(mult_idx)
@@ -659,91 +761,79 @@ class OutlierDetection:
 
         return self.filtered_df
 
-    def prophet(self, interval_width: Optional[float] = 0.999) -> pd.DataFrame:
+    def prophet(
+        self,
+        interval_width: Optional[float] = 0.999,
+        cache: Union[ResponseCache, bool, None] = None
+    ) -> pd.DataFrame:
         """
         Detects outliers using Prophet, a time series forecasting algorithm published by Facebook.
 
+        Models are fit to each (field, ticker) series, spread over a pool of max_workers processes if set. Forecasts
+        are cached, keyed on a hash of the series dates and values and the model parameters, so that only series
+        whose data changed are refit when the same universe is cleaned again. Fit times are stored in fit_times.
+
         Parameters
         ----------
         interval_width: float, optional, default 0.99
             Uncertainty interval estimated by Monte Carlo simulation. The larger the value,
             the larger the upper/lower thresholds interval for outlier detection.
+        cache: ResponseCache or bool, optional, default None
+            Cache in which forecasts are stored. If None or True, the process-wide response cache is used if
+            enabled, False disables caching.
 
         Returns
         -------
         filtered_df: pd.DataFrame - MultiIndex
             Filtered dataframe with DatetimeIndex (level 0), tickers (level 1) and fields (cols) with outliers removed.
         """
+        if cache is None or cache is True:
+            cache = get_cache()
+        elif cache is False:
+            cache = None
+        params = dict(interval_width=interval_width)
+
         # unstack
-        df0 = self.raw_df.unstack().copy()
-        # original idx, unstacked idx
-        mult_idx, idx = self.raw_df.index, df0.index
-
-        # store predictions for fields dfs in dict
-        upper_dict, lower_dict, yhat_dict = {}, {}, {}
-        for field in df0.columns.get_level_values(0).unique():
-            upper_df, lower_df, yhat_df = (
-                pd.DataFrame(index=idx),
-                pd.DataFrame(index=idx),
-                pd.DataFrame(index=idx),
-            )
-            for ticker in df0[field].columns:
-                # format cols for prophet
-                df1 = (
-                    df0[field][ticker]
-                    .to_frame()
-                    .reset_index()
-                    .rename(columns={"date": "ds", ticker: "y"})
-                )
-                # fit model
-                m = Prophet(interval_width=interval_width)
-                m = m.fit(df1)
-                # forecast
-                pred = m.predict(df1)
-                # convert to datetimeindex and rename
-                pred["date"] = pd.to_datetime(pred.ds)
-                pred.set_index("date", inplace=True)
-                # add to dfs
-                upper_df = pd.concat(
-                    [upper_df, pred["yhat_upper"]], join="outer", axis=1
-                ).rename(columns={"yhat_upper": ticker})
-                lower_df = pd.concat(
-                    [lower_df, pred["yhat_lower"]], join="outer", axis=1
-                ).rename(columns={"yhat_lower": ticker})
-                yhat_df = pd.concat(
-                    [yhat_df, pred["yhat"]], join="outer", axis=1
-                ).rename(columns={"yhat": ticker})
-
-            # add fcst adfs to dict
-            upper_dict[field], lower_dict[field], yhat_dict[field] = (
-                upper_df,
-                lower_df,
-                yhat_df,
-            )
-
-        # convert dict to multiindex
-        yhat_upper, yhat_lower, yhat = (
-            pd.concat(upper_dict, axis=1),
-            pd.concat(lower_dict, axis=1),
-            pd.concat(yhat_dict, axis=1),
-        )
-        # rename cols
-        yhat_upper.columns.names = [None, "ticker"]
-        yhat_lower.columns.names = [None, "ticker"]
-        yhat.columns.names = [None, "ticker"]
+        df0 = self.df.unstack()
+        dates, values = df0.index.to_numpy(), df0.to_numpy(dtype=np.float64)
+
+        # forecasts, fit times and cache hits, by series
+        fcst = np.full((3,) + values.shape, np.nan)
+        fit_times, hits = np.zeros(values.shape[1]), np.zeros(values.shape[1], dtype=bool)
+
+        # get cached forecasts
+        keys, to_fit = [], []
+        for col in range(values.shape[1]):
+            series_hash = hashlib.sha256(dates.view(np.int64).tobytes() + values[:, col].tobytes()).hexdigest()
+            keys.append(make_key("prophet", series_hash, params))
+            resp = cache.get(keys[col]) if cache is not None else None
+            if resp is None:
+                to_fit.append(col)
+            else:
+                fcst[:, :, col], fit_times[col], hits[col] = resp[0], resp[1], True
 
-        # transform log
-        if self.log:
-            yhat_upper = np.exp(yhat_upper)
-            yhat_lower = np.exp(yhat_lower)
-            yhat = np.exp(yhat)
+        # fit models
+        res = process_map(_fit_prophet, [(dates, values[:, col], params) for col in to_fit], self.max_workers)
+        for col, (col_fcst, fit_time) in zip(to_fit, res):
+            fcst[:, :, col], fit_times[col] = col_fcst, fit_time
+            if cache is not None:
+                cache.set(keys[col], (col_fcst, fit_time), "prophet")
+
+        self.fit_times = pd.DataFrame({"fit_time": fit_times, "cached": hits},
+                                      index=df0.columns.set_names(["field", "ticker"]))
+
+        # forecast dfs
+        yhat, yhat_lower, yhat_upper = (pd.DataFrame(arr, index=df0.index, columns=df0.columns) for arr in fcst)
 
         # filter outliers
-        yhat_df = yhat
-        out_df = self.df.unstack()[self.df.unstack().gt(yhat_upper) | self.df.unstack().lt(yhat_lower)]
-        filt_df = self.df.unstack()[self.df.unstack().lt(yhat_upper) & self.df.unstack().gt(yhat_lower)]
+        out_df = df0[df0.gt(yhat_upper) | df0.lt(yhat_lower)]
+        filt_df = df0[df0.lt(yhat_upper) & df0.gt(yhat_lower)]
+
+        # log to original scale
+        yhat_df = np.exp(yhat) if self.log else yhat
 
         # stack and reindex
+        mult_idx = self.df.index
         yhat_df = yhat_df.stack(future_stack=True).reindex(mult_idx)
         out_df = out_df.stack(future_stack=True).reindex(mult_idx)
         filt_df = filt_df.stack(future_stack=True).reindex(mult_idx)
@@ -793,3 +883,322 @@ class OutlierDetection:
         ax.legend(
             [self.plot_series[1] + "_raw", self.plot_series[1] + "_outliers"], loc="upper left"
         )
+
+
+class OnlineOutlierDetection:
+    """
+    Detects outliers in streaming updates of bars, scoring only the new bars of each update.
+
+    The state of each (field, ticker) series is kept between updates: the values of its ticker's last window_size - 1
+    bars in the rolling windows of the z_score and mad methods (and their deviations from the median for mad), and
+    the exponentially weighted moments of the ewma method. Each bar is scored from its window or moments only, so the
+    cost of an update grows with its number of bars rather than with the history, and outliers match those of the
+    prediction models of OutlierDetection over the full history, whatever the calendar of each ticker.
+    """
+    methods = ("z_score", "ewma", "mad")
+    # initial ewm state of a series: mean, cov, sum of weights, sum of squared weights and observations
+    ewm_init = np.array([np.nan, 0.0, 0.0, 0.0, 0.0])
+
+    def __init__(self,
+                 method: str = 'z_score',
+                 excl_cols: Optional[Union[str, list]] = None,
+                 log: bool = False,
+                 window_size: int = 7,
+                 thresh_val: int = 5
+                 ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        method: str, {'z_score', 'ewma', 'mad'}, default 'z_score'
+            Outlier detection method, as in the OutlierDetection methods of the same name.
+        excl_cols: str or list, optional, default None
+            Columns to exclude from outlier detection.
+        log: bool, default False
+            Log transform the series.
+        window_size: int, default 7
+            Number of observations in the rolling window, or span of the exponentially weighted moments.
+        thresh_val: int, default 5
+            Value for upper and lower thresholds used in outlier detection.
+        """
+        if method not in self.methods:
+            raise ValueError(f"Method must be one of {', '.join(self.methods)}.")
+
+        self.method = method
+        self.excl_cols = excl_cols
+        self.log = log
+        self.window_size = window_size
+        self.thresh_val = thresh_val
+        self.columns = None
+        self.last_date = None
+        if method == "ewma":
+            self.state = {"ewm": np.empty((len(self.ewm_init), 0))}
+        else:
+            self.state = {key: np.empty((window_size - 1, 0)) for key in
+                          (["values", "devs"] if method == "mad" else ["values"])}
+        self.yhat = None
+        self.outliers = None
+        self.filtered_df = None
+
+    def get_state(self) -> dict:
+        """
+        Gets the parameters and series state of the detector.
+
+        Returns
+        -------
+        state: dict
+            Parameters, (field, ticker) series, last date and state arrays, with one col per series.
+        """
+        return {
+            "params": {
+                "method": self.method,
+                "excl_cols": self.excl_cols,
+                "log": self.log,
+                "window_size": self.window_size,
+                "thresh_val": self.thresh_val,
+            },
+            "columns": self.columns,
+            "last_date": self.last_date,
+            "state": self.state,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'OnlineOutlierDetection':
+        """
+        Creates a detector from the state of another detector.
+
+        Parameters
+        ----------
+        state: dict
+            State from get_state.
+
+        Returns
+        -------
+        od: OnlineOutlierDetection
+            Detector which scores bars after the last date of the state.
+        """
+        od = cls(**state["params"])
+        od.columns = state["columns"]
+        od.last_date = state["last_date"]
+        od.state = {key: arr.copy() for key, arr in state["state"].items()}
+
+        return od
+
+    def save(self, path: str) -> None:
+        """
+        Saves the state of the detector to a pickle file.
+
+        Parameters
+        ----------
+        path: str
+            File path.
+        """
+        with open(path, "wb") as f:
+            pickle.dump(self.get_state(), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> 'OnlineOutlierDetection':
+        """
+        Loads a detector from a pickle file saved with save.
+
+        Parameters
+        ----------
+        path: str
+            File path.
+
+        Returns
+        -------
+        od: OnlineOutlierDetection
+            Detector which scores bars after the last saved date.
+        """
+        with open(path, "rb") as f:
+            return cls.from_state(pickle.load(f))
+
+    def add_series(self, cols: pd.MultiIndex) -> np.ndarray:
+        """
+        Adds (field, ticker) series which are new to the detector, with empty windows and moments.
+
+        Parameters
+        ----------
+        cols: pd.MultiIndex
+            (field, ticker) series of an update.
+
+        Returns
+        -------
+        idx: np.ndarray
+            Positions of the series in the state arrays.
+        """
+        if self.columns is None:
+            new, self.columns = cols, cols
+        else:
+            new = cols.difference(self.columns, sort=False)
+            self.columns = self.columns.append(new)
+
+        for key, arr in self.state.items():
+            if key == "ewm":
+                fill = np.repeat(self.ewm_init[:, None], len(new), axis=1)
+            else:
+                fill = np.full((arr.shape[0], len(new)), np.nan)
+            self.state[key] = np.hstack([arr, fill])
+
+        return self.columns.get_indexer(cols)
+
+    def z_score(self, vals: np.ndarray, cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Scores bars with the rolling z-score, continuing the windows of the state.
+
+        Parameters
+        ----------
+        vals: np.ndarray
+            2D array of new values, with the dates of the tickers' bars (rows) and series (cols).
+        cols: np.ndarray
+            Positions of the series in the state arrays.
+
+        Returns
+        -------
+        yhat: np.ndarray
+            Rolling means.
+        score: np.ndarray
+            Absolute z-scores.
+        """
+        # windows of the new values start with the state's last values
+        start = len(self.state["values"])
+        vals = np.vstack([self.state["values"][:, cols], vals])
+        roll_mean = rolling_mean(vals, self.window_size, min_periods=1)[start:]
+        roll_std = rolling_std(vals, self.window_size, min_periods=1)[start:]
+        self.state["values"][:, cols] = vals[len(vals) - start:]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return roll_mean, np.abs(vals[start:] - roll_mean) / roll_std
+
+    def mad(self, vals: np.ndarray, cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Scores bars with the median absolute deviation, continuing the windows of the state.
+
+        Parameters
+        ----------
+        vals: np.ndarray
+            2D array of new values, with the dates of the tickers' bars (rows) and series (cols).
+        cols: np.ndarray
+            Positions of the series in the state arrays.
+
+        Returns
+        -------
+        yhat: np.ndarray
+            Rolling medians.
+        score: np.ndarray
+            Absolute deviations from the median, in median absolute deviations.
+        """
+        # windows of the new values start with the state's last values and deviations
+        start = len(self.state["values"])
+        vals = np.vstack([self.state["values"][:, cols], vals])
+        med = rolling_quantiles(vals, self.window_size, [0.5])[0][start:]
+        devs = np.vstack([self.state["devs"][:, cols], vals[start:] - med])
+        mad = rolling_quantiles(np.abs(devs), self.window_size, [0.5])[0][start:]
+        self.state["values"][:, cols] = vals[len(vals) - start:]
+        self.state["devs"][:, cols] = devs[len(devs) - start:]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return med, np.abs(vals[start:] - med) / mad
+
+    def ewma(self, vals: np.ndarray, cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Scores bars with the exponentially weighted z-score, updating the moments of the state bar by bar.
+
+        Moments are updated as in pandas ewm(span=window_size) with adjust=True and ignore_na=False: missing values
+        of a ticker's bars decay the weights of past values.
+
+        Parameters
+        ----------
+        vals: np.ndarray
+            2D array of new values, with the dates of the tickers' bars (rows) and series (cols).
+        cols: np.ndarray
+            Positions of the series in the state arrays.
+
+        Returns
+        -------
+        yhat: np.ndarray
+            Exponentially weighted means.
+        score: np.ndarray
+            Absolute exponentially weighted z-scores.
+        """
+        decay = 1 - 2 / (self.window_size + 1)
+        mean, cov, sum_wt, sum_wt2, nobs = self.state["ewm"][:, cols]
+        yhat, std = np.full(vals.shape, np.nan), np.full(vals.shape, np.nan)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for i, x in enumerate(vals):
+                obs = ~np.isnan(x)
+                started = ~np.isnan(mean)
+                # decay weights, then add the new value
+                sum_wt = np.where(started, sum_wt * decay, sum_wt)
+                sum_wt2 = np.where(started, sum_wt2 * decay ** 2, sum_wt2)
+                upd = started & obs
+                new_mean = np.where(upd & (mean != x), (sum_wt * mean + x) / (sum_wt + 1), mean)
+                cov = np.where(upd, (sum_wt * (cov + (mean - new_mean) ** 2) + (x - new_mean) ** 2) / (sum_wt + 1), cov)
+                sum_wt, sum_wt2 = sum_wt + upd, sum_wt2 + upd
+                # first value
+                first = ~started & obs
+                mean = np.where(first, x, new_mean)
+                cov, sum_wt, sum_wt2 = np.where(first, 0, cov), np.where(first, 1, sum_wt), np.where(first, 1, sum_wt2)
+                nobs = nobs + obs
+                # bias corrected std
+                denom = sum_wt ** 2 - sum_wt2
+                yhat[i] = np.where(nobs > 0, mean, np.nan)
+                std[i] = np.where((nobs > 0) & (denom > 0), np.sqrt(sum_wt ** 2 / denom * cov), np.nan)
+
+            self.state["ewm"][:, cols] = np.vstack([mean, cov, sum_wt, sum_wt2, nobs])
+
+            return yhat, np.abs(vals - yhat) / std
+
+    def update(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Detects outliers in the bars of an update which are after the last date of previous updates.
+
+        Parameters
+        ----------
+        raw_df: pd.DataFrame - MultiIndex
+            DataFrame MultiIndex with DatetimeIndex (level 0), ticker (level 1) and raw data/values (cols),
+            e.g. the latest bars, or the full history on the first update.
+
+        Returns
+        -------
+        filtered_df: pd.DataFrame - MultiIndex
+            Filtered dataframe of the new bars with DatetimeIndex (level 0), tickers (level 1) and fields (cols)
+            with outliers removed.
+        """
+        # new bars, with the transforms of OutlierDetection
+        od = OutlierDetection(raw_df, excl_cols=self.excl_cols, log=self.log, window_size=self.window_size,
+                              model_type='prediction', thresh_val=self.thresh_val)
+        if self.last_date is not None:
+            od.df = od.df[od.df.index.get_level_values(0) > self.last_date]
+        wide_df, vals = od.unstack()
+
+        # positions of the series in the state
+        idx = self.add_series(wide_df.columns)
+
+        # score each calendar over the dates on which its tickers have bars, continuing their windows or moments
+        tickers = wide_df.columns.get_level_values(1)
+        calendars = od.calendars if od.calendars is not None else [(np.arange(len(wide_df)), tickers.unique())]
+        yhat, score = np.full(vals.shape, np.nan), np.full(vals.shape, np.nan)
+        for rows, cal_tickers in calendars:
+            cal = np.ix_(rows, np.flatnonzero(tickers.isin(cal_tickers)))
+            yhat[cal], score[cal] = getattr(self, self.method)(vals[cal], idx[cal[1].ravel()])
+        if len(wide_df):
+            self.last_date = wide_df.index[-1]
+
+        # outliers
+        out_df = od.df[od.stack(score > self.thresh_val, wide_df, False)]
+        filt_df = od.df[od.stack(score < self.thresh_val, wide_df, False)]
+
+        # log to original scale
+        yhat = od.stack(yhat, wide_df)
+        if self.log:
+            yhat = np.exp(yhat)
+
+        self.yhat = yhat.convert_dtypes().sort_index()
+        self.outliers = out_df.convert_dtypes().sort_index()
+        self.filtered_df = filt_df.convert_dtypes().sort_index()
+
+        return self.filtered_df
@@ -0,0 +1,235 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Optional, Sequence
+
+# windows up to this length per quantile are sorted in blocks, longer windows use the pandas skiplist kernel
+MAX_SORT_WINDOW = 64
+# number of window values sorted at once, bounds the memory of a block
+BLOCK_SIZE = 2 ** 23
+
+
+def _as_2d(values: np.ndarray) -> np.ndarray:
+    """
+    Converts a series or (time x series) array of values to a 2D float array.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        return values[:, None]
+    elif values.ndim == 2:
+        return values
+    else:
+        raise ValueError("Values must be a 1D or 2D (time x series) array.")
+
+
+def _pad(values: np.ndarray, window: int, center: bool) -> np.ndarray:
+    """
+    Pads values with missing values so that row t of the padded array starts the window of row t.
+
+    Trailing windows of row t cover rows [t - window + 1, t]. Centered windows are shifted forward by
+    (window - 1) // 2 rows, as in pandas, e.g. rows [t - 3, t + 3] for a window of 7.
+    """
+    offset = (window - 1) // 2 if center else 0
+    n_cols = values.shape[1]
+
+    return np.concatenate([np.full((window - 1 - offset, n_cols), np.nan), values, np.full((offset, n_cols), np.nan)])
+
+
+def rolling_quantiles(
+        values: np.ndarray,
+        window: int,
+        qs: Sequence[float],
+        center: bool = False,
+        min_periods: Optional[int] = None
+) -> np.ndarray:
+    """
+    Computes several rolling quantiles of each series of a (time x series) array in a single pass, ignoring missing
+    values.
+
+    Quantiles are linearly interpolated between the sorted non-missing values of each window, as in
+    pandas.DataFrame.rolling().quantile(). Windows up to MAX_SORT_WINDOW values per quantile are gathered as strided
+    views and sorted once, in blocks of rows across all series at once, and every quantile is read from the same
+    sorted windows with the number of non-missing values from a cumulative count.
+
+    Sorting costs O(w log w) per window of w values, against O(log w) per window and quantile for the incremental
+    pandas skiplist kernel, so longer windows use the skiplist kernel on each column of the 2D array, once per
+    quantile, as pandas has no multi-quantile rolling kernel.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        1D series or 2D array of series values, with dates (rows) and series (cols), e.g. an unstacked dataframe.
+    window: int
+        Number of observations in the rolling window.
+    qs: sequence of float
+        Quantiles, between 0 and 1, e.g. [0.25, 0.5, 0.75].
+    center: bool, default False
+        Centers the window on each observation, otherwise the window ends at each observation.
+    min_periods: int, optional, default None
+        Minimum number of non-missing values in a window, otherwise the quantiles are missing.
+        If None, defaults to the window size.
+
+    Returns
+    -------
+    quantiles: np.ndarray
+        Array of the quantiles (axis 0), each with the same shape as values.
+    """
+    arr = _as_2d(values)
+    qs = [float(q) for q in np.atleast_1d(qs)]
+    min_periods = window if min_periods is None else min_periods
+    n_rows, n_cols = arr.shape
+    out = np.empty((len(qs), n_rows, n_cols))
+
+    # long windows
+    if window > MAX_SORT_WINDOW * len(qs) or arr.size == 0:
+        roll = pd.DataFrame(arr).rolling(window, min_periods=min_periods, center=center)
+        for i, q in enumerate(qs):
+            out[i] = roll.quantile(q).to_numpy()
+        return out.reshape((len(qs),) + np.shape(values))
+
+    # non-missing values in each window
+    padded = _pad(arr, window, center)
+    cum_obs = np.zeros((padded.shape[0] + 1, n_cols), dtype=np.int32)
+    np.cumsum(~np.isnan(padded), axis=0, out=cum_obs[1:])
+    obs = cum_obs[window:] - cum_obs[:n_rows]
+    del cum_obs
+
+    # windows sorted once per block of rows, missing values sort last
+    block = max(1, BLOCK_SIZE // (n_cols * window))
+    for start in range(0, n_rows, block):
+        stop = min(start + block, n_rows)
+        windows = np.sort(sliding_window_view(padded[start:stop + window - 1], window, axis=0), axis=-1)
+        n_obs = obs[start:stop]
+        for i, q in enumerate(qs):
+            pos = q * (n_obs - 1)
+            lo = np.clip(np.floor(pos), 0, window - 1).astype(np.int64)
+            hi = np.clip(np.ceil(pos), 0, window - 1).astype(np.int64)
+            v_lo = np.take_along_axis(windows, lo[..., None], axis=-1)[..., 0]
+            v_hi = np.take_along_axis(windows, hi[..., None], axis=-1)[..., 0]
+            quantile = np.where(lo == hi, v_lo, v_lo + (v_hi - v_lo) * (pos - lo))
+            out[i, start:stop] = np.where(n_obs >= max(min_periods, 1), quantile, np.nan)
+
+    return out.reshape((len(qs),) + np.shape(values))
+
+
+def rolling_quantile(
+        values: np.ndarray,
+        window: int,
+        q: float,
+        center: bool = False,
+        min_periods: Optional[int] = None
+) -> np.ndarray:
+    """
+    Computes a rolling quantile of each series of a (time x series) array, ignoring missing values.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        1D series or 2D array of series values, with dates (rows) and series (cols).
+    window: int
+        Number of observations in the rolling window.
+    q: float
+        Quantile, between 0 and 1.
+    center: bool, default False
+        Centers the window on each observation, otherwise the window ends at each observation.
+    min_periods: int, optional, default None
+        Minimum number of non-missing values in a window, otherwise the quantile is missing.
+        If None, defaults to the window size.
+
+    Returns
+    -------
+    quantiles: np.ndarray
+        Array with the same shape as values.
+    """
+    return rolling_quantiles(values, window, [q], center=center, min_periods=min_periods)[0]
+
+
+def rolling_median(
+        values: np.ndarray,
+        window: int,
+        center: bool = False,
+        min_periods: Optional[int] = None
+) -> np.ndarray:
+    """
+    Computes a rolling median of each series of a (time x series) array, ignoring missing values.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        1D series or 2D array of series values, with dates (rows) and series (cols).
+    window: int
+        Number of observations in the rolling window.
+    center: bool, default False
+        Centers the window on each observation, otherwise the window ends at each observation.
+    min_periods: int, optional, default None
+        Minimum number of non-missing values in a window, otherwise the median is missing.
+        If None, defaults to the window size.
+
+    Returns
+    -------
+    medians: np.ndarray
+        Array with the same shape as values.
+    """
+    return rolling_quantile(values, window, 0.5, center=center, min_periods=min_periods)
+
+
+def rolling_mean(
+        values: np.ndarray,
+        window: int,
+        center: bool = False,
+        min_periods: Optional[int] = None
+) -> np.ndarray:
+    """
+    Computes a rolling mean of each series of a (time x series) array, ignoring missing values.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        1D series or 2D array of series values, with dates (rows) and series (cols).
+    window: int
+        Number of observations in the rolling window.
+    center: bool, default False
+        Centers the window on each observation, otherwise the window ends at each observation.
+    min_periods: int, optional, default None
+        Minimum number of non-missing values in a window, otherwise the mean is missing.
+        If None, defaults to the window size.
+
+    Returns
+    -------
+    means: np.ndarray
+        Array with the same shape as values.
+    """
+    out = pd.DataFrame(_as_2d(values)).rolling(window, min_periods=min_periods, center=center).mean().to_numpy()
+
+    return out.reshape(np.shape(values))
+
+
+def rolling_std(
+        values: np.ndarray,
+        window: int,
+        center: bool = False,
+        min_periods: Optional[int] = None
+) -> np.ndarray:
+    """
+    Computes a rolling sample standard deviation of each series of a (time x series) array, ignoring missing values.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        1D series or 2D array of series values, with dates (rows) and series (cols).
+    window: int
+        Number of observations in the rolling window.
+    center: bool, default False
+        Centers the window on each observation, otherwise the window ends at each observation.
+    min_periods: int, optional, default None
+        Minimum number of non-missing values in a window, otherwise the standard deviation is missing.
+        If None, defaults to the window size.
+
+    Returns
+    -------
+    stds: np.ndarray
+        Array with the same shape as values.
+    """
+    out = pd.DataFrame(_as_2d(values)).rolling(window, min_periods=min_periods, center=center).std().to_numpy()
+
+    return out.reshape(np.shape(values))
@@ -1,10 +1,12 @@
 from __future__ import annotations
-from typing import Union, Dict, List, Optional, Any
-from importlib import resources
+from itertools import chain
+from typing import Union, Dict, List, Optional, Any, Tuple
 
+import numpy as np
 import pandas as pd
 
 from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.util.catalog import get_catalog
 
 
 class WrangleInfo:
@@ -892,6 +894,47 @@ class WrangleData:
 
         return self.data_resp
 
+    @staticmethod
+    def tidy_index(
+            dates: pd.DatetimeIndex,
+            ticker_codes: np.ndarray,
+            tickers: Union[List[str], np.ndarray]
+    ) -> Tuple[pd.MultiIndex, np.ndarray]:
+        """
+        Builds a sorted (date, ticker) MultiIndex from integer codes, without creating a frame per ticker.
+
+        Parameters
+        ----------
+        dates: pd.DatetimeIndex
+            Date of each row.
+        ticker_codes: np.ndarray
+            Position in tickers of each row's ticker.
+        tickers: list or np.ndarray
+            Ticker labels.
+
+        Returns
+        -------
+        index: pd.MultiIndex
+            MultiIndex with date (level 0) and ticker (level 1), sorted by date then ticker.
+        order: np.ndarray
+            Positions of rows in sorted order, used to reorder values to match index.
+        """
+        # sort tickers and dates into levels, keeping codes for each row
+        ticker_levels, ticker_inv = np.unique(np.asarray(tickers, dtype=object), return_inverse=True)
+        ticker_codes = ticker_inv.reshape(-1)[ticker_codes]
+        date_codes, date_levels = pd.factorize(dates, sort=True)
+
+        # sort rows by date, then ticker
+        order = np.lexsort((ticker_codes, date_codes))
+        index = pd.MultiIndex(
+            levels=[date_levels, pd.Index(ticker_levels, dtype=object)],
+            codes=[date_codes[order], ticker_codes[order]],
+            names=['date', 'ticker'],
+            verify_integrity=False
+        ).remove_unused_levels()
+
+        return index, order
+
     def ccxt_ohlcv(self) -> pd.DataFrame:
         """
         Wrangles CCXT OHLCV data response to dataframe with tidy data format.
@@ -903,21 +946,43 @@ class WrangleData:
         """
         # field cols
         cols = ["date", "open", "high", "low", "close", "volume"]
+        n_markets = len(self.data_req.source_markets)
 
-        # add tickers
-        for i in range(len(self.data_req.source_markets)):
-            df = pd.DataFrame(self.data_resp[i], columns=cols)
-            df['ticker'] = self.data_req.source_markets[i]
-            self.tidy_data = pd.concat([self.tidy_data, df])
+        # stack ticker responses into a single array, missing values as NaN
+        data = [np.asarray(resp if resp else [], dtype=float).reshape(-1, len(cols))
+                for resp in self.data_resp[:n_markets]]
+        values = np.concatenate(data) if data else np.empty((0, len(cols)))
+        ticker_codes = np.repeat(np.arange(len(data)), [len(arr) for arr in data])
 
         # convert to datetime
-        self.tidy_data['date'] = pd.to_datetime(self.tidy_data['date'], unit='ms')
+        dates = pd.to_datetime(values[:, 0].astype('int64'), unit='ms')
 
         # set index
-        self.tidy_data = self.tidy_data.set_index(['date', 'ticker']).sort_index()
+        index, order = self.tidy_index(dates, ticker_codes, self.data_req.source_markets[:len(data)])
+        self.tidy_data = pd.DataFrame(values[order, 1:], index=index, columns=cols[1:])
 
         return self.tidy_data
 
+    @staticmethod
+    def ccxt_columns(rows: List[Dict[str, Any]], keys: List[str]) -> List[np.ndarray]:
+        """
+        Pulls keys of CCXT dict responses into float arrays, missing values as NaN, without building a frame of
+        every key.
+
+        Parameters
+        ----------
+        rows: list
+            List of dictionaries, e.g. funding rates or open interest.
+        keys: list
+            Keys to pull, e.g. ['timestamp', 'fundingRate'].
+
+        Returns
+        -------
+        cols: list
+            List of float arrays, in the order of keys.
+        """
+        return [np.array([row.get(key) for row in rows], dtype=float) for key in keys]
+
     def ccxt_funding_rates(self) -> pd.DataFrame:
         """
         Wrangles CCXT funding rates data response to dataframe with tidy data format.
@@ -927,22 +992,19 @@ class WrangleData:
         pd.DataFrame
             Dataframe with tidy data format.
         """
-        # add tickers
-        for i in range(len(self.data_req.source_markets)):
-            df = pd.DataFrame(self.data_resp[i])
-            self.tidy_data = pd.concat([self.tidy_data, df])
-        self.tidy_data = self.tidy_data[['symbol', 'fundingRate', 'datetime']]
-        self.data_resp = self.tidy_data
-
-        # convert to lib fields
-        self.convert_fields_to_lib(data_source='ccxt')
-        self.tidy_data = self.data_resp
+        # pull symbol, rate and ms timestamp of each row, instead of parsing ISO datetimes
+        records = [resp if resp else [] for resp in self.data_resp[:len(self.data_req.source_markets)]]
+        rows = list(chain.from_iterable(records))
+        ticker_codes, tickers = pd.factorize(np.array([row.get('symbol') for row in rows], dtype=object))
+        timestamps, rates = self.ccxt_columns(rows, ['timestamp', 'fundingRate'])
 
         # convert to datetime
-        self.tidy_data['date'] = pd.to_datetime(self.tidy_data.set_index('date').index).floor('s').tz_localize(None)
+        dates = pd.DatetimeIndex(pd.to_datetime(timestamps, unit='ms')).floor('s')
 
         # set index
-        self.tidy_data = self.tidy_data.set_index(['date', 'ticker']).sort_index()
+        index, order = self.tidy_index(dates, ticker_codes, tickers)
+        field = get_catalog().get_fields_map('ccxt')['fundingRate']
+        self.tidy_data = pd.DataFrame({field: rates[order]}, index=index)
 
         # resample
         if self.data_req.freq in ['d', 'w', 'm', 'q', 'y']:
@@ -964,27 +1026,24 @@ class WrangleData:
         pd.DataFrame
             Dataframe with tidy data format.
         """
-        # add tickers
-        for i in range(len(self.data_req.source_markets)):
-            df = pd.DataFrame(self.data_resp[i])
-            df['symbol'] = self.data_req.source_markets[i]
-            # Use openInterestValue if openInterestAmount is not available
-            if 'openInterestAmount' in df.columns and df['openInterestAmount'].isna().all():
-                if 'openInterestValue' in df.columns:
-                    df['openInterestAmount'] = df['openInterestValue']
-            self.tidy_data = pd.concat([self.tidy_data, df])
-        self.tidy_data = self.tidy_data[['symbol', 'openInterestAmount', 'datetime']]
-        self.data_resp = self.tidy_data
-
-        # convert to lib fields
-        self.convert_fields_to_lib(data_source='ccxt')
-        self.tidy_data = self.data_resp
+        # pull amount, value and ms timestamp of each row, instead of parsing ISO datetimes
+        records = [resp if resp else [] for resp in self.data_resp[:len(self.data_req.source_markets)]]
+        ticker_codes = np.repeat(np.arange(len(records)), [len(resp) for resp in records])
+        rows = list(chain.from_iterable(records))
+        timestamps, amounts, values = self.ccxt_columns(rows, ['timestamp', 'openInterestAmount', 'openInterestValue'])
+
+        # use openInterestValue for tickers where openInterestAmount is not available
+        has_amount = np.bincount(ticker_codes, weights=~np.isnan(amounts), minlength=len(records)) > 0
+        missing = ~has_amount[ticker_codes]
+        amounts[missing] = values[missing]
 
         # convert to datetime
-        self.tidy_data['date'] = pd.to_datetime(self.tidy_data.set_index('date').index).floor('s').tz_localize(None)
+        dates = pd.DatetimeIndex(pd.to_datetime(timestamps, unit='ms')).floor('s')
 
         # set index
-        self.tidy_data = self.tidy_data.set_index(['date', 'ticker']).sort_index()
+        index, order = self.tidy_index(dates, ticker_codes, self.data_req.source_markets[:len(records)])
+        field = get_catalog().get_fields_map('ccxt')['openInterestAmount']
+        self.tidy_data = pd.DataFrame({field: amounts[order]}, index=index)
 
         return self.tidy_data
 
@@ -1201,16 +1260,12 @@ class WrangleData:
 
         """
         # convert tickers to cryptodatapy format
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        tickers_df = get_catalog().tickers
+        tickers_df = tickers_df[~tickers_df.duplicated(subset=['country_name', 'wb_id'])]
+        tickers_map = dict(zip(zip(tickers_df.country_name, tickers_df.wb_id), tickers_df.index))
         self.data_resp = self.data_resp.stack(future_stack=True).to_frame()  # stack df
-        # create list of tickers using tickers csv
-        tickers = []
-        for row in self.data_resp.iterrows():
-            tickers.append(
-                tickers_df[(tickers_df.country_name == row[0][0]) & (tickers_df.wb_id == row[0][2])].index[0])
-        self.data_resp['ticker'] = tickers
+        # create list of tickers using (country, indicator) lookups in tickers catalog
+        self.data_resp['ticker'] = [tickers_map[(idx[0], idx[2])] for idx in self.data_resp.index]
         # convert fields
         self.data_resp = self.data_resp.reset_index().rename(columns={0: 'actual', 'year': 'date'})
         # convert date
@@ -1312,32 +1367,17 @@ class WrangleData:
             WrangleData object with data_resp fields converted to CryptoDataPy format.
 
         """
-        # fields dictionary
-        with resources.path('cryptodatapy.conf', 'fields.csv') as f:
-            fields_dict_path = f
-        # get fields and data resp
-        fields_df = pd.read_csv(fields_dict_path, index_col=0, encoding='latin1').copy()
-        fields_list = fields_df[str(data_source) + '_id'].to_list()
-
-        # loop through data resp cols
-        for col in self.data_resp.columns:
-            # if self.data_req.source_fields is not None and col in self.data_req.source_fields:
-            #     pass
-            if col in fields_list or col.title() in fields_list or col.lower() in fields_list:
-                self.data_resp.rename(columns={col: fields_df[(fields_df[str(data_source) + '_id']
-                                      == col.title()) |
-                                    (fields_df[str(data_source) + '_id'] == col.lower()) |
-                                    (fields_df[str(data_source) + '_id'] == col)].index[0]}, inplace=True)
-            elif col == 'index':
-                self.data_resp.rename(columns={'index': 'ticker'}, inplace=True)  # rename index col
-            elif col == 'asset':
-                self.data_resp.rename(columns={'asset': 'ticker'}, inplace=True)  # rename asset col
-            elif col == 'level':
-                self.data_resp.rename(columns={'level': 'close'}, inplace=True)  # rename level col
-            elif col == 'institution':
-                pass
-            else:
-                self.data_resp.drop(columns=[col], inplace=True)
+        # case-insensitive map from data source ids to lib fields
+        fields_map = get_catalog().get_fields_map(data_source, lower=True)
+        # cols not in fields catalog which are kept
+        other_cols = {'index': 'ticker', 'asset': 'ticker', 'level': 'close', 'institution': 'institution'}
+
+        # rename cols in a single pass, dropping cols which are not mapped
+        cols = [fields_map.get(str(col).lower(), other_cols.get(col)) for col in self.data_resp.columns]
+        if None in cols:
+            self.data_resp = self.data_resp.iloc[:, [i for i, col in enumerate(cols) if col is not None]]
+            cols = [col for col in cols if col is not None]
+        self.data_resp.columns = cols
 
         return self
 
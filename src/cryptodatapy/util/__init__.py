@@ -1,2 +1,44 @@
-from cryptodatapy.util.datacatalog import DataCatalog
-from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "Catalog": ".catalog",
+    "get_catalog": ".catalog",
+    "set_catalog": ".catalog",
+    "DataCatalog": ".datacatalog",
+    "DataCredentials": ".datacredentials",
+    "HTTPSession": ".session",
+    "get_session": ".session",
+    "set_session": ".session",
+    "RateLimiter": ".ratelimit",
+    "TokenBucket": ".ratelimit",
+    "FileTokenBucket": ".ratelimit",
+    "get_rate_limiter": ".ratelimit",
+    "ResponseCache": ".cache",
+    "SQLiteCache": ".cache",
+    "DirectoryCache": ".cache",
+    "get_cache": ".cache",
+    "set_cache": ".cache",
+    "thread_map": ".concurrency",
+    "process_map": ".concurrency",
+    "SnapshotStore": ".snapshot",
+    "get_snapshot_store": ".snapshot",
+    "set_snapshot_store": ".snapshot",
+    "VendorRegistry": ".registry",
+    "get_registry": ".registry",
+    "set_registry": ".registry",
+    "FeatherStore": ".store",
+    "ParquetStore": ".store",
+    # submodules and subpackages
+    "cache": ".cache",
+    "catalog": ".catalog",
+    "concurrency": ".concurrency",
+    "datacatalog": ".datacatalog",
+    "datacredentials": ".datacredentials",
+    "lazy": ".lazy",
+    "ratelimit": ".ratelimit",
+    "registry": ".registry",
+    "session": ".session",
+    "snapshot": ".snapshot",
+    "store": ".store",
+    "utils": ".utils",
+})
@@ -0,0 +1,583 @@
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Union
+
+import pandas as pd
+
+from cryptodatapy.util.datacredentials import DataCredentials
+
+
+# bar lengths of cryptodatapy frequencies which can't be parsed as timedeltas
+FREQ_TIMEDELTAS = {
+    'tick': pd.Timedelta(0),
+    'block': pd.Timedelta(0),
+    'b': pd.Timedelta(days=1),
+    'd': pd.Timedelta(days=1),
+    'w': pd.Timedelta(days=7),
+    'm': pd.Timedelta(days=31),
+    'q': pd.Timedelta(days=92),
+    'y': pd.Timedelta(days=366),
+}
+
+
+def freq_to_timedelta(freq: Optional[str]) -> pd.Timedelta:
+    """
+    Converts a data frequency to the length of a bar.
+
+    Parameters
+    ----------
+    freq: str, optional
+        Frequency of data observations, e.g. '1min', '1h', 'd', 'w'. Defaults to one day if not provided or
+        not recognized.
+
+    Returns
+    -------
+    td: pd.Timedelta
+        Length of a bar.
+    """
+    if freq in FREQ_TIMEDELTAS:
+        return FREQ_TIMEDELTAS[freq]
+    try:
+        return pd.Timedelta(freq)
+    except (TypeError, ValueError):
+        return pd.Timedelta(days=1)
+
+
+def is_closed(end_date: Any, freq: Optional[str] = None) -> bool:
+    """
+    Checks whether the last bar of a request has closed, i.e. whether its data can no longer change.
+
+    Parameters
+    ----------
+    end_date: str, int, datetime or pd.Timestamp
+        End date of the request. Integers are milliseconds since Unix epoch. If None, the request runs up to
+        the current, still open, bar.
+    freq: str, optional, default None
+        Frequency of data observations.
+
+    Returns
+    -------
+    closed: bool
+        True if the bar containing the end date has closed.
+    """
+    if end_date is None:
+        return False
+    try:
+        if isinstance(end_date, (int, float)):
+            end_date = pd.Timestamp(end_date, unit='ms')
+        end_date = pd.Timestamp(end_date)
+    except (TypeError, ValueError):
+        return False
+    if end_date.tzinfo is None:
+        end_date = end_date.tz_localize('UTC')
+
+    return end_date + freq_to_timedelta(freq) <= pd.Timestamp.now(tz='UTC')
+
+
+# request headers which carry credentials, responses for different credentials must not share a key
+AUTH_HEADERS = ('authorization', 'cookie', 'key', 'token', 'auth', 'secret')
+
+
+def make_key(vendor: str, url: str, params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None) -> str:
+    """
+    Makes a cache key from a request's vendor, url/method, parameters and credential headers.
+
+    Parameters
+    ----------
+    vendor: str
+        Name of data vendor, e.g. 'cryptocompare', 'ccxt:binance'.
+    url: str
+        Endpoint url or method name.
+    params: dict, optional, default None
+        Dictionary containing parameter values for request.
+    headers: dict, optional, default None
+        Dictionary containing headers for request. Only headers whose names contain one of AUTH_HEADERS, e.g.
+        'Authorization' or 'X-API-Key', are part of the key.
+
+    Returns
+    -------
+    key: str
+        Hex digest of the request.
+    """
+    req = [vendor, url, params]
+    auth = sorted((k.lower(), str(v)) for k, v in (headers or {}).items()
+                  if any(name in k.lower() for name in AUTH_HEADERS))
+    if auth:
+        req.append(hashlib.sha256(json.dumps(auth).encode()).hexdigest())
+    req = json.dumps(req, sort_keys=True, default=str)
+
+    return hashlib.sha256(req.encode()).hexdigest()
+
+
+class ResponseCache(ABC):
+    """
+    Local on-disk cache of data vendor responses, with per-vendor time-to-live and least recently used eviction.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            max_size: Optional[int] = None,
+            ttls: Optional[Dict[str, Optional[float]]] = None,
+            data_cred: Optional[DataCredentials] = None
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path: str, optional, default None
+            Location of the cache. If not provided, default is set to cache_dir stored in DataCredentials.
+        max_size: int, optional, default None
+            Maximum size of cached responses in bytes. Least recently used responses are evicted above it.
+            If not provided, default is set to cache_max_size stored in DataCredentials.
+        ttls: dict, optional, default None
+            Dictionary with vendor keys and time-to-live in seconds values, for responses which include the still
+            open bar. If not provided, default is set to cache_ttls stored in DataCredentials.
+        data_cred: DataCredentials, optional, default None
+            Data credentials with the cache settings.
+        """
+        if data_cred is None:
+            data_cred = DataCredentials()
+
+        self.path = path if path is not None else data_cred.cache_dir
+        self.max_size = max_size if max_size is not None else data_cred.cache_max_size
+        self.ttls = ttls if ttls is not None else data_cred.cache_ttls
+        self._lock = threading.RLock()
+
+    def get_ttl(self, vendor: str, end_date: Any = None, freq: Optional[str] = None) -> Optional[float]:
+        """
+        Gets the time-to-live of a response.
+
+        Parameters
+        ----------
+        vendor: str
+            Name of data vendor. Vendor prefixes before ':' are also looked up, e.g. 'ccxt' for 'ccxt:binance'.
+        end_date: str, int, datetime or pd.Timestamp, optional, default None
+            End date of the request.
+        freq: str, optional, default None
+            Frequency of data observations.
+
+        Returns
+        -------
+        ttl: float
+            Time-to-live in seconds, or None if the response only contains closed bars and never expires.
+        """
+        if is_closed(end_date, freq):
+            return None
+
+        if vendor in self.ttls:
+            return self.ttls[vendor]
+
+        return self.ttls.get(vendor.split(':')[0], self.ttls.get('default'))
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Gets a response from the cache.
+
+        Parameters
+        ----------
+        key: str
+            Cache key.
+
+        Returns
+        -------
+        value: Any
+            Cached response, or None if missing or expired.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, vendor: str, ttl: Optional[float] = None) -> None:
+        """
+        Adds a response to the cache, evicting least recently used responses above the size cap.
+
+        Parameters
+        ----------
+        key: str
+            Cache key.
+        value: Any
+            Response, must be picklable.
+        vendor: str
+            Name of data vendor.
+        ttl: float, optional, default None
+            Time-to-live in seconds. If None, the response never expires.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes a response from the cache.
+        """
+
+    @abstractmethod
+    def clear(self, vendor: Optional[str] = None) -> None:
+        """
+        Removes all responses, or those of a vendor, from the cache.
+        """
+
+    @abstractmethod
+    def size(self) -> int:
+        """
+        Returns size of cached responses in bytes.
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Returns number of cached responses.
+        """
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Response cache stored in a single SQLite file.
+    """
+
+    def __init__(self, path: Optional[str] = None, **kwargs):
+        super().__init__(path, **kwargs)
+        if not self.path.endswith('.sqlite'):
+            self.path = os.path.join(self.path, 'responses.sqlite')
+        self._pid = None
+        self._conn = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """
+        Returns the database connection, opening it on first use or after a fork.
+        """
+        if self._conn is None or self._pid != os.getpid():
+            with self._lock:
+                if self._conn is None or self._pid != os.getpid():
+                    os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                    conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, vendor TEXT, value BLOB, "
+                        "size INTEGER, expires REAL, accessed REAL)"
+                    )
+                    conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+                    self._conn, self._pid = conn, os.getpid()
+
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute("SELECT value, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self.conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any, vendor: str, ttl: Optional[float] = None) -> None:
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        expires = now + ttl if ttl is not None else None
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, vendor, sqlite3.Binary(blob), len(blob), expires, now)
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """
+        Removes expired responses, then least recently used responses until the cache fits the size cap.
+        """
+        self.conn.execute("DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?", (now,))
+        excess = self.size() - self.max_size
+        if excess <= 0:
+            return
+        keys, freed = [], 0
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if freed >= excess:
+                break
+            keys.append((key,))
+            freed += size
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self, vendor: Optional[str] = None) -> None:
+        with self._lock:
+            if vendor is None:
+                self.conn.execute("DELETE FROM responses")
+            else:
+                self.conn.execute("DELETE FROM responses WHERE vendor = ? OR vendor LIKE ?", (vendor, vendor + ':%'))
+
+    def size(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class DirectoryCache(ResponseCache):
+    """
+    Response cache stored as one pickle file per response in a local directory.
+
+    Files hold the vendor, expiry and response; their modification time tracks the last access for eviction.
+    Each process keeps an LRU index of file sizes, built from the directory on its first write and updated on
+    reads and writes, so a write only evicts the least recently used files and never walks the directory.
+    Files written by other processes are picked up when the index is rebuilt, after clear().
+    """
+
+    def __init__(self, path: Optional[str] = None, **kwargs):
+        super().__init__(path, **kwargs)
+        self._index = None
+        self._index_size = 0
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key + '.pkl')
+
+    def _files(self):
+        for root, _, files in os.walk(self.path):
+            for file in files:
+                if file.endswith('.pkl'):
+                    yield os.path.join(root, file)
+
+    def _load_index(self) -> None:
+        """
+        Builds the LRU index of cached files, least recently used first, and their total size.
+        """
+        stats = []
+        for file in self._files():
+            try:
+                stat = os.stat(file)
+            except OSError:
+                continue
+            stats.append((stat.st_mtime, stat.st_size, file))
+        self._index = OrderedDict((file, size) for _, size, file in sorted(stats))
+        self._index_size = sum(self._index.values())
+
+    def get(self, key: str) -> Optional[Any]:
+        file = self._file(key)
+        try:
+            with open(file, 'rb') as f:
+                vendor, expires, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if expires is not None and expires <= time.time():
+            self.delete(key)
+            return None
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+        with self._lock:
+            if self._index is not None and file in self._index:
+                self._index.move_to_end(file)
+
+        return value
+
+    def set(self, key: str, value: Any, vendor: str, ttl: Optional[float] = None) -> None:
+        file = self._file(key)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        expires = time.time() + ttl if ttl is not None else None
+        # write to temp file then rename, readers never see partial files
+        tmp = f"{file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump((vendor, expires, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        size = os.path.getsize(tmp)
+        os.replace(tmp, file)
+        with self._lock:
+            if self._index is None:
+                self._load_index()
+            self._index_size += size - self._index.pop(file, 0)
+            self._index[file] = size
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Removes least recently used responses until the cache fits the size cap.
+        """
+        while self._index_size > self.max_size and self._index:
+            file, size = self._index.popitem(last=False)
+            self._index_size -= size
+            try:
+                os.remove(file)
+            except OSError:
+                pass
+
+    def delete(self, key: str) -> None:
+        file = self._file(key)
+        with self._lock:
+            if self._index is not None:
+                self._index_size -= self._index.pop(file, 0)
+        try:
+            os.remove(file)
+        except OSError:
+            pass
+
+    def clear(self, vendor: Optional[str] = None) -> None:
+        for file in list(self._files()):
+            if vendor is not None:
+                try:
+                    with open(file, 'rb') as f:
+                        file_vendor = pickle.load(f)[0]
+                except (OSError, EOFError, pickle.UnpicklingError):
+                    continue
+                if file_vendor != vendor and not file_vendor.startswith(vendor + ':'):
+                    continue
+            try:
+                os.remove(file)
+            except OSError:
+                pass
+        with self._lock:
+            self._index = None
+
+    def size(self) -> int:
+        return sum(os.path.getsize(file) for file in self._files())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._files())
+
+
+# process-wide cache
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """
+    Gets the process-wide response cache, creating it from DataCredentials on first use.
+
+    Returns
+    -------
+    cache: ResponseCache
+        Shared response cache, or None if caching is disabled.
+    """
+    global _cache
+
+    # caching disabled with set_cache(False)
+    if _cache is False:
+        return None
+
+    if _cache is None:
+        data_cred = DataCredentials()
+        if not data_cred.cache_enabled:
+            return None
+        with _cache_lock:
+            if _cache is None:
+                _cache = new_cache(data_cred=data_cred)
+
+    return _cache
+
+
+def new_cache(backend: Optional[str] = None, data_cred: Optional[DataCredentials] = None,
+              **kwargs) -> ResponseCache:
+    """
+    Creates a response cache.
+
+    Parameters
+    ----------
+    backend: str, {'sqlite', 'dir'}, optional, default None
+        Storage backend. If not provided, default is set to cache_backend stored in DataCredentials.
+    data_cred: DataCredentials, optional, default None
+        Data credentials with the cache settings.
+
+    Other Parameters
+    ----------------
+    path, max_size, ttls:
+        Passed to the ResponseCache constructor.
+
+    Returns
+    -------
+    cache: ResponseCache
+        Response cache.
+    """
+    if data_cred is None:
+        data_cred = DataCredentials()
+    backend = backend if backend is not None else data_cred.cache_backend
+
+    if backend == 'sqlite':
+        return SQLiteCache(data_cred=data_cred, **kwargs)
+    elif backend == 'dir':
+        return DirectoryCache(data_cred=data_cred, **kwargs)
+    else:
+        raise ValueError(f"{backend} is an invalid cache backend. Valid backends are: sqlite, dir.")
+
+
+def set_cache(cache: Union[ResponseCache, bool, None] = None) -> Optional[ResponseCache]:
+    """
+    Replaces the process-wide response cache.
+
+    Parameters
+    ----------
+    cache: ResponseCache or bool, optional, default None
+        New response cache. True creates a cache from DataCredentials, False disables caching and None
+        resets to the DataCredentials cache_enabled setting.
+
+    Returns
+    -------
+    cache: ResponseCache
+        Shared response cache, or None if caching is disabled.
+    """
+    global _cache
+
+    with _cache_lock:
+        _cache = new_cache() if cache is True else cache
+
+    return _cache if _cache is not False else None
+
+
+def cached(vendor: str, url: str, params: Optional[Dict[str, Any]], fetch: Callable[[], Any],
+           end_date: Any = None, freq: Optional[str] = None,
+           cacheable: Optional[Callable[[Any], bool]] = None,
+           headers: Optional[Dict[str, str]] = None) -> Any:
+    """
+    Gets a response from the process-wide cache, or fetches and caches it.
+
+    Parameters
+    ----------
+    vendor: str
+        Name of data vendor.
+    url: str
+        Endpoint url or method name.
+    params: dict
+        Dictionary containing parameter values for request.
+    fetch: callable
+        Function with no arguments which fetches the response. Empty (None) responses are not cached.
+    end_date: str, int, datetime or pd.Timestamp, optional, default None
+        End date of the request, responses whose bars have all closed never expire.
+    freq: str, optional, default None
+        Frequency of data observations.
+    cacheable: callable, optional, default None
+        Function which returns False for responses which must not be cached, e.g. error payloads.
+    headers: dict, optional, default None
+        Dictionary containing headers for request, whose credentials are part of the cache key.
+
+    Returns
+    -------
+    resp: Any
+        Data response.
+    """
+    cache = get_cache()
+    if cache is None:
+        return fetch()
+
+    key = make_key(vendor, url, params, headers)
+    resp = cache.get(key)
+    if resp is None:
+        resp = fetch()
+        if resp is not None and (cacheable is None or cacheable(resp)):
+            cache.set(key, resp, vendor, cache.get_ttl(vendor, end_date, freq))
+
+    return resp
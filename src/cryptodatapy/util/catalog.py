@@ -0,0 +1,222 @@
+import threading
+from importlib import resources
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+import pandas as pd
+
+
+class Catalog:
+    """
+    Read-only, in-memory copy of the tickers and fields catalogs (conf/tickers.csv and conf/fields.csv).
+
+    The csv files are parsed once and indexed into dicts which map CryptoDataPy ids to every catalog
+    column, e.g. the id of a ticker or field for a data source, and data source ids back to CryptoDataPy ids.
+    Lookups are hash lookups instead of DataFrame filters, and the indexes are never mutated after construction
+    so a single instance can be shared by all threads.
+    """
+
+    def __init__(self, tickers: pd.DataFrame, fields: pd.DataFrame):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        tickers: pd.DataFrame
+            Tickers catalog with CryptoDataPy tickers (index) and metadata (cols).
+        fields: pd.DataFrame
+            Fields catalog with CryptoDataPy fields (index) and metadata (cols).
+        """
+        self._tickers = tickers
+        self._fields = fields
+        self._ticker_index = self._index(tickers)
+        self._field_index = self._index(fields)
+        self._ticker_reverse_index = self._reverse_index(tickers)
+        self._field_reverse_index = self._reverse_index(fields)
+        self._field_reverse_index_lower = self._reverse_index(fields, lower=True)
+
+    @classmethod
+    def from_files(cls) -> 'Catalog':
+        """
+        Loads the catalogs from the csv files shipped in cryptodatapy.conf.
+
+        Returns
+        -------
+        catalog: Catalog
+            Catalog with tickers and fields indexes.
+        """
+        conf = resources.files("cryptodatapy.conf")
+        with conf.joinpath("tickers.csv").open("rb") as f:
+            tickers_df = pd.read_csv(f, index_col=0, encoding="latin1")
+        with conf.joinpath("fields.csv").open("rb") as f:
+            fields_df = pd.read_csv(f, index_col=0, encoding="latin1")
+
+        return cls(tickers_df, fields_df)
+
+    @staticmethod
+    def _index(df: pd.DataFrame) -> Mapping[str, Mapping[Any, Any]]:
+        """
+        Indexes catalog values by column and CryptoDataPy id, keeping the first row of duplicated ids.
+        """
+        df = df[~df.index.duplicated()]
+
+        return MappingProxyType({col: MappingProxyType(values) for col, values in df.to_dict().items()})
+
+    @staticmethod
+    def _reverse_index(df: pd.DataFrame, lower: bool = False) -> Mapping[str, Mapping[Any, Any]]:
+        """
+        Indexes CryptoDataPy ids by data source id column and data source id, keeping the first matching row.
+        If lower is True, data source ids are lowercase strings.
+        """
+        index = {}
+        for col in df.columns:
+            if col.endswith("_id"):
+                ids = df[col].dropna()
+                if lower:
+                    ids = ids.astype(str).str.lower()
+                ids = ids[~ids.duplicated()]
+                index[col[:-3]] = MappingProxyType(dict(zip(ids, ids.index)))
+
+        return MappingProxyType(index)
+
+    @property
+    def tickers(self) -> pd.DataFrame:
+        """
+        Tickers catalog, as a copy which can be modified by the caller.
+        """
+        return self._tickers.copy()
+
+    @property
+    def fields(self) -> pd.DataFrame:
+        """
+        Fields catalog, as a copy which can be modified by the caller.
+        """
+        return self._fields.copy()
+
+    def get_ticker(self, ticker: str, col: str) -> Any:
+        """
+        Gets a ticker's value for a catalog column.
+
+        Parameters
+        ----------
+        ticker: str
+            Ticker in CryptoDataPy format.
+        col: str
+            Name of tickers catalog column, e.g. 'tiingo_id', 'country_name'.
+
+        Returns
+        -------
+        value: Any
+            Catalog value, NaN if missing.
+
+        Raises
+        ------
+        KeyError
+            If the ticker or column is not in the catalog.
+        """
+        return self._ticker_index[col][ticker]
+
+    def get_field(self, field: str, col: str) -> Any:
+        """
+        Gets a field's value for a catalog column.
+
+        Parameters
+        ----------
+        field: str
+            Field in CryptoDataPy format.
+        col: str
+            Name of fields catalog column, e.g. 'glassnode_id', 'unit'.
+
+        Returns
+        -------
+        value: Any
+            Catalog value, NaN if missing.
+
+        Raises
+        ------
+        KeyError
+            If the field or column is not in the catalog.
+        """
+        return self._field_index[col][field]
+
+    def get_tickers_map(self, data_source: str) -> Mapping[Any, str]:
+        """
+        Gets the mapping from data source ticker ids to CryptoDataPy tickers.
+
+        Parameters
+        ----------
+        data_source: str
+            Name of data source, e.g. 'tiingo'.
+
+        Returns
+        -------
+        tickers_map: mapping
+            Read-only mapping from data source ids to tickers, empty if the data source has no ids in the catalog.
+        """
+        return self._ticker_reverse_index.get(data_source, MappingProxyType({}))
+
+    def get_fields_map(self, data_source: str, lower: bool = False) -> Mapping[Any, str]:
+        """
+        Gets the mapping from data source field ids to CryptoDataPy fields.
+
+        Parameters
+        ----------
+        data_source: str
+            Name of data source, e.g. 'coinmetrics'.
+        lower: bool, default False
+            Key the mapping by lowercase data source ids, for case-insensitive lookups.
+
+        Returns
+        -------
+        fields_map: mapping
+            Read-only mapping from data source ids to fields, empty if the data source has no ids in the catalog.
+        """
+        index = self._field_reverse_index_lower if lower else self._field_reverse_index
+
+        return index.get(data_source, MappingProxyType({}))
+
+
+# process-wide catalog
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> Catalog:
+    """
+    Gets the process-wide catalog, loading the csv files on first use.
+
+    Returns
+    -------
+    catalog: Catalog
+        Shared catalog.
+    """
+    global _catalog
+
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = Catalog.from_files()
+
+    return _catalog
+
+
+def set_catalog(catalog: Optional[Catalog] = None) -> Catalog:
+    """
+    Replaces the process-wide catalog, e.g. to reload the csv files after editing them.
+
+    Parameters
+    ----------
+    catalog: Catalog, optional, default None
+        New catalog. If None, the catalog is reloaded from the csv files.
+
+    Returns
+    -------
+    catalog: Catalog
+        Shared catalog.
+    """
+    global _catalog
+
+    with _catalog_lock:
+        _catalog = catalog if catalog is not None else Catalog.from_files()
+
+    return _catalog
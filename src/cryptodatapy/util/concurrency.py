@@ -0,0 +1,66 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional
+
+
+def thread_map(func: Callable[[Any], Any], items: Iterable[Any], max_workers: Optional[int] = None) -> List[Any]:
+    """
+    Applies a function to each item in a bounded thread pool, for I/O-bound per-ticker requests.
+
+    Parameters
+    ----------
+    func: callable
+        Function called with each item. It should handle its own exceptions so that a failed item doesn't stop the
+        others, exceptions it raises are re-raised after the pool is shut down.
+    items: iterable
+        Items, e.g. tickers.
+    max_workers: int, optional, default None
+        Maximum number of threads. If None or 1, items are processed one at a time in the calling thread.
+
+    Returns
+    -------
+    results: list
+        Results, in the same order as items regardless of completion order.
+    """
+    items = list(items)
+
+    # sequential
+    if max_workers is None or max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    # thread pool
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def process_map(func: Callable[[Any], Any], items: Iterable[Any], max_workers: Optional[int] = None) -> List[Any]:
+    """
+    Applies a function to each item in a bounded process pool, for CPU-bound per-series model fits.
+
+    Parameters
+    ----------
+    func: callable
+        Picklable function, e.g. a module level function or a functools.partial of one, called with each item.
+        Exceptions it raises are re-raised in the calling process.
+    items: iterable
+        Picklable items, e.g. chunks of column indices.
+    max_workers: int, optional, default None
+        Maximum number of processes. If None or 1, items are processed one at a time in the calling process.
+        Workers are spawned rather than forked, so that they don't inherit locks held by other threads of the
+        calling process, e.g. those of model fitting libraries.
+
+    Returns
+    -------
+    results: list
+        Results, in the same order as items regardless of completion order.
+    """
+    items = list(items)
+
+    # sequential
+    if max_workers is None or max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    # process pool
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(items)),
+                             mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(func, items))
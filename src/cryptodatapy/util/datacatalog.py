@@ -1,12 +1,10 @@
 from dataclasses import dataclass, field
-from importlib import resources
 from io import StringIO
 from typing import Dict, List, Optional, Union
 
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+from cryptodatapy.util.catalog import get_catalog
 
 
 @dataclass
@@ -84,10 +82,8 @@ class DataCatalog:
         tickers_df: pd.DataFrame
             DataFrame with requested tickers metadata.
         """
-        # get tickers csv file
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        # get tickers catalog
+        tickers_df = get_catalog().tickers
 
         # filter by tickers
         if tickers is not None:
@@ -141,10 +137,8 @@ class DataCatalog:
         tickers_df: pd.DataFrame
             DataFrame with requested tickers metadata.
         """
-        # get tickers csv file
-        with resources.path("cryptodatapy.conf", "tickers.csv") as f:
-            tickers_path = f
-        tickers_df = pd.read_csv(tickers_path, index_col=0, encoding="latin1")
+        # get tickers catalog
+        tickers_df = get_catalog().tickers
 
         if by_col is None or keyword is None:
             raise ValueError("Provide values to search for 'by_col' and 'keyword' parameters.")
@@ -182,10 +176,8 @@ class DataCatalog:
         fields_df: pd.DataFrame
             DataFrame with requested fields metadata.
         """
-        # get fields csv file
-        with resources.path("cryptodatapy.conf", "fields.csv") as f:
-            fields_path = f
-        fields_df = pd.read_csv(fields_path, index_col=0, encoding="latin1")
+        # get fields catalog
+        fields_df = get_catalog().fields
 
         # filter by field ids
         if fields is not None:
@@ -224,10 +216,8 @@ class DataCatalog:
         fields_df: pd.DataFrame
             DataFrame with fields metadata.
         """
-        # get fields csv file
-        with resources.path("cryptodatapy.conf", "fields.csv") as f:
-            fields_path = f
-        fields_df = pd.read_csv(fields_path, index_col=0, encoding="latin1")
+        # get fields catalog
+        fields_df = get_catalog().fields
 
         if by_col is None or keyword is None:
             raise ValueError("Provide values to search for 'by_col' and 'keyword' parameters.")
@@ -257,7 +247,10 @@ class DataCatalog:
         sc: Pd.Dataframe or list
             DataFrame with stablecoin info or list of stablecoin tickers.
         """
-        # chrome driver
+        # chrome driver, imported on use as selenium is slow to import
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
         driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
         # urls
         sources = {
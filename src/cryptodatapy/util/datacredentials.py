@@ -64,6 +64,57 @@ class DataCredentials:
     # search URLs
     dbnomics_search_url: str = "https://db.nomics.world/"
 
+    # HTTP session settings
+    http_pool_connections: int = 20  # number of per-host connection pools kept alive
+    http_pool_maxsize: int = 10  # max number of connections kept alive per host
+    http_pool_block: bool = False  # block when host pool is exhausted instead of opening a new connection
+    http_connect_timeout: float = 10.0  # seconds
+    http_read_timeout: float = 60.0  # seconds
+
+    # rate limits, in requests per second, used when a data source's rate_limit is not set
+    rate_limits: dict = field(default_factory=lambda: {
+        'cryptocompare': 20.0,
+        'glassnode': 10.0,
+        'tiingo': 10.0,
+        'polygon': 10.0,
+        'dydx': 10.0,
+        'ccxt': 1.0,
+        'default': 5.0
+    })
+    rate_limit_capacity: float = 1.0  # max burst size, 1 spaces requests evenly
+    rate_limit_backend: str = 'memory'  # 'memory' (threads, tasks) or 'file' (threads, tasks and processes)
+    rate_limit_dir: str = None  # dir for file backend state, defaults to temp dir
+
+    # response cache settings
+    cache_enabled: bool = False  # cache vendor responses on disk
+    cache_backend: str = 'sqlite'  # 'sqlite' (single file) or 'dir' (one file per response)
+    cache_dir: str = None  # defaults to cache dir in data_dir
+    cache_max_size: int = 2 ** 30  # bytes, least recently used responses are evicted above it
+    # time-to-live in seconds of responses which include the still open bar, closed bars never expire
+    cache_ttls: dict = field(default_factory=lambda: {
+        'cryptocompare': 300,
+        'glassnode': 600,
+        'tiingo': 300,
+        'coinmetrics': 600,
+        'ccxt': 60,
+        'default': 3600
+    })
+
+    # local data root of the response cache, snapshots and time series store, defaults to $CRYPTODATAPY_HOME
+    # or ~/.cryptodatapy
+    data_dir: str = None
+
+    # metadata snapshot settings, e.g. ccxt exchange markets
+    snapshot_enabled: bool = False  # keep local snapshots of exchange markets and currencies, opt in
+    snapshot_dir: str = None  # defaults to snapshots dir in data_dir
+    snapshot_ttl: float = 86400.0  # seconds after which snapshots are refreshed in the background
+
+    # data source registry settings
+    vendor_ttl: float = 3600.0  # seconds data source objects and their metadata are reused for
+
+    # local time series store, directory or fsspec url, defaults to store dir in data_dir
+    store_path: str = None
+
     def __post_init__(self):
         """
         Read API keys from environment variables at instance initialization.
@@ -88,6 +139,16 @@ class DataCredentials:
         if self.coinmetrics_api_key is None:
             self.coinmetrics_api_key = os.environ.get('COINMETRICS_API_KEY')
 
+        # local data dirs
+        if self.data_dir is None:
+            self.data_dir = os.environ.get('CRYPTODATAPY_HOME', os.path.join(os.path.expanduser('~'), '.cryptodatapy'))
+        if self.cache_dir is None:
+            self.cache_dir = os.path.join(self.data_dir, 'cache')
+        if self.snapshot_dir is None:
+            self.snapshot_dir = os.path.join(self.data_dir, 'snapshots')
+        if self.store_path is None:
+            self.store_path = os.path.join(self.data_dir, 'store')
+
         # Set CoinMetrics base URL based on whether API key is present
         if self.coinmetrics_base_url is None:
             if self.coinmetrics_api_key is not None and self.coinmetrics_api_key != '':
@@ -0,0 +1,45 @@
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def attach(package: str, attrs: Dict[str, str]) -> Tuple[Callable, Callable, List[str]]:
+    """
+    Lazily exposes the public names of a package, importing their modules on first access (PEP 562).
+
+    Parameters
+    ----------
+    package: str
+        Name of the package, i.e. __name__ of its __init__ module.
+    attrs: dict
+        Dictionary with public name keys and module values. Modules starting with '.' are relative to the package.
+        Names equal to the last part of their module are submodules.
+
+    Returns
+    -------
+    __getattr__: callable
+        Module-level __getattr__ of the package.
+    __dir__: callable
+        Module-level __dir__ of the package.
+    __all__: list
+        Public names of the package, without its submodules so that star imports don't import every module.
+
+    Examples
+    --------
+    >>> __getattr__, __dir__, __all__ = attach(__name__, {'GetData': '.getdata'})
+    """
+    def __getattr__(name: str):
+        if name not in attrs:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        module = importlib.import_module(attrs[name], package)
+        value = module if module.__name__.rsplit('.', 1)[-1] == name else getattr(module, name)
+        # set on package so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attrs))
+
+    return __getattr__, __dir__, [name for name, module in attrs.items() if module.rsplit('.', 1)[-1] != name]
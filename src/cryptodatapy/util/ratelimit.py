@@ -0,0 +1,399 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from hashlib import sha1
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None
+
+from cryptodatapy.util.datacredentials import DataCredentials
+
+
+class TokenBucket:
+    """
+    In-memory token bucket shared by the threads and asyncio tasks of a process.
+
+    Requests reserve tokens ahead of time, so the bucket can go into debt: the returned wait time is how long the
+    caller must wait for its reservation to be covered. This keeps callers in FIFO order and the request rate at,
+    but never above, the refill rate.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        rate: float
+            Number of tokens (requests) added to the bucket per second.
+        capacity: float, optional, default None
+            Maximum number of tokens the bucket can hold, i.e. the largest allowed burst. If None, defaults to 1,
+            which spaces requests evenly at 1/rate seconds.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._last = self._clock()
+
+    @property
+    def rate(self):
+        """
+        Returns number of tokens added to the bucket per second.
+        """
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate):
+        """
+        Sets number of tokens added to the bucket per second.
+        """
+        if not isinstance(rate, (int, float)) or rate <= 0:
+            raise ValueError("Rate must be a positive number of requests per second.")
+        self._rate = float(rate)
+
+    @property
+    def capacity(self):
+        """
+        Returns maximum number of tokens the bucket can hold.
+        """
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity):
+        """
+        Sets maximum number of tokens the bucket can hold.
+        """
+        if capacity is None:
+            self._capacity = 1.0
+        elif isinstance(capacity, (int, float)) and capacity >= 1:
+            self._capacity = float(capacity)
+        else:
+            raise ValueError("Capacity must be a number greater than or equal to 1.")
+
+    @staticmethod
+    def _clock() -> float:
+        return time.monotonic()
+
+    def _refill(self, tokens: float, last: float, now: float) -> float:
+        """
+        Refills tokens for the time elapsed since last update.
+        """
+        return min(self.capacity, tokens + (now - last) * self.rate)
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Reserves tokens from the bucket.
+
+        Parameters
+        ----------
+        tokens: float, default 1
+            Number of tokens to reserve.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds to wait before the reservation is covered.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = self._refill(self._tokens, self._last, now) - tokens
+            self._last = now
+
+            return max(0.0, -self._tokens / self.rate)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket whose state is stored in a file, shared by all worker processes on a host.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, path: Optional[str] = None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        rate: float
+            Number of tokens (requests) added to the bucket per second.
+        capacity: float, optional, default None
+            Maximum number of tokens the bucket can hold, i.e. the largest allowed burst.
+        path: str
+            Path of the state file. Processes using the same path share the bucket.
+        """
+        if fcntl is None:
+            raise OSError("The file rate limit backend requires fcntl and is not available on this platform.")
+        if path is None:
+            raise ValueError("Path of the rate limit state file is required for the file backend.")
+        self.path = path
+        super().__init__(rate, capacity)
+
+    @staticmethod
+    def _clock() -> float:
+        # wall clock time is shared by processes, monotonic clocks are not
+        return time.time()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Reserves tokens from the bucket, holding an exclusive lock on the state file.
+
+        Parameters
+        ----------
+        tokens: float, default 1
+            Number of tokens to reserve.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds to wait before the reservation is covered.
+        """
+        with self._lock:
+            with open(self.path, 'a+') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read())
+                    except ValueError:
+                        state = {'tokens': self.capacity, 'last': self._clock()}
+
+                    now = self._clock()
+                    state['tokens'] = self._refill(state['tokens'], state['last'], now) - tokens
+                    state['last'] = now
+
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+            return max(0.0, -state['tokens'] / self.rate)
+
+
+class RateLimiter:
+    """
+    Blocks or awaits until a request is allowed by the underlying token bucket.
+    """
+
+    def __init__(self, bucket: TokenBucket):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        bucket: TokenBucket
+            Token bucket which tracks the request budget.
+        """
+        self.bucket = bucket
+
+    @property
+    def rate(self) -> float:
+        """
+        Returns number of requests allowed per second.
+        """
+        return self.bucket.rate
+
+    def max_workers(self, latency: float = 1.0, limit: int = 16) -> int:
+        """
+        Gets the number of threads which keeps the request budget in use, for data sources which fetch concurrently.
+
+        This is the larger of the number of requests allowed at once (the burst size) and the number allowed over
+        the latency of a request. More threads would only wait on the bucket, which paces them in any case.
+
+        Parameters
+        ----------
+        latency: float, default 1.0
+            Typical duration of a request in seconds.
+        limit: int, default 16
+            Maximum number of threads.
+
+        Returns
+        -------
+        max_workers: int
+            Number of threads.
+        """
+        return max(1, min(limit, int(max(self.bucket.capacity, self.rate * latency))))
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Blocks the calling thread until tokens are available.
+
+        Parameters
+        ----------
+        tokens: float, default 1
+            Number of tokens to acquire.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds waited.
+        """
+        wait = self.bucket.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """
+        Suspends the calling task until tokens are available, without blocking the event loop.
+
+        Parameters
+        ----------
+        tokens: float, default 1
+            Number of tokens to acquire.
+
+        Returns
+        -------
+        wait: float
+            Number of seconds waited.
+        """
+        wait = self.bucket.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        return wait
+
+
+def rate_limit_to_rate(rate_limit: Any) -> Optional[float]:
+    """
+    Converts a data source's rate_limit attribute to a number of requests per second.
+
+    Parameters
+    ----------
+    rate_limit: int, float, dict or pd.DataFrame
+        Rate limit in one of the formats used by the data sources: minimum delay between requests in milliseconds
+        (CCXT), dictionary with 'requests_per_second', 'requests_per_minute', etc. keys (dYdX), dictionary with
+        exchange-delay key-value pairs (CCXT.get_rate_limit_info) or dataframe with calls made and left by
+        frequency (CryptoCompare).
+
+    Returns
+    -------
+    rate: float
+        Number of requests per second, the strictest of the per second and per minute limits, or None if it can't
+        be inferred. Hourly, daily and monthly quotas are not spread into a per second pace.
+    """
+    if isinstance(rate_limit, bool) or rate_limit is None:
+        return None
+
+    # delay between requests in ms
+    if isinstance(rate_limit, (int, float)):
+        return 1000 / rate_limit if rate_limit > 0 else None
+
+    if isinstance(rate_limit, dict):
+        # strictest of the limits over short windows, hourly and daily quotas don't set the pace
+        if any(str(key).startswith('requests_per_') for key in rate_limit):
+            secs = {'requests_per_second': 1, 'requests_per_minute': 60}
+            rates = [float(rate_limit[key]) / secs[key] for key in secs if rate_limit.get(key)]
+            return min(rates) if rates else None
+        delays = [v for v in rate_limit.values() if isinstance(v, (int, float)) and not isinstance(v, bool)]
+        if delays:
+            return rate_limit_to_rate(max(delays))
+
+    # calls made and left by frequency
+    if isinstance(rate_limit, pd.DataFrame) and {'calls_made', 'calls_left'}.issubset(rate_limit.columns):
+        # hourly, daily and monthly quotas don't set the pace
+        secs = {'second': 1, 'minute': 60}
+        rates = [(rate_limit.loc[freq, 'calls_made'] + rate_limit.loc[freq, 'calls_left']) / secs[freq]
+                 for freq in secs if freq in rate_limit.index]
+        if rates:
+            return float(min(rates))
+
+    return None
+
+
+# process-wide rate limiters, by key
+_limiters: Dict[str, RateLimiter] = {}
+# whether the rate and capacity of each limiter were set explicitly or from defaults
+_explicit: Dict[str, Dict[str, bool]] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+        key: str,
+        rate: Optional[float] = None,
+        rate_limit: Any = None,
+        capacity: Optional[float] = None,
+        backend: Optional[str] = None,
+        data_cred: Optional[DataCredentials] = None
+) -> RateLimiter:
+    """
+    Gets the rate limiter shared by every caller using the same key, e.g. vendor, api key or exchange id.
+
+    Parameters
+    ----------
+    key: str
+        Rate limit key, e.g. 'cryptocompare:<api key>' or 'ccxt:binance'.
+    rate: float, optional, default None
+        Number of requests allowed per second. Takes precedence over rate_limit.
+    rate_limit: Any, optional, default None
+        Data source's rate_limit attribute, converted to requests per second with rate_limit_to_rate. If neither
+        rate nor rate_limit are provided, the rate is looked up in the rate_limits stored in DataCredentials by the
+        key's prefix.
+    capacity: float, optional, default None
+        Maximum burst size. If not provided, default is set to rate_limit_capacity stored in DataCredentials.
+        Defaults are only applied when the limiter is created. Explicit rates and capacities update an existing
+        limiter, keeping the stricter of conflicting explicit settings.
+    backend: str, {'memory', 'file'}, optional, default None
+        Token bucket backend. 'memory' is shared by threads and asyncio tasks, 'file' is also shared by processes.
+        If not provided, default is set to rate_limit_backend stored in DataCredentials.
+    data_cred: DataCredentials, optional, default None
+        Data credentials with the rate limit settings.
+
+    Returns
+    -------
+    limiter: RateLimiter
+        Rate limiter for the key.
+    """
+    if data_cred is None:
+        data_cred = DataCredentials()
+
+    # requests per second
+    if rate is None:
+        rate = rate_limit_to_rate(rate_limit)
+    explicit_rate, explicit_capacity = rate is not None, capacity is not None
+    if rate is None:
+        rate = data_cred.rate_limits.get(key.split(':')[0], data_cred.rate_limits['default'])
+    if capacity is None:
+        capacity = data_cred.rate_limit_capacity
+
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+
+        if limiter is None:
+            backend = backend if backend is not None else data_cred.rate_limit_backend
+            if backend == 'memory':
+                bucket = TokenBucket(rate, capacity)
+            elif backend == 'file':
+                # hash key to keep api keys out of file names
+                state_dir = data_cred.rate_limit_dir or os.path.join(tempfile.gettempdir(), 'cryptodatapy_ratelimits')
+                os.makedirs(state_dir, exist_ok=True)
+                path = os.path.join(state_dir, sha1(key.encode()).hexdigest() + '.json')
+                bucket = FileTokenBucket(rate, capacity, path=path)
+            else:
+                raise ValueError(f"{backend} is an invalid rate limit backend. Valid backends are: memory, file.")
+            limiter = RateLimiter(bucket)
+            _limiters[key] = limiter
+            _explicit[key] = {'rate': explicit_rate, 'capacity': explicit_capacity}
+
+        else:
+            # defaults never override a shared limiter, conflicting explicit settings keep the stricter one
+            explicit = _explicit.setdefault(key, {'rate': False, 'capacity': False})
+            if explicit_rate:
+                limiter.bucket.rate = min(limiter.bucket.rate, rate) if explicit['rate'] else rate
+                explicit['rate'] = True
+            if explicit_capacity:
+                limiter.bucket.capacity = min(limiter.bucket.capacity, capacity) if explicit['capacity'] \
+                    else capacity
+                explicit['capacity'] = True
+
+    return limiter
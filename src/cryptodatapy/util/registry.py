@@ -0,0 +1,240 @@
+import copy
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator, Optional, Tuple
+
+import pandas as pd
+
+from cryptodatapy.util.datacredentials import DataCredentials
+
+# data source obj attributes holding metadata, filled on first use
+META_ATTRS = ("exchanges", "indexes", "assets", "markets", "market_types", "fields", "frequencies", "rate_limit")
+
+
+class VendorRegistry:
+    """
+    Process-wide registry of data source objects, by source, exchange and api key.
+
+    Data source objects load their metadata (markets, assets, fields, frequencies) and clients, e.g. a ccxt
+    exchange with its markets or a CoinMetrics client, on first use. Keeping the objects alive between requests
+    lets repeated requests skip this warm-up. Entries expire after a time-to-live and can be invalidated, e.g.
+    after an exchange lists new markets.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, data_cred: Optional[DataCredentials] = None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        ttl: float, optional, default None
+            Time-to-live of data source objects, in seconds. If not provided, default is set to vendor_ttl stored in
+            DataCredentials.
+        data_cred: DataCredentials, optional, default None
+            Data credentials with the registry settings. If not provided, a new instance is created.
+        """
+        if data_cred is None:
+            data_cred = DataCredentials()
+
+        self.ttl = ttl if ttl is not None else data_cred.vendor_ttl
+        self._lock = threading.Lock()
+        self._entries = {}  # key: [obj, init metadata, expiry, in use]
+
+    @staticmethod
+    def make_key(source: str, exch: Optional[str] = None, api_key: Optional[str] = None) -> Tuple[Hashable, ...]:
+        """
+        Makes the registry key of a data source object.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source, e.g. 'ccxt'.
+        exch: str, optional, default None
+            Name of exchange, for data sources which bind an exchange on first use, e.g. 'binance'.
+        api_key: str, optional, default None
+            Api key of data source object.
+
+        Returns
+        -------
+        key: tuple
+            Registry key.
+        """
+        return source, exch, api_key
+
+    @staticmethod
+    def reset(obj: Any) -> Any:
+        """
+        Resets the data request and results a data source object keeps from a request.
+
+        Parameters
+        ----------
+        obj: Any
+            Data source object.
+
+        Returns
+        -------
+        obj: Any
+            Data source object, without data request and results.
+        """
+        # converted data request, reused by the next request if set
+        if hasattr(obj, "data_req"):
+            obj.data_req = None
+        if isinstance(getattr(obj, "data", None), pd.DataFrame):
+            obj.data = pd.DataFrame()
+        if isinstance(getattr(obj, "data_resp", None), list):
+            obj.data_resp = []
+
+        return obj
+
+    def _get_entry(self, key: Tuple[Hashable, ...], factory: Callable[[], Any]) -> list:
+        """
+        Gets the registry entry of a key, creating the data source object if missing or expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] > now:
+                return entry
+
+        # instantiate outside the lock, constructors may request metadata
+        obj = factory()
+        init_meta = {attr: getattr(obj, attr) for attr in META_ATTRS if hasattr(obj, attr)}
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] <= now:
+                entry = [obj, init_meta, time.monotonic() + self.ttl, False]
+                self._entries[key] = entry
+
+        return entry
+
+    @contextmanager
+    def lease(self, key: Tuple[Hashable, ...], factory: Callable[[], Any], fresh_meta: bool = False) -> Iterator[Any]:
+        """
+        Leases the data source object of a key for a request.
+
+        The shared object is leased to one caller at a time, other callers get a shallow copy which shares the
+        metadata loaded so far. Clients such as a ccxt exchange or a CoinMetrics client aren't thread-safe, so the
+        copy creates its own with the object's new_clients method, if it has one. The data request and results kept
+        from a previous request are reset.
+
+        Parameters
+        ----------
+        key: tuple
+            Registry key, see make_key.
+        factory: callable
+            Creates the data source object if it is not in the registry or has expired.
+        fresh_meta: bool, default False
+            Lease a copy with the metadata attributes of the object when it was created, e.g. for metadata
+            requests with filters which would otherwise overwrite or be served from the shared metadata.
+
+        Yields
+        ------
+        obj: Any
+            Data source object.
+        """
+        entry = self._get_entry(key, factory)
+
+        # shared obj, if not in use
+        shared = False
+        if not fresh_meta:
+            with self._lock:
+                if not entry[3]:
+                    entry[3] = shared = True
+
+        if shared:
+            obj = entry[0]
+        else:
+            obj = copy.copy(entry[0])
+            if fresh_meta:
+                obj.__dict__.update(entry[1])
+            # clients are not shared between threads
+            if callable(getattr(obj, "new_clients", None)):
+                obj.new_clients()
+
+        try:
+            yield self.reset(obj)
+        finally:
+            if shared:
+                with self._lock:
+                    entry[3] = False
+
+    def invalidate(self, source: Optional[str] = None, exch: Optional[str] = None) -> int:
+        """
+        Removes data source objects from the registry, so that their metadata is loaded again on next use.
+
+        Parameters
+        ----------
+        source: str, optional, default None
+            Name of data source. If None, objects of all data sources are removed.
+        exch: str, optional, default None
+            Name of exchange. If None, objects of all exchanges are removed.
+
+        Returns
+        -------
+        n: int
+            Number of objects removed.
+        """
+        with self._lock:
+            keys = [key for key in self._entries
+                    if (source is None or key[0] == source) and (exch is None or key[1] == exch)]
+            for key in keys:
+                del self._entries[key]
+
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Removes all data source objects from the registry.
+        """
+        self.invalidate()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# process-wide registry
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> VendorRegistry:
+    """
+    Gets the process-wide data source registry.
+
+    Returns
+    -------
+    registry: VendorRegistry
+        Shared registry.
+    """
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = VendorRegistry()
+
+    return _registry
+
+
+def set_registry(registry: Optional[VendorRegistry] = None) -> VendorRegistry:
+    """
+    Replaces the process-wide data source registry, e.g. to change the time-to-live.
+
+    Parameters
+    ----------
+    registry: VendorRegistry, optional, default None
+        New registry. If None, an empty registry is created from DataCredentials.
+
+    Returns
+    -------
+    registry: VendorRegistry
+        Shared registry.
+    """
+    global _registry
+
+    with _registry_lock:
+        _registry = registry if registry is not None else VendorRegistry()
+
+    return _registry
@@ -0,0 +1,213 @@
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from cryptodatapy.util.datacredentials import DataCredentials
+
+
+class HTTPSession:
+    """
+    Pooled, keep-alive HTTP session shared by data vendors.
+
+    Wraps a requests.Session with per-host connection pools so that consecutive requests to the same
+    vendor reuse open TCP/TLS connections instead of performing a new handshake for every page.
+    """
+
+    def __init__(
+            self,
+            pool_connections: Optional[int] = None,
+            pool_maxsize: Optional[int] = None,
+            pool_block: Optional[bool] = None,
+            timeout: Optional[Union[float, Tuple[float, float]]] = None,
+            data_cred: Optional[DataCredentials] = None
+    ):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        pool_connections: int, optional, default None
+            Number of per-host connection pools to keep alive. If not provided, default is set to
+            http_pool_connections stored in DataCredentials.
+        pool_maxsize: int, optional, default None
+            Maximum number of connections kept alive in each host pool. If not provided, default is set to
+            http_pool_maxsize stored in DataCredentials.
+        pool_block: bool, optional, default None
+            Whether to block when a host pool has no free connections. If not provided, default is set to
+            http_pool_block stored in DataCredentials.
+        timeout: float or tuple, optional, default None
+            Default (connect, read) timeout in seconds for requests. If not provided, default is set to
+            http_connect_timeout and http_read_timeout stored in DataCredentials.
+        data_cred: DataCredentials, optional, default None
+            Data credentials with the session settings. If not provided, a new instance is created.
+        """
+        if data_cred is None:
+            data_cred = DataCredentials()
+
+        self.pool_connections = pool_connections if pool_connections is not None \
+            else data_cred.http_pool_connections
+        self.pool_maxsize = pool_maxsize if pool_maxsize is not None else data_cred.http_pool_maxsize
+        self.pool_block = pool_block if pool_block is not None else data_cred.http_pool_block
+        self.timeout = timeout if timeout is not None \
+            else (data_cred.http_connect_timeout, data_cred.http_read_timeout)
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._session = None
+        self._adapter = None
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the underlying requests session, creating it on first use or after a fork.
+        """
+        # sockets must not be shared with a forked child process
+        if self._session is None or self._pid != os.getpid():
+            with self._lock:
+                if self._session is None or self._pid != os.getpid():
+                    self._adapter = HTTPAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        pool_block=self.pool_block,
+                    )
+                    session = requests.Session()
+                    session.mount('https://', self._adapter)
+                    session.mount('http://', self._adapter)
+                    self._session = session
+                    self._pid = os.getpid()
+
+        return self._session
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+            **kwargs) -> requests.Response:
+        """
+        Submits get request through the pooled session.
+
+        Parameters
+        ----------
+        url: str
+            Endpoint url for get request.
+        params: dict, optional, default None
+            Dictionary containing parameter values for get request.
+        headers: dict, optional, default None
+            Dictionary containing headers for get request.
+
+        Other Parameters
+        ----------------
+        timeout: float or tuple, optional
+            Overrides the session's default (connect, read) timeout.
+
+        Returns
+        -------
+        resp: requests.Response
+            Response object.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+
+        return self.session.get(url, params=params, headers=headers, **kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Gets connection reuse counters for each host pool.
+
+        Returns
+        -------
+        stats: dictionary
+            Dictionary with host keys and number of requests, new connections and reused connections values.
+        """
+        stats = {}
+
+        if self._adapter is None:
+            return stats
+
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+            host_stats = stats.setdefault(host, {'requests': 0, 'connections': 0, 'reused': 0})
+            host_stats['requests'] += pool.num_requests
+            host_stats['connections'] += pool.num_connections
+            host_stats['reused'] += max(pool.num_requests - pool.num_connections, 0)
+
+        return stats
+
+    def host_stats(self, url: str) -> Dict[str, int]:
+        """
+        Gets connection reuse counters for the host of a url.
+
+        Parameters
+        ----------
+        url: str
+            Url or host name.
+
+        Returns
+        -------
+        stats: dictionary
+            Dictionary with number of requests, new connections and reused connections.
+        """
+        host = urlparse(url).netloc or url
+
+        return self.stats().get(host, {'requests': 0, 'connections': 0, 'reused': 0})
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session, self._adapter, self._pid = None, None, None
+
+
+# process-wide session
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> HTTPSession:
+    """
+    Gets the process-wide pooled HTTP session, creating it from DataCredentials on first use.
+
+    Returns
+    -------
+    session: HTTPSession
+        Shared HTTP session.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = HTTPSession()
+
+    return _session
+
+
+def set_session(session: Optional[HTTPSession] = None) -> HTTPSession:
+    """
+    Replaces the process-wide pooled HTTP session, e.g. to apply new pool sizes or timeouts.
+
+    Parameters
+    ----------
+    session: HTTPSession, optional, default None
+        New HTTP session. If None, a new session is created from DataCredentials.
+
+    Returns
+    -------
+    session: HTTPSession
+        Shared HTTP session.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = session if session is not None else HTTPSession()
+
+    return _session
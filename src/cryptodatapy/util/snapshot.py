@@ -0,0 +1,227 @@
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple, Union
+
+from cryptodatapy.util.datacredentials import DataCredentials
+
+
+class SnapshotStore:
+    """
+    Local snapshots of slow-changing metadata, e.g. the markets and currencies of an exchange.
+
+    Snapshots are stored as one pickle file per name in a local directory. Fresh snapshots are served as is, stale
+    snapshots are served while they are refreshed in a background thread, so that only the first ever request
+    for a snapshot waits for the data source.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = None,
+                 data_cred: Optional[DataCredentials] = None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path: str, optional, default None
+            Directory of snapshot files. If not provided, default is set to snapshot_dir stored in DataCredentials.
+        ttl: float, optional, default None
+            Time-to-live of snapshots, in seconds, after which they are refreshed. If not provided, default is set
+            to snapshot_ttl stored in DataCredentials.
+        data_cred: DataCredentials, optional, default None
+            Data credentials with the snapshot settings. If not provided, a new instance is created.
+        """
+        if data_cred is None:
+            data_cred = DataCredentials()
+
+        self.path = path if path is not None else data_cred.snapshot_dir
+        self.ttl = ttl if ttl is not None else data_cred.snapshot_ttl
+        self._lock = threading.Lock()
+        self._refreshing = {}  # name: refresh thread
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name.replace(os.sep, '_') + '.pkl')
+
+    def get(self, name: str) -> Optional[Tuple[Any, float]]:
+        """
+        Gets a snapshot.
+
+        Parameters
+        ----------
+        name: str
+            Name of snapshot, e.g. 'ccxt_markets_kraken'.
+
+        Returns
+        -------
+        snapshot: tuple, optional
+            Snapshot value and age in seconds, or None if there is no readable snapshot.
+        """
+        try:
+            with open(self._file(name), 'rb') as f:
+                created, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            return None
+
+        return value, time.time() - created
+
+    def set(self, name: str, value: Any) -> None:
+        """
+        Writes a snapshot.
+
+        Parameters
+        ----------
+        name: str
+            Name of snapshot.
+        value: Any
+            Picklable snapshot value.
+        """
+        file = self._file(name)
+        os.makedirs(self.path, exist_ok=True)
+        # write to temp file then rename, readers never see partial files
+        tmp = f"{file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump((time.time(), value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, file)
+
+    def delete(self, name: str) -> None:
+        """
+        Deletes a snapshot, so that it is fetched again on next use.
+
+        Parameters
+        ----------
+        name: str
+            Name of snapshot.
+        """
+        try:
+            os.remove(self._file(name))
+        except OSError:
+            pass
+
+    def refresh(self, name: str, fetch: Callable[[], Any]) -> threading.Thread:
+        """
+        Refreshes a snapshot in a background thread, unless it is already being refreshed.
+
+        Parameters
+        ----------
+        name: str
+            Name of snapshot.
+        fetch: callable
+            Fetches the snapshot value from the data source.
+
+        Returns
+        -------
+        thread: threading.Thread
+            Refresh thread, e.g. to join.
+        """
+        def run():
+            try:
+                self.set(name, fetch())
+            except Exception as e:
+                logging.warning(f"Failed to refresh {name} snapshot: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.pop(name, None)
+
+        with self._lock:
+            thread = self._refreshing.get(name)
+            if thread is None:
+                thread = threading.Thread(target=run, name=f"snapshot-{name}", daemon=True)
+                self._refreshing[name] = thread
+                thread.start()
+
+        return thread
+
+    def get_or_fetch(self, name: str, fetch: Callable[[], Any], block: bool = True) -> Optional[Any]:
+        """
+        Gets a snapshot, refreshing it in the background if stale and fetching it if missing.
+
+        Parameters
+        ----------
+        name: str
+            Name of snapshot.
+        fetch: callable
+            Fetches the snapshot value from the data source.
+        block: bool, default True
+            Fetch a missing snapshot in the calling thread. If False, it is fetched in the background and None is
+            returned.
+
+        Returns
+        -------
+        value: Any
+            Snapshot value, None if missing and block is False.
+        """
+        snapshot = self.get(name)
+
+        # missing
+        if snapshot is None:
+            if not block:
+                self.refresh(name, fetch)
+                return None
+            value = fetch()
+            try:
+                self.set(name, value)
+            except OSError as e:
+                logging.warning(f"Failed to write {name} snapshot: {e}")
+            return value
+
+        # stale, served while refreshed
+        value, age = snapshot
+        if age > self.ttl:
+            self.refresh(name, fetch)
+
+        return value
+
+
+# process-wide snapshot store
+_snapshot_store = None
+_snapshot_store_lock = threading.Lock()
+
+
+def get_snapshot_store() -> Optional[SnapshotStore]:
+    """
+    Gets the process-wide snapshot store, creating it from DataCredentials on first use.
+
+    Returns
+    -------
+    store: SnapshotStore
+        Shared snapshot store, or None if snapshots are disabled.
+    """
+    global _snapshot_store
+
+    # snapshots disabled with set_snapshot_store(False)
+    if _snapshot_store is False:
+        return None
+
+    if _snapshot_store is None:
+        data_cred = DataCredentials()
+        if not data_cred.snapshot_enabled:
+            return None
+        with _snapshot_store_lock:
+            if _snapshot_store is None:
+                _snapshot_store = SnapshotStore(data_cred=data_cred)
+
+    return _snapshot_store
+
+
+def set_snapshot_store(store: Union[SnapshotStore, bool, None] = None) -> Optional[SnapshotStore]:
+    """
+    Replaces the process-wide snapshot store, e.g. to enable snapshots or change their directory or time-to-live.
+
+    Parameters
+    ----------
+    store: SnapshotStore or bool, optional, default None
+        New snapshot store. True creates a snapshot store from DataCredentials, False disables snapshots and None
+        resets to the DataCredentials snapshot_enabled setting.
+
+    Returns
+    -------
+    store: SnapshotStore
+        Shared snapshot store, or None if snapshots are disabled.
+    """
+    global _snapshot_store
+
+    with _snapshot_store_lock:
+        _snapshot_store = SnapshotStore() if store is True else store
+
+    return _snapshot_store if _snapshot_store is not False else None
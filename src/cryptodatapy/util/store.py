@@ -0,0 +1,491 @@
+import os
+import posixpath
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import quote, unquote
+
+import fsspec
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from cryptodatapy.util.cache import freq_to_timedelta
+from cryptodatapy.util.datacredentials import DataCredentials
+
+
+class ParquetStore:
+    """
+    Partitioned Parquet store for tidy dataframes with DatetimeIndex (level 0) and ticker (level 1).
+
+    Data is partitioned by source, frequency, field group and date range, in hive-style directories:
+    <path>/source=<source>/freq=<freq>/field_group=<field_group>/period=<period>/data.parquet, where the period is
+    the month of intraday data and the year of daily or lower frequency data. Reads prune partitions and push down
+    date and ticker predicates to the Parquet row groups.
+    """
+
+    def __init__(self, path: Optional[str] = None, storage_options: Optional[Dict[str, Any]] = None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path: str, optional, default None
+            Local directory or fsspec url of the store, e.g. 's3://bucket/store' or 'memory://store'. If not provided,
+            default is set to store_path stored in DataCredentials.
+        storage_options: dict, optional, default None
+            Options passed to the fsspec filesystem, e.g. credentials or endpoint url.
+        """
+        if path is None:
+            path = DataCredentials().store_path
+
+        self.path = path
+        self.storage_options = storage_options if storage_options is not None else {}
+        self.fs, self.root = fsspec.core.url_to_fs(path, **self.storage_options)
+
+    @staticmethod
+    def _get_period(dates: pd.DatetimeIndex, freq: str) -> pd.Index:
+        """
+        Gets the date range partition of each date: month for intraday data, year otherwise.
+        """
+        fmt = '%Y-%m' if freq_to_timedelta(freq) < pd.Timedelta(days=1) else '%Y'
+
+        return pd.Index(dates.strftime(fmt))
+
+    def _get_dir(self, source: str, freq: str, field_group: Optional[str] = None) -> str:
+        """
+        Gets the directory of a source, frequency and, optionally, field group.
+        """
+        parts = [self.root, f"source={source}", f"freq={freq}"]
+        if field_group is not None:
+            parts.append(f"field_group={field_group}")
+
+        return posixpath.join(*parts)
+
+    def get_field_groups(self, source: str, freq: str) -> List[str]:
+        """
+        Gets the field groups stored for a source and frequency.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of data observations.
+
+        Returns
+        -------
+        field_groups: list
+            List of field groups.
+        """
+        path = self._get_dir(source, freq)
+        if not self.fs.exists(path):
+            return []
+
+        return sorted(posixpath.basename(p.rstrip('/')).split('=', 1)[1] for p in self.fs.ls(path, detail=False)
+                      if posixpath.basename(p.rstrip('/')).startswith('field_group='))
+
+    def write(self, df: pd.DataFrame, source: str, freq: str, field_group: str = 'default') -> None:
+        """
+        Writes a tidy dataframe to the store, upserting rows. New values win over stored ones.
+
+        Parameters
+        ----------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values.
+        source: str
+            Name of data source, e.g. 'ccxt', 'glassnode'.
+        freq: str
+            Frequency of data observations, e.g. '1h', 'd'.
+        field_group: str, default 'default'
+            Name of the group of fields, e.g. 'ohlcv', 'onchain'. Groups are stored separately and joined on read.
+        """
+        if not isinstance(df, pd.DataFrame) or not isinstance(df.index, pd.MultiIndex) or df.index.nlevels != 2:
+            raise TypeError("Dataframe must be a MultiIndex dataframe with date (level 0) and ticker (level 1).")
+        if df.empty:
+            return
+
+        df = df.copy()
+        df.index = df.index.set_names(['date', 'ticker'])
+        df = df[~df.index.duplicated(keep='last')]
+        periods = self._get_period(pd.DatetimeIndex(df.index.get_level_values('date')), freq)
+
+        # upsert each date range partition
+        group_dir = self._get_dir(source, freq, field_group)
+        for period, period_df in df.groupby(periods.values, sort=True):
+            file = posixpath.join(group_dir, f"period={period}", 'data.parquet')
+
+            if self.fs.exists(file):
+                with self.fs.open(file, 'rb') as f:
+                    stored = pq.read_table(f).to_pandas()
+                period_df = period_df.combine_first(stored)
+                period_df = period_df[list(stored.columns) +
+                                      [col for col in period_df.columns if col not in stored.columns]]
+
+            # sort by date and ticker so row group statistics support predicate pushdown
+            table = pa.Table.from_pandas(period_df.sort_index())
+
+            self.fs.makedirs(posixpath.dirname(file), exist_ok=True)
+            tmp = file + '.tmp'
+            with self.fs.open(tmp, 'wb') as f:
+                pq.write_table(table, f, row_group_size=100_000)
+            self.fs.mv(tmp, file)
+
+    def read(
+            self,
+            source: str,
+            freq: str,
+            fields: Optional[Union[str, List[str]]] = None,
+            tickers: Optional[Union[str, List[str]]] = None,
+            start_date: Optional[Union[str, pd.Timestamp]] = None,
+            end_date: Optional[Union[str, pd.Timestamp]] = None,
+            field_group: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Reads a tidy dataframe from the store.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of data observations.
+        fields: str or list, optional, default None
+            Fields to read. If None, all fields are read.
+        tickers: str or list, optional, default None
+            Tickers to read. If None, all tickers are read.
+        start_date: str or pd.Timestamp, optional, default None
+            First date to read.
+        end_date: str or pd.Timestamp, optional, default None
+            Last date to read.
+        field_group: str, optional, default None
+            Field group to read. If None, all field groups are read and joined.
+
+        Returns
+        -------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values.
+        """
+        if isinstance(fields, str):
+            fields = [fields]
+        if isinstance(tickers, str):
+            tickers = [tickers]
+        field_groups = [field_group] if field_group is not None else self.get_field_groups(source, freq)
+
+        dfs = []
+        for group in field_groups:
+            df = self._read_group(source, freq, group, fields, tickers, start_date, end_date)
+            if df is not None:
+                dfs.append(df)
+
+        if not dfs:
+            return pd.DataFrame()
+
+        df = pd.concat(dfs, axis=1) if len(dfs) > 1 else dfs[0]
+        if fields is not None:
+            df = df[[field for field in fields if field in df.columns]]
+
+        return df.sort_index()
+
+    def _read_group(
+            self,
+            source: str,
+            freq: str,
+            field_group: str,
+            fields: Optional[List[str]],
+            tickers: Optional[List[str]],
+            start_date: Optional[Union[str, pd.Timestamp]],
+            end_date: Optional[Union[str, pd.Timestamp]]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Reads a field group, pruning date range partitions and pushing down date and ticker predicates.
+        """
+        path = self._get_dir(source, freq, field_group)
+        if not self.fs.exists(path):
+            return None
+
+        dataset = ds.dataset(
+            path, filesystem=self.fs, format='parquet',
+            partitioning=ds.partitioning(pa.schema([('period', pa.string())]), flavor='hive'),
+            exclude_invalid_files=True
+        )
+        schema = dataset.schema
+
+        # columns
+        columns = None
+        if fields is not None:
+            columns = ['date', 'ticker'] + [field for field in fields if field in schema.names]
+            if len(columns) == 2:
+                return None
+
+        # predicates
+        tz = schema.field('date').type.tz if pa.types.is_timestamp(schema.field('date').type) else None
+        filters = []
+        for date, op in [(start_date, '>='), (end_date, '<=')]:
+            if date is None:
+                continue
+            date = pd.Timestamp(date)
+            if tz is None and date.tz is not None:
+                date = date.tz_convert('UTC').tz_localize(None)
+            elif tz is not None:
+                date = date.tz_localize(tz) if date.tz is None else date.tz_convert(tz)
+            period = self._get_period(pd.DatetimeIndex([date]), freq)[0]
+            date = pa.scalar(date, schema.field('date').type)
+            if op == '>=':
+                filters += [ds.field('period') >= period, ds.field('date') >= date]
+            else:
+                filters += [ds.field('period') <= period, ds.field('date') <= date]
+        if tickers is not None:
+            filters.append(ds.field('ticker').isin(tickers))
+        expr = None
+        for f in filters:
+            expr = f if expr is None else expr & f
+
+        table = dataset.to_table(columns=columns, filter=expr)
+        if table.num_rows == 0:
+            return None
+        df = table.to_pandas()
+        if 'period' in df.columns:
+            df = df.drop(columns='period')
+        if not isinstance(df.index, pd.MultiIndex):
+            df = df.set_index(['date', 'ticker'])
+
+        return df
+
+    def delete(self, source: str, freq: Optional[str] = None, field_group: Optional[str] = None) -> None:
+        """
+        Deletes a source, or a frequency or field group of a source, from the store.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str, optional, default None
+            Frequency of data observations. If None, all frequencies are deleted.
+        field_group: str, optional, default None
+            Field group. If None, all field groups are deleted.
+        """
+        if freq is None:
+            path = posixpath.join(self.root, f"source={source}")
+        else:
+            path = self._get_dir(source, freq, field_group)
+        if self.fs.exists(path):
+            self.fs.rm(path, recursive=True)
+
+
+class FeatherStore:
+    """
+    Store of uncompressed Arrow IPC (Feather V2) files, one per ticker, read through memory maps.
+
+    Files are stored in a local directory as <path>/source=<source>/freq=<freq>/<ticker>.arrow, with rows sorted by
+    date. Reads memory-map the files of the requested tickers and slice the requested fields and date range without
+    copying, so multi-year minute bars for hundreds of markets are paged in by the OS as they are used instead of
+    being loaded into RAM.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Constructor
+
+        Parameters
+        ----------
+        path: str, optional, default None
+            Local directory of the store. If not provided, default is set to store_path stored in DataCredentials.
+        """
+        if path is None:
+            path = DataCredentials().store_path
+
+        self.path = path
+
+    def _get_dir(self, source: str, freq: str) -> str:
+        """
+        Gets the directory of a source and frequency.
+        """
+        return os.path.join(self.path, f"source={source}", f"freq={freq}")
+
+    def _get_file(self, source: str, freq: str, ticker: str) -> str:
+        """
+        Gets the file of a ticker, quoting characters such as '/' in market symbols.
+        """
+        return os.path.join(self._get_dir(source, freq), quote(str(ticker), safe='') + '.arrow')
+
+    def get_tickers(self, source: str, freq: str) -> List[str]:
+        """
+        Gets the tickers stored for a source and frequency.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of data observations.
+
+        Returns
+        -------
+        tickers: list
+            List of tickers.
+        """
+        path = self._get_dir(source, freq)
+        if not os.path.isdir(path):
+            return []
+
+        return sorted(unquote(file[:-len('.arrow')]) for file in os.listdir(path) if file.endswith('.arrow'))
+
+    def _read_table(self, file: str) -> pa.Table:
+        """
+        Reads a file through a memory map, without copying its buffers.
+        """
+        with pa.memory_map(file, 'r') as source:
+            return pa.ipc.open_file(source).read_all()
+
+    def write(self, df: pd.DataFrame, source: str, freq: str) -> None:
+        """
+        Writes a tidy dataframe to the store, upserting rows. New values win over stored ones.
+
+        Parameters
+        ----------
+        df: pd.DataFrame - MultiIndex
+            DataFrame with DatetimeIndex (level 0), ticker (level 1), and field (cols) values.
+        source: str
+            Name of data source, e.g. 'ccxt'.
+        freq: str
+            Frequency of data observations, e.g. '1min'.
+        """
+        if not isinstance(df, pd.DataFrame) or not isinstance(df.index, pd.MultiIndex) or df.index.nlevels != 2:
+            raise TypeError("Dataframe must be a MultiIndex dataframe with date (level 0) and ticker (level 1).")
+
+        os.makedirs(self._get_dir(source, freq), exist_ok=True)
+
+        for ticker, ticker_df in df.groupby(level=1, sort=False):
+            ticker_df = ticker_df.droplevel(1)
+            ticker_df.index.name = 'date'
+            ticker_df = ticker_df[~ticker_df.index.duplicated(keep='last')]
+            file = self._get_file(source, freq, ticker)
+
+            if os.path.exists(file):
+                stored = self._read_table(file).to_pandas().set_index('date')
+                ticker_df = ticker_df.combine_first(stored)
+                ticker_df = ticker_df[list(stored.columns) +
+                                      [col for col in ticker_df.columns if col not in stored.columns]]
+
+            # single record batch, uncompressed, so reads are zero-copy slices of the memory map
+            table = pa.Table.from_pandas(ticker_df.sort_index().reset_index(), preserve_index=False)
+            tmp = file + '.tmp'
+            with pa.OSFile(tmp, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+            os.replace(tmp, file)
+
+    def read(
+            self,
+            source: str,
+            freq: str,
+            tickers: Optional[Union[str, List[str]]] = None,
+            fields: Optional[Union[str, List[str]]] = None,
+            start_date: Optional[Union[str, pd.Timestamp]] = None,
+            end_date: Optional[Union[str, pd.Timestamp]] = None,
+            output: str = 'pandas'
+    ) -> Union[pd.DataFrame, pa.Table, Dict[str, Dict[str, np.ndarray]]]:
+        """
+        Reads a (tickers, fields, date range) slice from the store through memory maps.
+
+        Parameters
+        ----------
+        source: str
+            Name of data source.
+        freq: str
+            Frequency of data observations.
+        tickers: str or list, optional, default None
+            Tickers to read. If None, all tickers are read.
+        fields: str or list, optional, default None
+            Fields to read. If None, all fields are read.
+        start_date: str or pd.Timestamp, optional, default None
+            First date to read.
+        end_date: str or pd.Timestamp, optional, default None
+            Last date to read.
+        output: str, {'pandas', 'arrow', 'numpy'}, default 'pandas'
+            Output format. 'pandas' returns a tidy dataframe with Arrow-backed columns, 'arrow' a table with
+            date, ticker and field columns, and 'numpy' a dictionary with ticker keys and dictionaries of date and
+            field arrays values. Field values are not copied in any format, so rows are grouped by ticker, in
+            the order of tickers, and sorted by date within each ticker.
+
+        Returns
+        -------
+        data: pd.DataFrame, pa.Table or dict
+            Requested slice.
+        """
+        if output not in ['pandas', 'arrow', 'numpy']:
+            raise ValueError(f"{output} is an invalid output format. Valid formats are: pandas, arrow, numpy.")
+        if isinstance(tickers, str):
+            tickers = [tickers]
+        if isinstance(fields, str):
+            fields = [fields]
+        if tickers is None:
+            tickers = self.get_tickers(source, freq)
+
+        tables = {}
+        for ticker in tickers:
+            file = self._get_file(source, freq, ticker)
+            if not os.path.exists(file):
+                continue
+            table = self._read_table(file)
+            table = self._slice_dates(table, start_date, end_date)
+            if fields is not None:
+                table = table.select(['date'] + [field for field in fields if field in table.schema.names])
+            if table.num_rows > 0:
+                tables[ticker] = table
+
+        if output == 'numpy':
+            return {ticker: {col: table.column(col).to_numpy() for col in table.schema.names}
+                    for ticker, table in tables.items()}
+
+        if not tables:
+            return pd.DataFrame() if output == 'pandas' else pa.table({})
+
+        # add ticker column as dictionary array, without materializing strings for each row
+        dictionary = pa.array([str(ticker) for ticker in tables])
+        tables = [table.add_column(1, 'ticker', pa.DictionaryArray.from_arrays(
+            pa.array(np.full(table.num_rows, i, dtype=np.int32)), dictionary))
+            for i, table in enumerate(tables.values())]
+        table = pa.concat_tables(tables, promote_options='default')
+
+        if output == 'arrow':
+            return table
+
+        # arrow-backed field columns, only the index is materialized
+        df = table.drop_columns(['date', 'ticker']).to_pandas(types_mapper=pd.ArrowDtype)
+        df.index = pd.MultiIndex.from_arrays(
+            [pd.DatetimeIndex(table.column('date').to_pandas()), table.column('ticker').to_pandas().astype(str)],
+            names=['date', 'ticker']
+        )
+
+        return df
+
+    @staticmethod
+    def _slice_dates(table: pa.Table, start_date: Optional[Union[str, pd.Timestamp]],
+                     end_date: Optional[Union[str, pd.Timestamp]]) -> pa.Table:
+        """
+        Slices a date-sorted table with a binary search, without copying.
+        """
+        if start_date is None and end_date is None:
+            return table
+
+        dates = table.column('date').to_numpy()
+        start, end = 0, len(dates)
+        if start_date is not None:
+            start = np.searchsorted(dates, FeatherStore._to_datetime64(start_date, dates.dtype), side='left')
+        if end_date is not None:
+            end = np.searchsorted(dates, FeatherStore._to_datetime64(end_date, dates.dtype), side='right')
+
+        return table.slice(start, max(end - start, 0))
+
+    @staticmethod
+    def _to_datetime64(date: Union[str, pd.Timestamp], dtype: np.dtype) -> np.datetime64:
+        """
+        Converts a date to a numpy datetime64 in UTC, comparable to the stored dates.
+        """
+        date = pd.Timestamp(date)
+        if date.tz is not None:
+            date = date.tz_convert('UTC').tz_localize(None)
+
+        return date.to_datetime64().astype(dtype)
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cryptodatapy.util.catalog import get_catalog
+
+
+@pytest.fixture
+def cm_onchain_resp():
+    """
+    Wide CoinMetrics on-chain response: every catalog metric, plus metrics and status cols not in the catalog.
+    """
+    cm_ids = get_catalog().fields.coinmetrics_id.dropna().unique().tolist()
+    cols = ['asset', 'time'] + [c for c in cm_ids if c not in ('asset', 'time')] + \
+        [f'Unknown{i}' for i in range(50)] + [f'{c}-status' for c in cm_ids[:50]]
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.random((2000, len(cols))), columns=cols)
+    df['asset'] = 'btc'
+    df['time'] = pd.date_range('2020-01-01', periods=2000).astype(str)
+
+    return df
@@ -0,0 +1,139 @@
+from importlib import resources
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.transform.od import OutlierDetection
+from cryptodatapy.transform.rolling import rolling_median
+from cryptodatapy.transform.wrangle import WrangleData
+
+
+def convert_fields_to_lib_loop(data_resp: pd.DataFrame, data_source: str) -> pd.DataFrame:
+    """
+    Previous implementation of WrangleData.convert_fields_to_lib: reads the fields csv and filters it
+    three times per col.
+    """
+    with resources.path('cryptodatapy.conf', 'fields.csv') as f:
+        fields_dict_path = f
+    fields_df = pd.read_csv(fields_dict_path, index_col=0, encoding='latin1').copy()
+    fields_list = fields_df[str(data_source) + '_id'].to_list()
+
+    for col in data_resp.columns:
+        if col in fields_list or col.title() in fields_list or col.lower() in fields_list:
+            data_resp.rename(columns={col: fields_df[(fields_df[str(data_source) + '_id'] == col.title()) |
+                                                     (fields_df[str(data_source) + '_id'] == col.lower()) |
+                                                     (fields_df[str(data_source) + '_id'] == col)].index[0]},
+                             inplace=True)
+        elif col == 'index':
+            data_resp.rename(columns={'index': 'ticker'}, inplace=True)
+        elif col == 'asset':
+            data_resp.rename(columns={'asset': 'ticker'}, inplace=True)
+        elif col == 'level':
+            data_resp.rename(columns={'level': 'close'}, inplace=True)
+        elif col == 'institution':
+            pass
+        else:
+            data_resp.drop(columns=[col], inplace=True)
+
+    return data_resp
+
+
+def ccxt_resp(n_markets: int, n_obs: int = 50):
+    """
+    Synthetic CCXT responses: OHLCV lists of lists, and funding rate and open interest lists of dicts.
+    """
+    rng = np.random.default_rng(0)
+    markets = [f"T{i:04d}/USDT:USDT" for i in range(n_markets)]
+    ts = 1_700_000_000_000 + np.arange(n_obs) * 8 * 3600 * 1000
+    ohlcv, funding, oi = [], [], []
+    for i, market in enumerate(markets):
+        vals = rng.random((n_obs, 5))
+        ohlcv.append([[int(t)] + v.tolist() for t, v in zip(ts, vals)])
+        dts = pd.to_datetime(ts, unit='ms').strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        funding.append([{'info': {}, 'symbol': market, 'fundingRate': float(v[0]), 'timestamp': int(t),
+                         'datetime': dt} for t, v, dt in zip(ts, vals, dts)])
+        # odd markets only report open interest value
+        oi.append([{'info': {}, 'symbol': market, 'openInterestAmount': None if i % 2 else float(v[1]),
+                    'openInterestValue': float(v[2]), 'timestamp': int(t), 'datetime': dt}
+                   for t, v, dt in zip(ts, vals, dts)])
+
+    return markets, {'ohlcv': ohlcv, 'funding_rates': funding, 'open_interest': oi}
+
+
+def ccxt_concat(data_req: DataRequest, data_resp: list, data_type: str) -> pd.DataFrame:
+    """
+    Previous assembly of WrangleData.ccxt_*: a frame per ticker, concatenated in a loop.
+    """
+    tidy_data = pd.DataFrame()
+    if data_type == 'ohlcv':
+        for i in range(len(data_req.source_markets)):
+            df = pd.DataFrame(data_resp[i], columns=["date", "open", "high", "low", "close", "volume"])
+            df['ticker'] = data_req.source_markets[i]
+            tidy_data = pd.concat([tidy_data, df])
+        tidy_data['date'] = pd.to_datetime(tidy_data['date'], unit='ms')
+        return tidy_data.set_index(['date', 'ticker']).sort_index()
+
+    for i in range(len(data_req.source_markets)):
+        df = pd.DataFrame(data_resp[i])
+        if data_type == 'open_interest':
+            df['symbol'] = data_req.source_markets[i]
+            if 'openInterestAmount' in df.columns and df['openInterestAmount'].isna().all():
+                df['openInterestAmount'] = df['openInterestValue']
+        tidy_data = pd.concat([tidy_data, df])
+    field = 'fundingRate' if data_type == 'funding_rates' else 'openInterestAmount'
+    tidy_data = tidy_data[['symbol', field, 'datetime']]
+    tidy_data = WrangleData(data_req, tidy_data).convert_fields_to_lib('ccxt').data_resp
+    tidy_data['date'] = pd.to_datetime(tidy_data.set_index('date').index).floor('s').tz_localize(None)
+
+    return tidy_data.set_index(['date', 'ticker']).sort_index()
+
+
+def ccxt_from_records(data_req: DataRequest, data_resp: list) -> pd.DataFrame:
+    """
+    Previous assembly of WrangleData.ccxt_funding_rates: a frame of every key of every row, fields renamed with
+    the fields catalog and ISO datetimes parsed.
+    """
+    df = pd.DataFrame.from_records(list(chain.from_iterable(data_resp)))[['symbol', 'fundingRate', 'datetime']]
+    df = WrangleData(data_req, df).convert_fields_to_lib('ccxt').data_resp
+    dates = pd.DatetimeIndex(pd.to_datetime(df['date'])).floor('s').tz_localize(None)
+    ticker_codes, tickers = pd.factorize(df['ticker'])
+    index, order = WrangleData.tidy_index(dates, ticker_codes, tickers)
+
+    return df.drop(columns=['date', 'ticker']).iloc[order].set_axis(index)
+
+
+def od_frame(n_dates: int, n_tickers: int, freq: str = 'h') -> pd.DataFrame:
+    """
+    Close prices of n_tickers random walks, hourly by default, in a (date, ticker) MultiIndex frame.
+    """
+    rng = np.random.default_rng(0)
+    idx = pd.MultiIndex.from_product([pd.date_range('2010-01-01', periods=n_dates, freq=freq),
+                                      [f"T{i:03d}" for i in range(n_tickers)]], names=['date', 'ticker'])
+    close = np.exp(rng.normal(0, 0.01, (n_dates, n_tickers)).cumsum(axis=0))
+
+    return pd.DataFrame({'close': close.ravel()}, index=idx)
+
+
+def mad_groupby(df: pd.DataFrame, window_size: int) -> tuple:
+    """
+    Previous rolling statistics of OutlierDetection.mad prediction model: per ticker rolling windows.
+    """
+    df0 = df.sort_index(level=1)
+    med = df0.groupby(level=1).rolling(window_size).median().droplevel(0)
+    mad = (df0 - med).abs().groupby(level=1).rolling(window_size).median().droplevel(0)
+
+    return med.sort_index(), mad.sort_index()
+
+
+def mad_rolling(df: pd.DataFrame, window_size: int) -> tuple:
+    """
+    Rolling statistics of OutlierDetection.mad prediction model on the unstacked array.
+    """
+    od = OutlierDetection(df, window_size=window_size, model_type='prediction')
+    wide_df, vals = od.unstack()
+    med = od.roll(rolling_median, vals, wide_df.columns)
+    mad = od.by_calendar(lambda x: rolling_median(x, window_size), np.abs(vals - med), wide_df.columns)
+
+    return od.stack(med, wide_df), od.stack(mad, wide_df)
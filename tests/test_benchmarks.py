@@ -0,0 +1,131 @@
+import os
+import timeit
+
+import pytest
+
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.transform.rolling import rolling_quantile, rolling_quantiles
+from cryptodatapy.transform.wrangle import WrangleData
+from tests.reference import (ccxt_concat, ccxt_from_records, ccxt_resp, convert_fields_to_lib_loop, mad_groupby,
+                             mad_rolling, od_frame)
+
+
+# timings are machine dependent, timing asserts only run when set
+requires_benchmarks = pytest.mark.skipif(not os.environ.get('CRYPTODATAPY_BENCHMARKS'),
+                                         reason="set CRYPTODATAPY_BENCHMARKS to run")
+
+
+def _best_time(func, number: int = 20, repeat: int = 5) -> float:
+    """
+    Best of repeat mean times per call of func, in seconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+@requires_benchmarks
+def test_convert_fields_to_lib_benchmark(cm_onchain_resp) -> None:
+    """
+    Benchmark per-response cost of converting fields to CryptoDataPy format, before and after vectorizing.
+    """
+    data_req = DataRequest(source='coinmetrics', tickers=['btc'])
+
+    def loop():
+        return convert_fields_to_lib_loop(cm_onchain_resp.copy(), 'coinmetrics')
+
+    def vectorized():
+        return WrangleData(data_req, cm_onchain_resp.copy()).convert_fields_to_lib('coinmetrics').data_resp
+
+    before, after = _best_time(loop, number=3, repeat=3), _best_time(vectorized)
+    print(f"\nconvert_fields_to_lib, {cm_onchain_resp.shape[1]} cols: "
+          f"loop {before * 1e3:.2f} ms, vectorized {after * 1e3:.2f} ms, {before / after:.0f}x")
+    assert after * 5 < before
+
+
+@requires_benchmarks
+def test_ccxt_assembly_benchmark() -> None:
+    """
+    Benchmark CCXT OHLCV assembly over 50 to 1,000 markets, which should scale linearly in the number of markets.
+    """
+    times = {}
+    for n_markets in [50, 200, 1000]:
+        markets, resp = ccxt_resp(n_markets)
+        data_req = DataRequest(source='ccxt', tickers=['btc'], freq='8h')
+        data_req.source_markets = markets
+
+        def builder():
+            return WrangleData(data_req, resp['ohlcv']).ccxt_ohlcv()
+
+        def concat():
+            return ccxt_concat(data_req, resp['ohlcv'], 'ohlcv')
+
+        times[n_markets] = _best_time(builder, number=3, repeat=3)
+        before = _best_time(concat, number=1, repeat=1)
+        print(f"\nccxt_ohlcv, {n_markets} markets: concat {before * 1e3:.1f} ms, "
+              f"builder {times[n_markets] * 1e3:.1f} ms ({times[n_markets] / n_markets * 1e6:.1f} us per market)")
+
+    # 20x the markets for at most 40x the time
+    assert times[1000] < 40 * times[50]
+
+
+@requires_benchmarks
+def test_ccxt_funding_rates_benchmark() -> None:
+    """
+    Benchmark wrangling a year of 8h funding rates on 100 perps, from dicts to columns.
+    """
+    markets, resp = ccxt_resp(100, n_obs=1095)
+    data_req = DataRequest(source='ccxt', tickers=['btc'], freq='8h')
+    data_req.source_markets = markets
+
+    def from_records():
+        return ccxt_from_records(data_req, resp['funding_rates'])
+
+    def columnar():
+        return WrangleData(data_req, resp['funding_rates']).ccxt_funding_rates()
+
+    before, after = _best_time(from_records, number=1, repeat=3), _best_time(columnar, number=1, repeat=3)
+    print(f"\nccxt_funding_rates, {len(markets)} markets: from records {before * 1e3:.1f} ms, "
+          f"columnar {after * 1e3:.1f} ms, {before / after:.1f}x")
+    assert after * 1.5 < before
+
+
+# large benchmarks need over 8 GB of memory
+requires_large = pytest.mark.skipif(not os.environ.get('CRYPTODATAPY_LARGE_BENCHMARKS'),
+                                    reason="set CRYPTODATAPY_LARGE_BENCHMARKS to run")
+
+
+@requires_benchmarks
+@pytest.mark.parametrize("n_dates", [1_000, pytest.param(100_000, marks=requires_large)])
+def test_od_rolling_benchmark(n_dates) -> None:
+    """
+    Benchmark rolling median and MAD of 500 tickers, per ticker windows vs the unstacked array.
+    """
+    df = od_frame(n_dates, 500)
+
+    number = 3 if n_dates <= 1_000 else 1
+    before = _best_time(lambda: mad_groupby(df, 7), number=number, repeat=1)
+    after = _best_time(lambda: mad_rolling(df, 7), number=number, repeat=1)
+
+    print(f"\nrolling median and MAD, {n_dates} x 500: groupby {before * 1e3:.0f} ms, "
+          f"unstacked {after * 1e3:.0f} ms, {before / after:.1f}x")
+    assert after < before
+
+
+@requires_benchmarks
+@pytest.mark.parametrize("window", [7, 150])
+def test_rolling_quantiles_benchmark(window) -> None:
+    """
+    Benchmark rolling 25th, 50th and 75th percentiles of OutlierDetection.iqr, one pass per quantile vs a single pass.
+    """
+    vals = od_frame(2_000, 500).close.to_numpy().reshape(2_000, 500)
+    qs = [0.25, 0.5, 0.75]
+
+    before = _best_time(lambda: [rolling_quantile(vals, window, q) for q in qs], number=1, repeat=3)
+    after = _best_time(lambda: rolling_quantiles(vals, window, qs), number=1, repeat=3)
+
+    print(f"\nrolling quartiles, window {window}, 2000 x 500: 3 passes {before * 1e3:.0f} ms, "
+          f"single pass {after * 1e3:.0f} ms, {before / after:.1f}x")
+    assert after < before
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,189 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock
+
+import pandas as pd
+import pytest
+
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.extract.libraries.ccxt_api import CCXT
+from cryptodatapy.util.cache import DirectoryCache, ResponseCache, SQLiteCache, is_closed, make_key, set_cache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Handler counting requests and returning a small JSON payload.
+    """
+    protocol_version = "HTTP/1.1"
+    hits = 0
+
+    def do_GET(self):
+        _Handler.hits += 1
+        body = json.dumps({'path': self.path}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _Handler.hits = 0
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=[SQLiteCache, DirectoryCache])
+def cache(request, tmp_path):
+    cache = set_cache(request.param(str(tmp_path), max_size=10 ** 6, ttls={'vendor': 60, 'default': 60}))
+    yield cache
+    set_cache()
+
+
+def test_get_set(cache) -> None:
+    """
+    Test round trip, expiry and removal of responses.
+    """
+    df = pd.DataFrame({'close': [1.0, 2.0]})
+    cache.set('a', df, 'vendor')
+    cache.set('b', {'data': [1, 2]}, 'vendor', ttl=0.05)
+    cache.set('c', [1], 'other:exch')
+
+    pd.testing.assert_frame_equal(cache.get('a'), df)
+    assert cache.get('b') == {'data': [1, 2]}
+    assert len(cache) == 3
+    time.sleep(0.1)
+    assert cache.get('b') is None, "Response should have expired."
+    assert cache.get('missing') is None
+
+    cache.clear('other')
+    assert cache.get('c') is None
+    assert cache.get('a') is not None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_eviction(cache) -> None:
+    """
+    Test that least recently used responses are evicted above the size cap.
+    """
+    cache.max_size = 3 * 11000
+    cache.set('a', b'0' * 10000, 'vendor')
+    time.sleep(0.01)
+    cache.set('b', b'0' * 10000, 'vendor')
+    time.sleep(0.01)
+    cache.get('a')
+    time.sleep(0.01)
+    cache.set('c', b'0' * 10000, 'vendor')
+    time.sleep(0.01)
+    cache.set('d', b'0' * 10000, 'vendor')
+
+    assert cache.get('b') is None, "Least recently used response should be evicted."
+    assert cache.get('a') is not None
+    assert cache.get('d') is not None
+    assert cache.size() <= cache.max_size
+
+
+def test_directory_eviction_index(tmp_path, monkeypatch) -> None:
+    """
+    Test that the directory cache walks its directory once, on the first write, rather than on every write.
+    """
+    walks = []
+    files = DirectoryCache._files
+    monkeypatch.setattr(DirectoryCache, '_files', lambda self: walks.append(1) or files(self))
+
+    cache = DirectoryCache(str(tmp_path), max_size=3 * 11000, ttls={})
+    for key in 'abcdef':
+        cache.set(key, b'0' * 10000, 'vendor')
+        time.sleep(0.01)
+    cache.get('d')
+    cache.set('g', b'0' * 10000, 'vendor')
+
+    assert len(walks) == 1
+    assert [key for key in 'abcdefg' if cache.get(key) is not None] == ['d', 'f', 'g']
+    assert cache.size() <= cache.max_size
+
+
+def test_abstract_cache() -> None:
+    """
+    Test that the base response cache can't be instantiated.
+    """
+    with pytest.raises(TypeError):
+        ResponseCache(path='', max_size=0, ttls={})
+
+
+def test_make_key_headers() -> None:
+    """
+    Test that credential headers, and only those, are part of the cache key.
+    """
+    key = make_key('tiingo', 'url', {'tickers': 'btcusd'})
+    alice = make_key('tiingo', 'url', {'tickers': 'btcusd'}, {'Authorization': 'Token a', 'Content-Type': 'json'})
+    bob = make_key('tiingo', 'url', {'tickers': 'btcusd'}, {'Authorization': 'Token b', 'Content-Type': 'json'})
+
+    assert alice != bob
+    assert alice != key
+    assert make_key('tiingo', 'url', {'tickers': 'btcusd'}, {'Content-Type': 'json'}) == key
+    assert make_key('vendor', 'url', None, {'X-API-Key': 'a'}) != make_key('vendor', 'url', None, {'X-API-Key': 'b'})
+
+
+def test_ttl(cache) -> None:
+    """
+    Test that responses including the open bar expire and closed bars don't.
+    """
+    assert cache.get_ttl('vendor') == 60
+    assert cache.get_ttl('unknown') == 60
+    assert cache.get_ttl('vendor', end_date='2020-01-01', freq='d') is None
+    assert cache.get_ttl('vendor', end_date=pd.Timestamp.utcnow(), freq='1h') == 60
+    assert is_closed(1577836800000, '1h')
+    assert not is_closed(None)
+
+
+def test_get_req_cached(server_url, cache) -> None:
+    """
+    Test that get requests are served from the cache.
+    """
+    data_req = DataRequest(end_date='2020-01-01')
+    resp = data_req.get_req(url=server_url + 'histo', params={'limit': 10}, vendor='vendor')
+    assert data_req.get_req(url=server_url + 'histo', params={'limit': 10}, vendor='vendor') == resp
+    assert _Handler.hits == 1
+    data_req.get_req(url=server_url + 'histo', params={'limit': 20}, vendor='vendor')
+    data_req.get_req(url=server_url + 'histo', params={'limit': 10}, vendor='vendor', use_cache=False)
+    assert _Handler.hits == 3
+
+
+@pytest.mark.asyncio
+async def test_ccxt_closed_page_reused(cache) -> None:
+    """
+    Test that a page of closed bars is reused by a later request with a more recent end date.
+    """
+    exchange_async = AsyncMock()
+    exchange_async.id = "bitget"
+    exchange_async.has = {"fetchOHLCV": True}
+    exchange_async.rateLimit = 1
+    exchange_async.fetch_ohlcv.side_effect = [
+        [[1577836800000, 1.0, 1.0, 1.0, 1.0, 1.0]], [],
+        [[1577840400000, 2.0, 2.0, 2.0, 2.0, 2.0]], [],
+    ]
+    ccxt_instance = CCXT()
+    ccxt_instance.exchange_async = exchange_async
+
+    data = await ccxt_instance._fetch_ohlcv_async("BTC/USDT", "1h", 1577836800000, 1577840000000, exch="bitget")
+    assert data == [[1577836800000, 1.0, 1.0, 1.0, 1.0, 1.0]]
+    data = await ccxt_instance._fetch_ohlcv_async("BTC/USDT", "1h", 1577836800000, 1577850000000, exch="bitget")
+    assert [row[0] for row in data] == [1577836800000, 1577840400000]
+    assert exchange_async.fetch_ohlcv.await_count == 4, "First page should be served from the cache."
+    assert make_key('ccxt:bitget', 'fetch_ohlcv') != make_key('ccxt:okx', 'fetch_ohlcv')
+
+
+if __name__ == "__main__":
+    pytest.main()
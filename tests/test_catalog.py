@@ -0,0 +1,101 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.transform.convertparams import ConvertParams
+from cryptodatapy.util.catalog import Catalog, get_catalog, set_catalog
+
+
+@pytest.fixture
+def catalog():
+    return get_catalog()
+
+
+def test_get_catalog_is_shared() -> None:
+    """
+    Test that the catalog is loaded once per process, also when requested concurrently.
+    """
+    set_catalog()
+    catalogs = []
+    threads = [threading.Thread(target=lambda: catalogs.append(get_catalog())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(c is catalogs[0] for c in catalogs), "Catalog should be shared."
+    assert get_catalog() is catalogs[0], "Catalog should be shared."
+
+
+def test_get_ticker(catalog) -> None:
+    """
+    Test ticker lookups match the tickers csv.
+    """
+    tickers_df = catalog.tickers
+    tickers_df = tickers_df[~tickers_df.index.duplicated()]
+    for col in ['tiingo_id', 'yahoo_id', 'fred_id', 'country_name']:
+        for ticker, value in tickers_df[col].items():
+            if pd.isna(value):
+                assert pd.isna(catalog.get_ticker(ticker, col))
+            else:
+                assert catalog.get_ticker(ticker, col) == value
+    with pytest.raises(KeyError):
+        catalog.get_ticker('not_a_ticker', 'tiingo_id')
+    with pytest.raises(KeyError):
+        catalog.get_ticker('EUR', 'not_a_col')
+
+
+def test_get_field(catalog) -> None:
+    """
+    Test field lookups match the fields csv.
+    """
+    assert catalog.get_field('close', 'glassnode_id') == 'market/price_usd_ohlc'
+    assert catalog.get_field('close', 'cryptocompare_id') == catalog.fields.loc['close', 'cryptocompare_id']
+    with pytest.raises(KeyError):
+        catalog.get_field('not_a_field', 'glassnode_id')
+
+
+def test_get_fields_map(catalog) -> None:
+    """
+    Test reverse field lookups return the first field with the data source id.
+    """
+    fields_df = catalog.fields
+    fields_map = catalog.get_fields_map('glassnode')
+    for source_id, field in fields_map.items():
+        assert fields_df[fields_df.glassnode_id == source_id].index[0] == field
+    assert fields_map['market/price_usd_ohlc'] == 'open'
+    assert catalog.get_fields_map('tiingo', lower=True)['adjclose'] == catalog.get_fields_map('tiingo')['adjClose']
+    assert catalog.get_fields_map('not_a_source') == {}
+
+
+def test_catalog_is_read_only(catalog) -> None:
+    """
+    Test callers cannot modify the shared catalog.
+    """
+    tickers_df = catalog.tickers
+    tickers_df.loc[:, 'tiingo_id'] = 'modified'
+    assert catalog.get_ticker('EUR', 'tiingo_id') != 'modified'
+    assert catalog.tickers.tiingo_id.ne('modified').all()
+    with pytest.raises(TypeError):
+        catalog.get_fields_map('glassnode')['close'] = 'modified'
+
+
+def test_set_catalog() -> None:
+    """
+    Test replacing the catalog changes conversions.
+    """
+    tickers_df = pd.DataFrame({'tiingo_id': ['xyz']}, index=pd.Index(['XYZ'], name='ticker'))
+    fields_df = pd.DataFrame({'tiingo_id': ['adjClose']}, index=pd.Index(['close'], name='id'))
+    try:
+        set_catalog(Catalog(tickers_df, fields_df))
+        tg_data_req = ConvertParams(DataRequest(source='tiingo', tickers=['XYZ'], cat='eqty')).to_tiingo()
+        assert tg_data_req.source_tickers == ['xyz']
+        assert tg_data_req.source_fields == ['adjClose']
+    finally:
+        set_catalog()
+
+
+if __name__ == "__main__":
+    pytest.main()
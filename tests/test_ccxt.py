@@ -1,3 +1,6 @@
+import asyncio
+import threading
+import time
 from unittest.mock import AsyncMock
 
 import ccxt
@@ -120,6 +123,38 @@ class TestCCXT:
         assert data[0][0] == 1625097600000
         assert data[0][4] == 34980.38
 
+    @pytest.mark.asyncio
+    async def test_fetch_all_ohlcv_concurrent(self):
+        """
+        Test that markets are fetched concurrently and returned in source markets order.
+        """
+        in_flight, peak = 0, 0
+
+        async def fetch_ohlcv(ticker, freq, since=None, limit=None, params=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # later tickers return first
+            await asyncio.sleep(0.05 / (1 + tickers.index(ticker)))
+            in_flight -= 1
+            return [[since, float(tickers.index(ticker)), 1.0, 1.0, 1.0, 1.0]]
+
+        tickers = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "XRP/USDT"]
+        exchange_async = AsyncMock()
+        exchange_async.id = "bitget"
+        exchange_async.has = {"fetchOHLCV": True}
+        exchange_async.rateLimit = 1
+        exchange_async.fetch_ohlcv.side_effect = fetch_ohlcv
+        self.ccxt_instance.exchange_async = exchange_async
+
+        data = await self.ccxt_instance._fetch_all_ohlcv_async(
+            tickers, "1h", 1625097600000, 1625097600001, exch="bitget", max_concurrency=4
+        )
+
+        assert [resp[0][1] for resp in data] == [0.0, 1.0, 2.0, 3.0], "Results should follow tickers order."
+        assert peak == 4, "Markets should be fetched concurrently."
+        exchange_async.close.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_fetch_funding_rate(self):
         # Use recent historical dates (30 days of funding rate data)
@@ -275,5 +310,165 @@ class TestCCXT:
         assert (df.dtypes == "Float64").all(), "Data types are not float64."
 
 
+@pytest.fixture
+def kraken_markets(monkeypatch, tmp_path):
+    """
+    Kraken with synthetic markets and currencies, counting requests, and a temporary snapshot store.
+    """
+    from cryptodatapy.util.snapshot import SnapshotStore, set_snapshot_store
+
+    calls = []
+
+    def fetch_markets(self, params={}):
+        calls.append("markets")
+        return [{"id": "XBTUSD", "symbol": "BTC/USD", "base": "BTC", "quote": "USD", "baseId": "XBT", "quoteId": "USD",
+                 "spot": True, "type": "spot", "active": True, "precision": {"amount": 1e-8, "price": 0.1},
+                 "limits": {}, "info": {}}]
+
+    def fetch_currencies(self, params={}):
+        return {"BTC": {"id": "XBT", "code": "BTC", "precision": 1e-8, "info": {}}}
+
+    monkeypatch.setattr(ccxt.kraken, "fetch_markets", fetch_markets)
+    monkeypatch.setattr(ccxt.kraken, "fetch_currencies", fetch_currencies)
+    store = set_snapshot_store(SnapshotStore(path=str(tmp_path), ttl=60))
+    yield calls, store
+    set_snapshot_store()
+
+
+def test_markets_snapshot(kraken_markets) -> None:
+    """
+    Test exchange markets are requested once, then loaded from the local snapshot.
+    """
+    calls, store = kraken_markets
+
+    cx = CCXT()
+    cx.get_metadata("kraken")
+    assert calls == ["markets"]
+    assert store.get("ccxt_markets_kraken") is not None, "Snapshot should be written."
+
+    # new instance, e.g. in a new process
+    cx = CCXT()
+    cx.get_metadata("kraken")
+    assert cx.markets == ["BTC/USD"] and cx.assets == ["BTC"]
+    assert cx.exchange.market("BTC/USD")["id"] == "XBTUSD"
+    assert calls == ["markets"], "Markets should be loaded from the snapshot."
+
+    # stale snapshot served while refreshed in the background
+    store.ttl = 0
+    cx = CCXT()
+    cx.get_metadata("kraken")
+    store.refresh("ccxt_markets_kraken", lambda: None).join()
+    assert cx.markets == ["BTC/USD"]
+    assert calls == ["markets", "markets"], "Stale snapshot should be refreshed."
+
+
+def test_markets_snapshot_async(kraken_markets) -> None:
+    """
+    Test async exchanges load markets from the snapshot and are not reused across event loops.
+    """
+    calls, store = kraken_markets
+    CCXT()._get_exchange("kraken")
+    cx = CCXT()
+
+    async def get_exchange():
+        return cx._get_exchange_async("kraken")
+
+    exchange = asyncio.run(get_exchange())
+    assert list(exchange.markets) == ["BTC/USD"] and calls == ["markets"]
+    exchange.asyncio_loop = asyncio.new_event_loop()  # bound to another loop
+    assert asyncio.run(get_exchange()) is not exchange
+    exchange.asyncio_loop.close()
+
+
+class FakeOHLCVExchange:
+    """
+    Exchange with hourly bars, returning bars past the requested end date like some exchanges do.
+    """
+    id = "fake"
+    has = {"fetchOHLCV": True}
+    rateLimit = 1
+    # shared by the instances created for each shard
+    in_flight, peak, n_calls, threads, params = 0, 0, 0, {}, None
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.markets, self.currencies = {"BTC/USDT": {}}, {}
+
+    @classmethod
+    def reset(cls):
+        cls.in_flight, cls.peak, cls.n_calls, cls.threads, cls.params = 0, 0, 0, {}, None
+
+    def set_markets(self, markets, currencies=None):
+        self.markets, self.currencies = markets, currencies
+
+    def _bars(self, since, limit, params):
+        bar = 3600 * 1000
+        first = -(-since // bar) * bar
+        return [[ts, 1.0, 1.0, 1.0, float(ts), 1.0] for ts in range(first, first + limit * bar, bar)
+                if ts <= params["until"] + 2 * bar]
+
+    def fetch_ohlcv(self, ticker, freq, since=None, limit=None, params=None):
+        cls = type(self)
+        with cls.lock:
+            cls.n_calls += 1
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+            cls.threads.setdefault(threading.get_ident(), set()).add(id(self))
+            cls.params = params
+        time.sleep(0.01)
+        with cls.lock:
+            cls.in_flight -= 1
+        return self._bars(since, limit, params)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_fetch_ohlcv_shards(use_async) -> None:
+    """
+    Test OHLCV shards are fetched concurrently and merged without gaps or duplicates.
+    """
+    start, end = 1_700_002_800_000, 1_700_002_800_000 + 95 * 3600 * 1000
+    cx = CCXT(max_obs_per_call=10)
+    windows = cx._get_ohlcv_shards("1h", start, end, 4)
+    assert len(windows) == 4 and windows[0][0] == start and windows[-1][1] == end
+    assert (windows[0][1] - windows[0][0]) % (10 * 3600 * 1000) == 0, "Shards should be aligned to pages."
+    assert cx._get_ohlcv_shards("1h", start, start + 3600 * 1000, 4) == [(start, start + 3600 * 1000)]
+
+    def fetch(shards):
+        FakeOHLCVExchange.reset()
+        exchange = FakeOHLCVExchange()
+        if use_async:
+            async_exchange = AsyncMock()
+            async_exchange.id, async_exchange.has, async_exchange.rateLimit = "fake", exchange.has, 1
+
+            async def fetch_ohlcv(*args, **kwargs):
+                FakeOHLCVExchange.in_flight += 1
+                FakeOHLCVExchange.peak = max(FakeOHLCVExchange.peak, FakeOHLCVExchange.in_flight)
+                await asyncio.sleep(0.01)
+                FakeOHLCVExchange.in_flight -= 1
+                return exchange._bars(kwargs["since"], kwargs["limit"], kwargs["params"])
+
+            async_exchange.fetch_ohlcv.side_effect = fetch_ohlcv
+            cx.exchange_async = async_exchange
+            data = asyncio.run(cx._fetch_ohlcv_async("BTC/USDT", "1h", start, end, "fake", shards=shards))
+        else:
+            cx.exchange = exchange
+            data = cx._fetch_ohlcv("BTC/USDT", "1h", start, end, "fake", shards=shards)
+            if shards:
+                instances = set().union(*FakeOHLCVExchange.threads.values())
+                assert id(exchange) not in instances and len(instances) == len(windows), \
+                    "Each shard should be fetched with its own exchange instance."
+                assert not FakeOHLCVExchange.params["paginate"], "Bounded shards should not be paginated by CCXT."
+        return data, FakeOHLCVExchange.peak
+
+    serial, serial_peak = fetch(None)
+    sharded, sharded_peak = fetch(4)
+    timestamps = [row[0] for row in sharded]
+    assert timestamps == sorted(set(timestamps)), "Bars should be sorted and de-duplicated."
+    assert timestamps[0] == start and timestamps[-1] >= end
+    assert all(t2 - t1 == 3600 * 1000 for t1, t2 in zip(timestamps, timestamps[1:])), "Bars should have no gaps."
+    assert timestamps == [row[0] for row in serial][:len(timestamps)]
+    assert serial_peak == 1 and sharded_peak > 1, "Shards should be fetched concurrently."
+
+
 if __name__ == "__main__":
     pytest.main()
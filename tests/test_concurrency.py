@@ -0,0 +1,62 @@
+import os
+import threading
+import time
+
+import pytest
+
+from cryptodatapy.util.concurrency import process_map, thread_map
+
+
+def test_thread_map_order() -> None:
+    """
+    Test results are returned in the order of items, not of completion.
+    """
+    def func(i):
+        time.sleep(0.01 * (5 - i))
+        return i * 2
+
+    assert thread_map(func, range(5), max_workers=5) == [0, 2, 4, 6, 8]
+
+
+def test_thread_map_max_workers() -> None:
+    """
+    Test the number of concurrent calls is bounded by max workers.
+    """
+    lock, running, peak = threading.Lock(), [0], [0]
+
+    def func(i):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return i
+
+    assert thread_map(func, range(12), max_workers=3) == list(range(12))
+    assert peak[0] == 3
+
+
+def test_thread_map_sequential() -> None:
+    """
+    Test items are processed in the calling thread if max workers is not set.
+    """
+    threads = thread_map(lambda i: threading.get_ident(), range(3))
+    assert set(threads) == {threading.get_ident()}
+
+
+def test_process_map() -> None:
+    """
+    Test items are processed in worker processes and results returned in the order of items.
+    """
+    assert process_map(abs, range(-4, 4), max_workers=2) == [4, 3, 2, 1, 0, 1, 2, 3]
+    assert set(process_map(_pid, range(4), max_workers=2)) != {os.getpid()}
+    assert set(process_map(_pid, range(4))) == {os.getpid()}
+
+
+def _pid(_) -> int:
+    return os.getpid()
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -365,5 +365,33 @@ class TestCryptoCompare:
         ), "Followers is not a numpy int."  # dtypes
 
 
+def test_iter_data_hist(monkeypatch) -> None:
+    """
+    Test pages are yielded as they arrive, paging backwards until the start date.
+    """
+    data_req = DataRequest(tickers=['btc'], fields=['close'], freq='d', start_date='2020-01-01',
+                           end_date='2020-01-10')
+    cc = CryptoCompare(api_key='test', max_obs_per_call=4)
+    end_ts = int(pd.Timestamp('2020-01-10').timestamp())
+    calls = []
+
+    def get_req(url, params, **kwargs):
+        calls.append(params['toTs'])
+        times = [params['toTs'] - 86400 * i for i in range(4)][::-1]
+        return {'Data': {'Data': [{'time': t, 'close': 1.0} for t in times]}}
+
+    monkeypatch.setattr(data_req, 'get_req', get_req)
+    pages = cc.iter_data_hist(data_req, 'ohlcv', 'BTC')
+    page = next(pages)
+    assert calls == [end_ts], "Pages should be requested lazily."
+    assert page.time.iloc[-1] == end_ts
+
+    rest = list(pages)
+    assert calls == [end_ts, end_ts - 3 * 86400, end_ts - 6 * 86400]
+    assert rest[-1].time[0] == int(pd.Timestamp('2020-01-01').timestamp())
+    df = cc.get_all_data_hist(data_req, 'ohlcv', 'BTC')
+    pd.testing.assert_frame_equal(df, pd.concat([page] + rest))
+
+
 if __name__ == "__main__":
     pytest.main()
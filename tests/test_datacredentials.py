@@ -363,6 +363,29 @@ class TestDataCredentials:
         assert hasattr(creds, 'coinmetrics_base_url')
         assert hasattr(creds, 'polygon_base_url')
 
+    def test_local_data_dirs(self, monkeypatch, tmp_path):
+        """
+        Test snapshots are opt in and stored with the response cache and time series store under one configurable
+        root.
+        """
+        from cryptodatapy.util.snapshot import get_snapshot_store, set_snapshot_store
+
+        monkeypatch.setenv('CRYPTODATAPY_HOME', str(tmp_path))
+        creds = DataCredentials()
+        assert creds.snapshot_enabled is False
+        assert creds.data_dir == str(tmp_path)
+        assert creds.cache_dir == os.path.join(str(tmp_path), 'cache')
+        assert creds.snapshot_dir == os.path.join(str(tmp_path), 'snapshots')
+        assert creds.store_path == os.path.join(str(tmp_path), 'store')
+        assert DataCredentials(data_dir='root').store_path == os.path.join('root', 'store')
+        assert DataCredentials(data_dir='root').cache_dir == os.path.join('root', 'cache')
+
+        set_snapshot_store()
+        assert get_snapshot_store() is None, "Snapshots should be disabled by default."
+        assert set_snapshot_store(True).path == os.path.join(str(tmp_path), 'snapshots')
+        assert set_snapshot_store(False) is None and get_snapshot_store() is None
+        set_snapshot_store()
+
     def test_repr_does_not_expose_sensitive_data(self):
         """
         Test that repr does not accidentally expose passwords in plain text.
@@ -134,6 +134,28 @@ def test_pause_error(datarequest) -> None:
         dr.pause = ["15s"]
 
 
+def test_max_workers_error(datarequest) -> None:
+    """
+    Test max workers for data request.
+    """
+    dr = datarequest
+    with pytest.raises(TypeError):
+        dr.max_workers = "4"
+    with pytest.raises(ValueError):
+        dr.max_workers = 0
+
+
+def test_shards_error(datarequest) -> None:
+    """
+    Test shards for data request.
+    """
+    dr = datarequest
+    with pytest.raises(TypeError):
+        dr.shards = 2.0
+    with pytest.raises(ValueError):
+        dr.shards = 0
+
+
 def test_source_tickers_error(datarequest) -> None:
     """
     Test source tickers for data request.
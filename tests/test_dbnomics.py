@@ -1,3 +1,6 @@
+import threading
+import time
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -49,6 +52,28 @@ def test_check_params(db) -> None:
         db.check_params(data_req)
 
 
+def test_get_data_max_workers(db, db_data_req) -> None:
+    """
+    Test tickers fetched concurrently are returned in order, with failures isolated per ticker.
+    """
+    tickers = ["US_GDP_Sh_PPP", "EZ_GDP_Sh_PPP", "CN_GDP_Sh_PPP"]
+    threads = set()
+
+    def get_series(ticker):
+        threads.add(threading.get_ident())
+        time.sleep(0.1)
+        if "CHN" in ticker:
+            raise ValueError("Series not found.")
+        return db_data_req
+
+    db.get_series = get_series
+    data_req = DataRequest(tickers=tickers, fields="actual", cat="macro", max_workers=3)
+    df = db.get_data(data_req)
+
+    assert len(threads) > 1, "Tickers should be fetched in a thread pool."
+    assert set(df.index.droplevel(0).unique()) == {"EZ_GDP_Sh_PPP", "US_GDP_Sh_PPP"}, "Wrong tickers."
+
+
 def test_integration_get_data(db) -> None:
     """
     Test integration of get data method.
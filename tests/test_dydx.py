@@ -0,0 +1,118 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.extract.exchanges import dydx
+from cryptodatapy.extract.exchanges.dydx import Dydx
+from cryptodatapy.util import ratelimit
+from cryptodatapy.util.ratelimit import get_rate_limiter
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """
+    dYdX indexer with hourly candles and funding rates since 2024-01-01, returning records newest first.
+    """
+    def __init__(self):
+        self.times = pd.date_range("2024-01-01", "2024-03-01", freq="h", tz="UTC")
+        self.lock = threading.Lock()
+        self.n_calls = 0
+        self.threads = set()
+
+    def get(self, url, params=None, timeout=None):
+        with self.lock:
+            self.n_calls += 1
+            self.threads.add(threading.get_ident())
+        market = url.split("/")[-1]
+        end = pd.Timestamp(params.get("toISO") or params["effectiveBeforeOrAt"])
+        start = pd.Timestamp(params.get("fromISO", self.times[0]))
+        times = self.times[(self.times >= start) & (self.times <= end)][::-1][:params["limit"]]
+        if "candles" in url:
+            return FakeResponse({"candles": [{"startedAt": t.isoformat(), "ticker": market, "close": str(i)}
+                                             for i, t in enumerate(times)]})
+        return FakeResponse({"historicalFunding": [{"effectiveAt": t.isoformat(), "ticker": market, "rate": "0.0001"}
+                                                   for t in times]})
+
+
+@pytest.fixture
+def dydx_session(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(dydx, "get_session", lambda: session)
+    return session
+
+
+@pytest.fixture
+def dy():
+    dy = Dydx(max_obs_per_call=10)
+    dy.rate_limiter = get_rate_limiter("dydx:test", rate=1e6)
+    dy.data_req = DataRequest(source="dydx", tickers=["btc", "eth"], freq="1h", max_workers=4)
+    dy.data_req.source_tickers = ["BTC", "ETH"]
+    dy.data_req.source_freq = "1HOUR"
+    dy.data_req.source_start_date = "2024-01-03T00:00:00Z"
+    dy.data_req.source_end_date = "2024-02-20T00:00:00Z"
+    return dy
+
+
+def test_rate_limiter(monkeypatch) -> None:
+    """
+    Test the limiter sustains the strictest limit with bursts of the requests allowed per second.
+    """
+    monkeypatch.setattr(ratelimit, "_limiters", {})
+    dy = Dydx()
+    assert dy.rate_limiter.rate == 5, "300 requests per minute is stricter than 10 per second."
+    assert dy.rate_limiter.bucket.capacity == 10
+    assert dy.rate_limiter.max_workers() == 10, "Workers should match the requests allowed at once."
+
+
+def test_get_windows() -> None:
+    """
+    Test date ranges are split into consecutive windows of at most limit bars.
+    """
+    start, end = pd.Timestamp("2024-01-01", tz="UTC"), pd.Timestamp("2024-01-02 01:00", tz="UTC")
+    windows = Dydx._get_windows(start, end, pd.Timedelta(hours=1), 10)
+    assert len(windows) == 3
+    assert windows[0] == (start, pd.Timestamp("2024-01-01 09:59:59.999999", tz="UTC"))
+    assert windows[-1][1] == end
+    assert all(w1[1] < w2[0] for w1, w2 in zip(windows, windows[1:])), "Windows should not overlap."
+
+
+def test_fetch_ohlcv(dy, dydx_session) -> None:
+    """
+    Test long histories are fetched in full, beyond 100 pages, without gaps or duplicates.
+    """
+    df = dy._fetch_ohlcv()
+
+    expected = pd.date_range("2024-01-03", "2024-02-20", freq="h", tz="UTC")
+    assert dydx_session.n_calls > 200, "History should not be capped at 100 pages."
+    assert len(dydx_session.threads) > 1, "Windows should be fetched concurrently."
+    assert list(df.ticker.unique()) == ["BTC-USD", "ETH-USD"]
+    for _, group in df.groupby("ticker"):
+        assert group.startedAt.tolist() == expected.tolist(), "Candles should be stitched without gaps."
+
+
+def test_fetch_funding_rates(dy, dydx_session) -> None:
+    """
+    Test funding rates are fetched with the same window engine.
+    """
+    df = dy._fetch_funding_rates()
+
+    expected = pd.date_range("2024-01-03", "2024-02-20 01:00", freq="h", tz="UTC")
+    assert not df.duplicated(["ticker", "effectiveAt"]).any()
+    assert df[df.ticker == "BTC-USD"].effectiveAt.tolist() == expected.tolist()
+    assert df.rate.dtype == float
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -4,6 +4,7 @@ import numpy as np
 
 from cryptodatapy.extract.datarequest import DataRequest
 from cryptodatapy.extract.getdata import GetData
+from cryptodatapy.util.registry import set_registry
 
 
 @pytest.fixture
@@ -445,5 +446,110 @@ def test_integration_get_data_tg(data_req_tg) -> None:
     ), "Close is not a numpy float."  # dtypes
 
 
+def test_get_series_incremental(monkeypatch):
+    """
+    Test incremental mode fetches only missing tails and lets revised values win.
+    """
+    reqs = []
+
+    def get_data(self, data_req):
+        reqs.append((list(data_req.tickers), pd.Timestamp(data_req.start_date)))
+        dates = pd.date_range(data_req.start_date, "2024-01-10", freq="D")
+        idx = pd.MultiIndex.from_product([dates, [t.upper() for t in data_req.tickers]], names=["date", "ticker"])
+        return pd.DataFrame({"close": 100.0}, index=idx)
+
+    from cryptodatapy.extract.libraries.ccxt_api import CCXT
+    monkeypatch.setattr(CCXT, "get_data", get_data)
+
+    idx = pd.MultiIndex.from_product([pd.date_range("2024-01-01", "2024-01-08", freq="D"), ["BTC", "ETH"]],
+                                     names=["date", "ticker"])
+    existing = pd.DataFrame({"close": 1.0}, index=idx).drop(("2024-01-08", "ETH"))
+    data_req = DataRequest(source="ccxt", tickers=["btc", "eth", "sol"], start_date="2024-01-01",
+                           end_date="2024-01-10")
+
+    df = GetData(data_req).get_series(existing=existing, overlap=1)
+
+    assert sorted(reqs) == [(["btc"], pd.Timestamp("2024-01-07")), (["eth"], pd.Timestamp("2024-01-06")),
+                            (["sol"], pd.Timestamp("2024-01-01"))], "Only missing tails should be requested."
+    assert not df.index.duplicated().any(), "Rows should be de-duplicated."
+    assert df.loc[("2024-01-06", "BTC"), "close"] == 1.0
+    assert df.loc[("2024-01-07", "BTC"), "close"] == 100.0, "Revised values should win."
+    assert df.loc[("2024-01-10", "SOL"), "close"] == 100.0
+    assert list(df.index.names) == ["date", "ticker"]
+
+
+def test_get_series_many(monkeypatch):
+    """
+    Test requests are grouped by source, with one data source object per source, run concurrently across
+    sources, and returned in request order with errors isolated.
+    """
+    import threading
+    import time
+    from cryptodatapy.extract.data_vendors.tiingo_api import Tiingo
+    from cryptodatapy.extract.libraries.dbnomics_api import DBnomics
+
+    instances = {"tiingo": [], "dbnomics": []}
+    barrier = threading.Barrier(2, timeout=5)
+
+    def tg_init(self, api_key=None):
+        self.data = pd.DataFrame()
+        instances["tiingo"].append(self)
+
+    def db_init(self):
+        self.data = pd.DataFrame()
+        instances["dbnomics"].append(self)
+
+    def get_data(self, data_req):
+        if data_req.tickers == ["fail"]:
+            raise ValueError("bad ticker")
+        if len(self.data) > 0:
+            raise AssertionError("Data should be reset between requests.")
+        # first request of each source waits for the other source
+        if data_req.tickers[0].endswith("1"):
+            barrier.wait()
+        time.sleep(0.05)
+        self.data = pd.DataFrame({"close": [1.0]}, index=pd.Index(data_req.tickers, name="ticker"))
+        return self.data
+
+    set_registry()
+    monkeypatch.setattr(Tiingo, "__init__", tg_init)
+    monkeypatch.setattr(Tiingo, "get_data", get_data)
+    monkeypatch.setattr(DBnomics, "__init__", db_init)
+    monkeypatch.setattr(DBnomics, "get_data", get_data)
+
+    data_reqs = [DataRequest(source="tiingo", tickers=["tg1"]), DataRequest(source="dbnomics", tickers=["db1"]),
+                 DataRequest(source="tiingo", tickers=["fail"]), DataRequest(source="tiingo", tickers=["tg2"]),
+                 DataRequest(source="dbnomics", tickers=["db2"])]
+    results = GetData.get_series_many(data_reqs, api_keys={"tiingo": "key"})
+
+    assert [res.data_req for res in results] == data_reqs, "Results should be in request order."
+    assert [res.ok for res in results] == [True, True, False, True, True]
+    assert isinstance(results[2].error, ValueError) and results[2].data is None
+    assert [res.data.index[0] for res in results if res.ok] == ["tg1", "db1", "tg2", "db2"]
+    assert all(res.elapsed > 0 for res in results)
+    assert len(instances["tiingo"]) == 1 and len(instances["dbnomics"]) == 1, "One instance per source."
+
+    # instances are reused by the next refresh
+    GetData.get_series_many(data_reqs, api_keys={"tiingo": "key"})
+    assert len(instances["tiingo"]) == 1 and len(instances["dbnomics"]) == 1, "Instances should be reused."
+    set_registry()
+
+
+@pytest.mark.asyncio
+async def test_get_series_many_running_loop(monkeypatch):
+    """
+    Test get_series_many can be called from a running event loop, e.g. in Jupyter.
+    """
+    import threading
+
+    async def get_series_many_async(data_reqs, method="get_data", api_keys=None):
+        return [threading.get_ident()]
+
+    monkeypatch.setattr(GetData, "get_series_many_async", staticmethod(get_series_many_async))
+
+    assert GetData.get_series_many([DataRequest()]) != [threading.get_ident()], "Should run in a worker thread."
+    assert await GetData.get_series_many_async([DataRequest()]) == [threading.get_ident()]
+
+
 if __name__ == "__main__":
     pytest.main()
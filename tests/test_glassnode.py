@@ -1,3 +1,6 @@
+import threading
+import time
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -157,5 +160,51 @@ def test_get_data_integration(gn) -> None:
     ), "Transactions count is not a numpy int."  # dtypes
 
 
+def test_get_data_matrix() -> None:
+    """
+    Test the ticker x field matrix is requested concurrently, once per endpoint, and merged into a tidy frame.
+    """
+    gn = Glassnode(api_key='test', assets=['BTC', 'ETH', 'SOL'],
+                   fields=['market/price_usd_ohlc', 'addresses/active_count', 'transactions/count'])
+    times = [int(t.timestamp()) for t in pd.date_range('2023-01-01', periods=10)]
+    reqs, threads = [], set()
+
+    def req_data(data_req, ticker, field, gn_data_req=None):
+        reqs.append((ticker, field))
+        threads.add(threading.get_ident())
+        time.sleep(0.02)
+        if ticker.upper() == 'SOL' and field == 'transactions/count':
+            return None  # failed request
+        if field == 'market/price_usd_ohlc':
+            return [{'t': t, 'o': {'o': 1.0, 'h': 2.0, 'l': 0.5, 'c': 1.5}} for t in times]
+        return [{'t': t, 'v': i + 1} for i, t in enumerate(times)]
+
+    gn.req_data = req_data
+    fields = ['close', 'open', 'add_act', 'tx_count']
+    df = gn.get_data(DataRequest(source='glassnode', tickers=['btc', 'eth', 'sol'], fields=fields,
+                                 start_date='2023-01-01', max_workers=4))
+
+    assert len(reqs) == 9, "Each ticker's OHLC endpoint should be requested once."
+    assert len(threads) > 1, "Requests should run in a thread pool."
+    assert isinstance(df.index, pd.MultiIndex), "Dataframe should be MultiIndex."
+    assert list(df.index.droplevel(0).unique()) == ['BTC', 'ETH', 'SOL'], "Tickers are missing from dataframe."
+    assert list(df.columns) == fields, "Fields are missing from dataframe."
+    assert df.loc[(slice(None), 'SOL'), 'tx_count'].isna().all(), "Failed request should be missing."
+    assert (df.loc[(slice(None), 'BTC'), 'add_act'].to_numpy() == np.arange(1, 11)).all(), "Wrong values."
+
+    # same frame when requested one at a time
+    reqs.clear()
+    df_seq = gn.get_data(DataRequest(source='glassnode', tickers=['btc', 'eth', 'sol'], fields=fields,
+                                     start_date='2023-01-01', max_workers=1))
+    pd.testing.assert_frame_equal(df, df_seq)
+
+    # concurrent by default, paced by the rate limiter
+    threads.clear()
+    df_default = gn.get_data(DataRequest(source='glassnode', tickers=['btc', 'eth', 'sol'], fields=fields,
+                                         start_date='2023-01-01'))
+    assert len(threads) > 1, "Requests should run in a thread pool by default."
+    pd.testing.assert_frame_equal(df, df_default)
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# modules which must only be imported when the data sources or methods using them are
+heavy_modules = ["ccxt", "selenium", "webdriver_manager", "prophet", "statsmodels", "investpy", "polygon",
+                 "coinmetrics", "dbnomics", "pandas_datareader", "yfinance"]
+
+# import time budget in seconds, on top of pandas and requests
+budget = 0.5
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+
+def _import_time(stmt: str, n: int = 3) -> float:
+    """
+    Best of n import times of a statement, each in a fresh interpreter.
+    """
+    code = f"import time; t = time.perf_counter(); {stmt}; print(time.perf_counter() - t)"
+    return min(float(_run(code)) for _ in range(n))
+
+
+@pytest.mark.parametrize("stmt", [
+    "import cryptodatapy",
+    "from cryptodatapy.extract import GetData, DataRequest",
+    "from cryptodatapy.transform import ConvertParams, WrangleData",
+    "from cryptodatapy.transform.od import OutlierDetection",
+    "from cryptodatapy.util import DataCatalog, DataCredentials",
+])
+def test_no_heavy_imports(stmt) -> None:
+    """
+    Test that importing the package and its public names doesn't import vendor libraries.
+    """
+    loaded = _run(f"import sys; {stmt}; print(','.join(m for m in {heavy_modules} if m in sys.modules))").strip()
+    assert loaded == "", f"{stmt} imports {loaded}."
+
+
+def test_lazy_names() -> None:
+    """
+    Test that public names are resolved on first access.
+    """
+    import cryptodatapy
+    from cryptodatapy.extract.libraries import CCXT
+    from cryptodatapy.extract.libraries.ccxt_api import CCXT as CCXT_
+
+    assert CCXT is CCXT_
+    assert "GetData" in dir(cryptodatapy.extract)
+    assert cryptodatapy.extract.GetData.__name__ == "GetData"
+    with pytest.raises(AttributeError):
+        cryptodatapy.extract.Missing
+
+
+def test_dotted_access() -> None:
+    """
+    Test that subpackages, submodules and their names are reachable as attributes after importing the package.
+    """
+    code = ("import cryptodatapy; "
+            "print(cryptodatapy.extract.libraries.CCXT.__name__, cryptodatapy.extract.data_vendors.Glassnode.__name__, "
+            "cryptodatapy.extract.exchanges.dydx.Dydx.__name__, cryptodatapy.transform.od.OutlierDetection.__name__, "
+            "cryptodatapy.util.cache.make_key.__name__, cryptodatapy.extract.getdata.GetData.__name__)")
+
+    assert _run(code).split() == ["CCXT", "Glassnode", "Dydx", "OutlierDetection", "make_key", "GetData"]
+
+    import cryptodatapy.extract
+    assert "libraries" in dir(cryptodatapy.extract)
+    assert "libraries" not in cryptodatapy.extract.__all__, "Star imports shouldn't import every submodule."
+
+
+@pytest.mark.skipif(not os.environ.get('CRYPTODATAPY_BENCHMARKS'), reason="set CRYPTODATAPY_BENCHMARKS to run")
+def test_import_time_budget() -> None:
+    """
+    Test import time of the package and data request classes against the budget. Timings are machine dependent,
+    the test only runs when CRYPTODATAPY_BENCHMARKS is set.
+    """
+    baseline = _import_time("import pandas, requests")
+    elapsed = _import_time("import cryptodatapy; from cryptodatapy.extract import GetData, DataRequest")
+
+    assert elapsed - baseline < budget, f"Import took {elapsed - baseline:.2f}s over pandas and requests."
+
+
+if __name__ == "__main__":
+    pytest.main()
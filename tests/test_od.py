@@ -2,7 +2,9 @@ import pandas as pd
 import numpy as np
 import pytest
 
-from cryptodatapy.transform.od import OutlierDetection
+from cryptodatapy.transform.od import OnlineOutlierDetection, OutlierDetection
+from cryptodatapy.util.cache import DirectoryCache
+from tests.reference import mad_groupby, mad_rolling, od_frame
 
 
 @pytest.fixture
@@ -361,6 +363,21 @@ class TestOutlierDetection:
             & (self.od_excl_instance.outliers.describe().loc["min"] == -np.inf)
         ), "Inf values found in the dataframe."
 
+    @pytest.mark.parametrize("method", ["stl", "seasonal_decomp"])
+    def test_od_decompose_parallel(self, method) -> None:
+        """
+        Test decomposition fits spread over a process pool give the same results as fitting series one at a time.
+        """
+        self.od_instance.thresh_val = 10
+        getattr(self.od_instance, method)()
+
+        od_parallel = OutlierDetection(self.od_instance.raw_df, thresh_val=10, max_workers=2)
+        getattr(od_parallel, method)()
+
+        pd.testing.assert_frame_equal(od_parallel.yhat, self.od_instance.yhat)
+        pd.testing.assert_frame_equal(od_parallel.outliers, self.od_instance.outliers)
+        pd.testing.assert_frame_equal(od_parallel.filtered_df, self.od_instance.filtered_df)
+
     def test_od_prophet(self) -> None:
         """
         Test outlier detection seasonal decomposition method.
@@ -390,5 +407,107 @@ class TestOutlierDetection:
         ), "Inf values found in the dataframe."
 
 
+def test_od_prophet_cache(raw_oc_data, tmp_path) -> None:
+    """
+    Test Prophet forecasts are cached and only series whose data changed are refit.
+    """
+    cache = DirectoryCache(str(tmp_path), max_size=2 ** 30, ttls={})
+    df = raw_oc_data[['close']]
+
+    od = OutlierDetection(df)
+    od.prophet(cache=cache)
+    assert not od.fit_times.cached.any()
+    assert (od.fit_times.fit_time > 0).all()
+    assert len(cache) == 3
+
+    # unchanged
+    od_cached = OutlierDetection(df)
+    od_cached.prophet(cache=cache)
+    assert od_cached.fit_times.cached.all()
+    pd.testing.assert_series_equal(od_cached.fit_times.fit_time, od.fit_times.fit_time)
+    pd.testing.assert_frame_equal(od_cached.yhat, od.yhat)
+    pd.testing.assert_frame_equal(od_cached.outliers, od.outliers)
+
+    # new bar for one ticker
+    df_new = df.copy()
+    df_new.loc[(df.index[-1][0], 'BTC'), 'close'] *= 1.01
+    od_new = OutlierDetection(df_new)
+    od_new.prophet(cache=cache)
+    assert od_new.fit_times.cached.to_dict() == {('close', 'ADA'): True, ('close', 'BTC'): False,
+                                                 ('close', 'ETH'): True}
+
+
+@pytest.mark.parametrize("model_type", ["estimation", "prediction"])
+@pytest.mark.parametrize("method", ["atr", "iqr", "mad", "z_score", "ewma"])
+def test_od_mixed_calendars(raw_ohlcv_data, method, model_type) -> None:
+    """
+    Test tickers observed on weekdays only, like equities, are scored over their own observations when mixed with
+    tickers observed every day.
+    """
+    dates, tickers = raw_ohlcv_data.index.get_level_values(0), raw_ohlcv_data.index.get_level_values(1)
+    df = raw_ohlcv_data[(tickers != 'ETH') | (dates.dayofweek < 5)]
+    od = OutlierDetection(df, log=True, thresh_val=1.5, model_type=model_type)
+    getattr(od, method)()
+
+    for ticker, ticker_df in df.groupby(level=1):
+        od_ticker = OutlierDetection(ticker_df, log=True, thresh_val=1.5, model_type=model_type)
+        getattr(od_ticker, method)()
+        for attr in ['filtered_df', 'outliers', 'yhat']:
+            result = getattr(od, attr).xs(ticker, level=1, drop_level=False).astype(float)
+            pd.testing.assert_frame_equal(result, getattr(od_ticker, attr).astype(float), check_exact=False)
+    assert od.outliers.xs('ETH', level=1).notna().any().any(), "Weekday ticker should have outliers."
+
+
+@pytest.mark.parametrize("mixed", [False, True])
+def test_od_rolling(mixed) -> None:
+    """
+    Test rolling median and MAD on the unstacked array match per ticker windows, including tickers observed on
+    weekdays only mixed with tickers observed every day.
+    """
+    df = od_frame(1_000, 20, freq='D')
+    if mixed:
+        dates, tickers = df.index.get_level_values(0), df.index.get_level_values(1)
+        df = df[(dates.dayofweek < 5) | (tickers < 'T010')]
+
+    for expected, result in zip(mad_groupby(df, 7), mad_rolling(df, 7)):
+        pd.testing.assert_frame_equal(result, expected, check_exact=False)
+
+
+@pytest.mark.parametrize("mixed", [False, True])
+@pytest.mark.parametrize("method", ["z_score", "ewma", "mad"])
+def test_online_od(raw_ohlcv_data, tmp_path, method, mixed) -> None:
+    """
+    Test online outlier detection over updates, with the state saved between updates, matches the prediction model,
+    including a ticker observed on weekdays only and updates in which it has no bars.
+    """
+    dates, tickers = raw_ohlcv_data.index.get_level_values(0), raw_ohlcv_data.index.get_level_values(1)
+    df = raw_ohlcv_data[(tickers != 'ETH') | (dates.dayofweek < 5)] if mixed else raw_ohlcv_data
+    od = OutlierDetection(df, log=True, thresh_val=1.5, model_type='prediction')
+    getattr(od, method)()
+
+    dates = df.index.get_level_values(0)
+    cutoffs = dates.unique()[[-50, -49, -10]]
+    if mixed:
+        # weekend update, without bars of the weekday ticker
+        saturday = dates[dates.dayofweek == 5].unique()[-3]
+        cutoffs = cutoffs.append(pd.DatetimeIndex([saturday, saturday + pd.Timedelta(days=2)])).sort_values()
+    online = OnlineOutlierDetection(method, log=True, thresh_val=1.5)
+    filtered, outliers, yhat = [], [], []
+    for start, end in zip([dates.min()] + list(cutoffs), list(cutoffs) + [dates.max() + pd.Timedelta(days=1)]):
+        online.update(df[(dates >= start) & (dates < end)])
+        filtered.append(online.filtered_df)
+        outliers.append(online.outliers)
+        yhat.append(online.yhat)
+        online.save(tmp_path / "od.pkl")
+        online = OnlineOutlierDetection.load(tmp_path / "od.pkl")
+
+    # already scored bars
+    assert online.update(df).empty
+
+    for result, expected in zip([filtered, outliers, yhat], [od.filtered_df, od.outliers, od.yhat]):
+        pd.testing.assert_frame_equal(pd.concat(result).astype(float), expected.astype(float), check_exact=False)
+    assert od.outliers.notna().any().any()
+
+
 if __name__ == "__main__":
     pytest.main()
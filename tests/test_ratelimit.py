@@ -0,0 +1,143 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from cryptodatapy.util.datacredentials import DataCredentials
+from cryptodatapy.util.ratelimit import (FileTokenBucket, RateLimiter, TokenBucket, get_rate_limiter,
+                                         rate_limit_to_rate)
+
+
+def test_token_bucket_pacing() -> None:
+    """
+    Test that requests are spaced at the bucket rate once the burst is used.
+    """
+    limiter = RateLimiter(TokenBucket(rate=50, capacity=2))
+    start = time.monotonic()
+    waits = [limiter.acquire() for _ in range(7)]
+    elapsed = time.monotonic() - start
+
+    assert waits[0] == 0 and waits[1] == 0, "Burst should not wait."
+    assert elapsed >= 5 / 50 * 0.9, "Requests above the burst should be paced at the rate."
+
+
+def test_token_bucket_threads() -> None:
+    """
+    Test that threads sharing a bucket never exceed the rate.
+    """
+    limiter = RateLimiter(TokenBucket(rate=100))
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: limiter.acquire(), range(21)))
+
+    assert time.monotonic() - start >= 20 / 100 * 0.9
+
+
+def test_acquire_async() -> None:
+    """
+    Test that asyncio tasks sharing a limiter are paced without blocking the event loop.
+    """
+    limiter = RateLimiter(TokenBucket(rate=100))
+
+    async def main():
+        start = time.monotonic()
+        await asyncio.gather(*[limiter.acquire_async() for _ in range(11)])
+        return time.monotonic() - start
+
+    assert asyncio.run(main()) >= 10 / 100 * 0.9
+
+
+def test_file_token_bucket_shared(tmp_path) -> None:
+    """
+    Test that buckets using the same state file share the request budget.
+    """
+    path = str(tmp_path / 'bucket.json')
+    bucket1, bucket2 = FileTokenBucket(rate=10, path=path), FileTokenBucket(rate=10, path=path)
+
+    assert bucket1.reserve() == 0
+    assert bucket2.reserve() == pytest.approx(0.1, abs=0.02)
+    assert bucket1.reserve() == pytest.approx(0.2, abs=0.02)
+
+
+def test_invalid_rate() -> None:
+    """
+    Test invalid rate and capacity.
+    """
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=0.5)
+
+
+def test_rate_limit_to_rate() -> None:
+    """
+    Test conversion of data source rate limits to requests per second.
+    """
+    assert rate_limit_to_rate(None) is None
+    assert rate_limit_to_rate(50) == 20
+    assert rate_limit_to_rate({'requests_per_second': 10, 'requests_per_minute': 300}) == 5
+    assert rate_limit_to_rate({'requests_per_second': 2, 'requests_per_minute': 300}) == 2
+    assert rate_limit_to_rate({'requests_per_minute': 120}) == 2
+    assert rate_limit_to_rate({'binance': 50, 'okx': 100}) == 10
+    df = pd.DataFrame({'calls_made': [10, 100], 'calls_left': [40, 2900]}, index=['second', 'minute'])
+    assert rate_limit_to_rate(df) == 50
+    assert rate_limit_to_rate({'requests_per_minute': 600, 'requests_per_day': 1000}) == 10
+    assert rate_limit_to_rate({'requests_per_hour': 3600}) is None
+
+
+def test_rate_limit_to_rate_cryptocompare() -> None:
+    """
+    Test that hourly, daily and monthly quotas in a CryptoCompare rate limit table don't set the pace.
+    """
+    df = pd.DataFrame({'calls_made': [0, 0, 0, 0, 0], 'calls_left': [20, 300, 3000, 7500, 100000]},
+                      index=['second', 'minute', 'hour', 'day', 'month'])
+    assert rate_limit_to_rate(df) == 5
+
+
+def test_max_workers() -> None:
+    """
+    Test the number of threads is the larger of the burst size and the requests allowed over a request's latency.
+    """
+    assert RateLimiter(TokenBucket(5, capacity=10)).max_workers() == 10
+    assert RateLimiter(TokenBucket(5)).max_workers() == 5
+    assert RateLimiter(TokenBucket(0.5)).max_workers() == 1
+    assert RateLimiter(TokenBucket(1000)).max_workers(limit=8) == 8
+
+
+def test_get_rate_limiter() -> None:
+    """
+    Test that rate limiters are shared by key and default to data credentials rates.
+    """
+    limiter = get_rate_limiter('tiingo:test_key')
+    assert limiter is get_rate_limiter('tiingo:test_key')
+    assert limiter.rate == DataCredentials().rate_limits['tiingo']
+    assert get_rate_limiter('unknown:test_key').rate == DataCredentials().rate_limits['default']
+    assert get_rate_limiter('ccxt:test', rate_limit=100).rate == 10
+    with pytest.raises(ValueError):
+        get_rate_limiter('tiingo:other_key', backend='redis')
+
+
+def test_get_rate_limiter_explicit() -> None:
+    """
+    Test that defaults don't override a shared limiter's explicit rate and conflicting explicit rates keep the
+    stricter one.
+    """
+    df = pd.DataFrame({'calls_made': [0, 0], 'calls_left': [20, 300]}, index=['second', 'minute'])
+    limiter = get_rate_limiter('cryptocompare:explicit_key', rate_limit=df, capacity=4)
+    assert limiter.rate == 5 and limiter.bucket.capacity == 4
+    get_rate_limiter('cryptocompare:explicit_key')
+    assert limiter.rate == 5 and limiter.bucket.capacity == 4
+    get_rate_limiter('cryptocompare:explicit_key', rate=10, capacity=8)
+    assert limiter.rate == 5 and limiter.bucket.capacity == 4
+    get_rate_limiter('cryptocompare:explicit_key', rate=2, capacity=2)
+    assert limiter.rate == 2 and limiter.bucket.capacity == 2
+    # explicit settings replace defaults
+    limiter = get_rate_limiter('cryptocompare:default_key')
+    get_rate_limiter('cryptocompare:default_key', rate=100)
+    assert limiter.rate == 100
+
+
+if __name__ == "__main__":
+    pytest.main()
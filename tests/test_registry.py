@@ -0,0 +1,149 @@
+import time
+
+import pandas as pd
+import pytest
+
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.extract.getdata import GetData
+from cryptodatapy.util.registry import VendorRegistry, get_registry, set_registry
+
+
+class Vendor:
+    """
+    Data source with metadata loaded on first use.
+    """
+    n_instances = 0
+    n_loads = 0
+
+    def __init__(self, api_key=None):
+        Vendor.n_instances += 1
+        self.api_key = api_key
+        self.markets = None
+        self.client = None
+        self.data_req = None
+        self.data = pd.DataFrame()
+
+    def new_clients(self):
+        self.client = None
+
+    def get_markets_info(self, exch=None, quote_ccy=None):
+        if self.client is None:
+            Vendor.n_loads += 1
+            self.client = {"BTC/USDT": "USDT", "BTC/USD": "USD"}
+        if self.markets is None:
+            self.markets = [mkt for mkt, quote in self.client.items() if quote_ccy is None or quote == quote_ccy]
+        return self.markets
+
+    def get_data(self, data_req):
+        # converts the data request once, like CCXT
+        if self.data_req is None:
+            self.data_req = data_req
+        self.get_markets_info()
+        self.data = pd.concat([self.data, pd.DataFrame({"close": [1.0]}, index=self.data_req.tickers)])
+        return self.data
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    from cryptodatapy.extract import getdata
+    monkeypatch.setattr(getdata, "get_data_source", lambda source: Vendor)
+    Vendor.n_instances, Vendor.n_loads = 0, 0
+    yield set_registry(VendorRegistry(ttl=60))
+    set_registry()
+
+
+def test_get_series_reuses_vendor(registry) -> None:
+    """
+    Test data source objects and their metadata are reused by source, exchange and api key.
+    """
+    for ticker in ["btc", "eth", "sol"]:
+        df = GetData(DataRequest(source="aqr", tickers=[ticker])).get_series()
+        assert df.index.tolist() == [ticker], "Data requests and results should not be kept across requests."
+    assert Vendor.n_instances == 1 and Vendor.n_loads == 1
+
+    data_req = DataRequest(source="aqr", tickers=["btc"])
+    GetData(data_req, api_key="key").get_series()
+    GetData(DataRequest(source="aqr", tickers=["btc"], exch="kraken")).get_series()
+    assert Vendor.n_instances == 3 and len(registry) == 3
+
+
+def test_get_meta_fresh_metadata(registry) -> None:
+    """
+    Test metadata requests reuse clients but not filtered metadata.
+    """
+    data_req = DataRequest(source="aqr", tickers=["btc"])
+    assert GetData(data_req).get_meta(method="get_markets_info", quote_ccy="USD") == ["BTC/USD"]
+    assert GetData(data_req).get_meta(method="get_markets_info") == ["BTC/USDT", "BTC/USD"]
+    GetData(data_req).get_series()
+    assert GetData(data_req).get_meta(method="get_markets_info", quote_ccy="USDT") == ["BTC/USDT"]
+    assert Vendor.n_instances == 1
+
+
+def test_lease_concurrent(registry) -> None:
+    """
+    Test the shared object is leased to one caller at a time.
+    """
+    key = registry.make_key("vendor")
+    with registry.lease(key, Vendor) as ds1:
+        ds1.get_markets_info()
+        with registry.lease(key, Vendor) as ds2:
+            assert ds2 is not ds1, "Object in use should be copied."
+            assert ds2.client is None, "Copy should create its own client."
+            assert ds2.markets == ds1.markets, "Copy should share loaded metadata."
+    with registry.lease(key, Vendor) as ds3:
+        assert ds3 is ds1
+    assert Vendor.n_instances == 1
+
+
+def test_ttl_and_invalidate(registry) -> None:
+    """
+    Test objects are created again after expiring or being invalidated.
+    """
+    key = registry.make_key("vendor", "binance")
+    with registry.lease(key, Vendor) as ds1:
+        pass
+    assert registry.invalidate(source="vendor", exch="kraken") == 0
+    assert registry.invalidate(source="vendor") == 1
+    with registry.lease(key, Vendor) as ds2:
+        assert ds2 is not ds1
+
+    registry.ttl = 0.01
+    registry.clear()
+    with registry.lease(key, Vendor) as ds3:
+        pass
+    time.sleep(0.02)
+    with registry.lease(key, Vendor) as ds4:
+        assert ds4 is not ds3
+    assert Vendor.n_instances == 4
+
+
+def test_lease_ccxt_clients() -> None:
+    """
+    Test copies of a leased CCXT object get their own exchange instances, with the markets already loaded.
+    """
+    import ccxt
+    from cryptodatapy.extract.libraries.ccxt_api import CCXT
+
+    registry = VendorRegistry(ttl=60)
+    key = registry.make_key("ccxt", "binance")
+    with registry.lease(key, CCXT) as ds1:
+        ds1.exchange = ccxt.binance()
+        ds1.exchange.set_markets([{"id": "BTCUSDT", "symbol": "BTC/USDT", "base": "BTC", "quote": "USDT",
+                                   "type": "spot", "spot": True}])
+        ds1.exchange_async = object()
+        with registry.lease(key, CCXT) as ds2:
+            assert ds2.exchange is not ds1.exchange, "Exchange instances aren't thread-safe."
+            assert isinstance(ds2.exchange, ccxt.binance)
+            assert list(ds2.exchange.markets) == ["BTC/USDT"]
+            assert ds2.exchange_async is None
+
+
+def test_get_registry_is_shared() -> None:
+    """
+    Test the registry is shared by the process.
+    """
+    assert get_registry() is get_registry()
+
+
+if __name__ == "__main__":
+    pytest.main()
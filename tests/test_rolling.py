@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cryptodatapy.transform.rolling import (
+    rolling_mean,
+    rolling_median,
+    rolling_quantile,
+    rolling_quantiles,
+    rolling_std,
+)
+
+
+@pytest.fixture
+def values():
+    """
+    Time x series array with missing values, including a series starting late.
+    """
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(300, 6))
+    values[rng.random(values.shape) < 0.2] = np.nan
+    values[:50, 2] = np.nan
+
+    return values
+
+
+@pytest.mark.parametrize("window", [1, 2, 7, 8, 100])
+@pytest.mark.parametrize("center", [False, True])
+@pytest.mark.parametrize("min_periods", [None, 1])
+def test_rolling_quantile(values, window, center, min_periods) -> None:
+    """
+    Test rolling quantiles and medians match pandas rolling windows, for sorted and skiplist windows.
+    """
+    roll = pd.DataFrame(values).rolling(window, min_periods=min_periods, center=center)
+
+    for q in [0, 0.25, 0.5, 0.75, 1]:
+        np.testing.assert_allclose(rolling_quantile(values, window, q, center=center, min_periods=min_periods),
+                                   roll.quantile(q).to_numpy(), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(rolling_median(values, window, center=center, min_periods=min_periods),
+                               roll.median().to_numpy(), rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("window", [7, 100, 300])
+def test_rolling_quantiles(values, window) -> None:
+    """
+    Test multiple rolling quantiles in a single pass match pandas rolling windows, for sorted and skiplist windows.
+    """
+    qs = [0.25, 0.5, 0.75]
+    quantiles = rolling_quantiles(values, window, qs, center=True, min_periods=1)
+    roll = pd.DataFrame(values).rolling(window, min_periods=1, center=True)
+
+    assert quantiles.shape == (3,) + values.shape
+    for q, quantile in zip(qs, quantiles):
+        np.testing.assert_allclose(quantile, roll.quantile(q).to_numpy(), rtol=1e-12, atol=1e-12)
+    assert rolling_quantiles(values[:, 0], window, qs).shape == (3, 300)
+
+
+@pytest.mark.parametrize("center", [False, True])
+def test_rolling_mean_std(values, center) -> None:
+    """
+    Test rolling means and standard deviations match pandas rolling windows.
+    """
+    roll = pd.DataFrame(values).rolling(7, min_periods=1, center=center)
+
+    np.testing.assert_allclose(rolling_mean(values, 7, center=center, min_periods=1), roll.mean().to_numpy())
+    np.testing.assert_allclose(rolling_std(values, 7, center=center, min_periods=1), roll.std().to_numpy())
+
+
+def test_rolling_series(values) -> None:
+    """
+    Test a 1D series returns a 1D array.
+    """
+    med = rolling_median(values[:, 0], 7)
+
+    assert med.shape == (300,)
+    np.testing.assert_array_equal(med, rolling_median(values, 7)[:, 0])
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,85 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.util.session import HTTPSession, get_session, set_session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Keep-alive handler returning a small JSON payload.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({'path': self.path}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def session():
+    sess = set_session(HTTPSession(pool_connections=2, pool_maxsize=2, timeout=5))
+    yield sess
+    set_session()
+
+
+def test_connection_reuse(server_url, session) -> None:
+    """
+    Test that consecutive requests to the same host reuse the pooled connection.
+    """
+    for i in range(5):
+        resp = session.get(server_url + 'data', params={'page': i})
+        assert resp.status_code == 200
+
+    stats = session.host_stats(server_url)
+    assert stats['requests'] == 5
+    assert stats['connections'] == 1
+    assert stats['reused'] == 4
+
+
+def test_get_req_uses_shared_session(server_url, session) -> None:
+    """
+    Test that DataRequest.get_req goes through the process-wide session.
+    """
+    assert get_session() is session
+
+    resp = DataRequest().get_req(url=server_url + 'histo', params={'limit': 10})
+    assert resp == {'path': '/histo?limit=10'}
+    resp = DataRequest().get_req(url=server_url + 'histo', params={'limit': 20})
+    assert resp == {'path': '/histo?limit=20'}
+
+    assert session.host_stats(server_url)['reused'] == 1
+
+
+def test_close(server_url, session) -> None:
+    """
+    Test that closing the session resets the pools and counters.
+    """
+    session.get(server_url)
+    session.close()
+    assert session.stats() == {}
+    assert session.get(server_url).status_code == 200
+
+
+if __name__ == "__main__":
+    pytest.main()
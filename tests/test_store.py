@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from cryptodatapy.util.store import FeatherStore, ParquetStore
+
+
+@pytest.fixture
+def store():
+    store = ParquetStore("memory://test_store")
+    yield store
+    store.fs.rm(store.root, recursive=True)
+
+
+@pytest.fixture
+def df():
+    idx = pd.MultiIndex.from_product([pd.date_range("2023-12-30", periods=6, freq="D"), ["BTC", "ETH"]],
+                                     names=["date", "ticker"])
+    return pd.DataFrame({"close": np.arange(12, dtype=float), "volume": np.arange(12, dtype=float) * 10},
+                        index=idx)
+
+
+def test_write_read(store, df) -> None:
+    """
+    Test round trip of a tidy dataframe, partitioned by year.
+    """
+    store.write(df, "ccxt", "d", field_group="ohlcv")
+    out = store.read("ccxt", "d")
+
+    pd.testing.assert_frame_equal(out, df, check_freq=False)
+    periods = store.fs.ls(store._get_dir("ccxt", "d", "ohlcv"), detail=False)
+    assert sorted(p.split("=")[-1] for p in periods) == ["2023", "2024"]
+
+
+def test_predicate_pushdown(store, df) -> None:
+    """
+    Test reading a subset of dates, tickers and fields.
+    """
+    store.write(df, "ccxt", "d", field_group="ohlcv")
+    out = store.read("ccxt", "d", fields="close", tickers=["ETH"], start_date="2024-01-01", end_date="2024-01-02")
+
+    assert list(out.columns) == ["close"]
+    assert list(out.index.get_level_values("ticker").unique()) == ["ETH"]
+    assert list(out.index.get_level_values("date")) == list(pd.date_range("2024-01-01", "2024-01-02"))
+
+
+def test_upsert(store, df) -> None:
+    """
+    Test that new values win over stored ones and rows are not duplicated.
+    """
+    store.write(df, "ccxt", "d", field_group="ohlcv")
+    new = df.iloc[-4:] + 100
+    store.write(new, "ccxt", "d", field_group="ohlcv")
+    out = store.read("ccxt", "d")
+
+    assert len(out) == len(df)
+    pd.testing.assert_frame_equal(out.iloc[-4:], new, check_freq=False)
+    pd.testing.assert_frame_equal(out.iloc[:-4], df.iloc[:-4], check_freq=False)
+
+
+def test_field_groups(store, df) -> None:
+    """
+    Test that field groups are stored separately and joined on read.
+    """
+    store.write(df[["close"]], "glassnode", "1h", field_group="market")
+    store.write(df[["volume"]].rename(columns={"volume": "add_act"}), "glassnode", "1h", field_group="onchain")
+
+    assert store.get_field_groups("glassnode", "1h") == ["market", "onchain"]
+    out = store.read("glassnode", "1h")
+    assert list(out.columns) == ["close", "add_act"]
+    assert store.read("glassnode", "1h", fields=["add_act"]).shape == (12, 1)
+
+    store.delete("glassnode", "1h", "market")
+    assert store.get_field_groups("glassnode", "1h") == ["onchain"]
+    assert store.read("binance", "1h").empty
+
+
+def test_local_dir(tmp_path, df) -> None:
+    """
+    Test store in a local directory, with tz-aware dates.
+    """
+    df.index = df.index.set_levels(df.index.levels[0].tz_localize("UTC"), level=0)
+    store = ParquetStore(str(tmp_path))
+    store.write(df, "ccxt", "1h")
+    out = store.read("ccxt", "1h", start_date="2024-01-03")
+
+    pd.testing.assert_frame_equal(out, df.loc["2024-01-03":], check_freq=False)
+
+
+def test_feather_read_slice(tmp_path, df) -> None:
+    """
+    Test memory-mapped read of a (tickers, fields, date range) slice.
+    """
+    df.index = df.index.set_levels(["BTC/USDT", "ETH/USDT"], level=1)
+    store = FeatherStore(str(tmp_path))
+    store.write(df, "ccxt", "1min")
+    assert store.get_tickers("ccxt", "1min") == ["BTC/USDT", "ETH/USDT"]
+
+    allocated = pa.total_allocated_bytes()
+    out = store.read("ccxt", "1min", tickers=["ETH/USDT"], fields="close", start_date="2024-01-01",
+                     end_date="2024-01-02")
+    assert pa.total_allocated_bytes() == allocated, "Field values should not be copied from the memory map."
+
+    expected = df.loc[pd.IndexSlice["2024-01-01":"2024-01-02", "ETH/USDT"], ["close"]]
+    assert list(out.index) == list(expected.index)
+    assert out.close.tolist() == expected.close.tolist()
+    assert isinstance(out.close.dtype, pd.ArrowDtype)
+
+    arrays = store.read("ccxt", "1min", tickers="BTC/USDT", output="numpy")
+    np.testing.assert_array_equal(arrays["BTC/USDT"]["volume"], df.xs("BTC/USDT", level=1).volume.values)
+    assert not arrays["BTC/USDT"]["volume"].flags.owndata
+
+
+def test_feather_upsert(tmp_path, df) -> None:
+    """
+    Test that new values win over stored ones.
+    """
+    store = FeatherStore(str(tmp_path))
+    store.write(df, "ccxt", "d")
+    store.write(df.iloc[-2:] + 100, "ccxt", "d")
+    out = store.read("ccxt", "d", output="arrow")
+
+    assert out.num_rows == len(df)
+    assert out.column("close").to_pylist()[-1] == df.close.iloc[-1] + 100
+    with pytest.raises(ValueError):
+        store.read("ccxt", "d", output="list")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+
+from cryptodatapy.extract.datarequest import DataRequest
+from cryptodatapy.transform.wrangle import WrangleData
+from tests.reference import ccxt_concat, ccxt_from_records, ccxt_resp, convert_fields_to_lib_loop
+
+
+def test_convert_fields_to_lib(cm_onchain_resp) -> None:
+    """
+    Test vectorized field conversion to CryptoDataPy format matches the per-col loop.
+    """
+    data_req = DataRequest(source='coinmetrics', tickers=['btc'])
+    result = WrangleData(data_req, cm_onchain_resp.copy()).convert_fields_to_lib('coinmetrics').data_resp
+
+    pd.testing.assert_frame_equal(result, convert_fields_to_lib_loop(cm_onchain_resp.copy(), 'coinmetrics'))
+
+
+@pytest.mark.parametrize("data_type", ['ohlcv', 'funding_rates', 'open_interest'])
+def test_ccxt_assembly(data_type) -> None:
+    """
+    Test CCXT responses are assembled into the same tidy frame as with the per-ticker loop.
+    """
+    markets, resp = ccxt_resp(20)
+    data_req = DataRequest(source='ccxt', tickers=['btc'], freq='8h')
+    data_req.source_markets = markets[::-1]  # unsorted markets
+    data_resp = resp[data_type][::-1]
+    data_resp[3] = []  # ticker without data
+
+    wd = WrangleData(data_req, data_resp)
+    df = getattr(wd, f"ccxt_{data_type}")()
+    expected = ccxt_concat(data_req, data_resp, data_type)
+
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False, check_index_type=False)
+
+
+def test_ccxt_funding_rates() -> None:
+    """
+    Test columnar wrangling of funding rates matches wrangling from records.
+    """
+    markets, resp = ccxt_resp(20, n_obs=100)
+    data_req = DataRequest(source='ccxt', tickers=['btc'], freq='8h')
+    data_req.source_markets = markets
+
+    pd.testing.assert_frame_equal(WrangleData(data_req, resp['funding_rates']).ccxt_funding_rates(),
+                                  ccxt_from_records(data_req, resp['funding_rates']), check_dtype=False)
+
+
+if __name__ == "__main__":
+    pytest.main()